@@ -0,0 +1,16 @@
+"""Solver benchmark suite.
+
+Run ``python -m benchmarks.run --help`` from the repository root. The solvers live
+in ``sliding_puzzle/game``, which is put on ``sys.path`` here the same way
+``puzzle_4x4_solver.py`` does it.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SLIDING_PUZZLE_DIR = os.path.join(REPO_DIR, "sliding_puzzle")
+if SLIDING_PUZZLE_DIR not in sys.path:
+    sys.path.insert(0, SLIDING_PUZZLE_DIR)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Wall time of the parallel BFS (``solve_bfs(..., workers=n)``) against serial BFS.
+
+Example (from the repository root)::
+
+    python -m benchmarks.bfs_scaling --instance level-3x3-hard --workers 2,4,8
+
+Every run solves the same instance; the table lists seconds, nodes and the
+speedup over serial ``solve_bfs``, and the header records how many CPUs the
+machine has, since more workers than CPUs can only add overhead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable
+
+from .instances import INSTANCE_SETS, Instance, load_instance_set
+from game.puzzle_solver import solve_bfs
+
+
+def find_instance(name: str) -> Instance:
+    for set_name in INSTANCE_SETS:
+        for instance in load_instance_set(set_name):
+            if instance.name == name:
+                return instance
+    raise KeyError(f"Unknown instance '{name}'")
+
+
+def time_runs(instance: Instance, worker_counts: list[int], repeat: int = 1) -> list[tuple[str, float, int, int]]:
+    """``(label, best seconds, nodes, moves)`` for serial BFS and each worker count."""
+
+    runs: list[tuple[str, Callable[[], dict]]] = [("serial", lambda: solve_bfs(instance.board, instance.goal))]
+    for workers in worker_counts:
+        runs.append(
+            (f"workers={workers}", lambda workers=workers: solve_bfs(instance.board, instance.goal, workers=workers))
+        )
+
+    rows = []
+    for label, run in runs:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = run()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        rows.append((label, best, result["nodes_explored"], result["moves"]))
+    return rows
+
+
+def render(instance: Instance, rows: list[tuple[str, float, int, int]]) -> str:
+    serial = rows[0][1]
+    lines = [
+        f"{instance.name} ({instance.size}), {os.cpu_count()} CPU(s)",
+        f"{'run':<12} {'seconds':>9} {'nodes':>10} {'moves':>6} {'speedup':>8}",
+    ]
+    for label, seconds, nodes, moves in rows:
+        lines.append(f"{label:<12} {seconds:>9.3f} {nodes:>10,} {moves:>6} {serial / seconds:>7.2f}x")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Parallel BFS scaling benchmark")
+    parser.add_argument("--instance", default="level-3x3-hard", help="Instance name from any benchmark set.")
+    parser.add_argument("--workers", default="2,4", help="Comma-separated worker counts (each above 1).")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per row; the best time is reported.")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    worker_counts = [int(value) for value in args.workers.split(",")]
+    if any(workers < 2 for workers in worker_counts):
+        parser.error("worker counts must be at least 2 (serial BFS is always measured)")
+
+    instance = find_instance(args.instance)
+    print(render(instance, time_runs(instance, worker_counts, max(1, args.repeat))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
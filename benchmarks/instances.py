@@ -0,0 +1,148 @@
+"""Fixed instance sets for the benchmark suite.
+
+* ``levels``: every preset in ``utils.constants.LEVELS``.
+* ``walks``: seeded random-walk boards at several depths, 3x3 and 4x4.
+* ``standard``: 100 fixed 4x4 boards read from ``data/standard_4x4_100.txt``.
+
+Instances carry their optimal solution length as ``depth`` when it is known: it
+is stored in the standard file, computed with IDA* for the walks and left as
+``None`` for the levels (most of them are too big to solve optimally). Within a
+set, instances of one board size are listed by depth; after a timeout the runner
+only skips instances at least as deep as the one that timed out.
+Regenerate the standard file with ``python -m benchmarks.instances`` (about a
+minute and a half: every board is solved with IDA*).
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from . import REPO_DIR  # noqa: F401  (puts sliding_puzzle on sys.path)
+from game.puzzle_solver import solve_idastar
+from utils.boards import grid_label, make_goal, random_walk_board
+from utils.constants import LEVELS
+
+Board = list[list[int]]
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+STANDARD_4x4_FILE = os.path.join(DATA_DIR, "standard_4x4_100.txt")
+
+WALK_DEPTHS: tuple[int, ...] = (10, 20, 30)
+WALKS_PER_DEPTH = 5
+WALK_SEED = 16
+
+STANDARD_COUNT = 100
+STANDARD_WALK = 40
+STANDARD_SEED = 2024
+
+
+@dataclass(frozen=True)
+class Instance:
+    name: str
+    board: Board
+    goal: Board
+    depth: int | None = None
+
+    @property
+    def size(self) -> str:
+        return f"{len(self.board)}x{len(self.board[0])}"
+
+
+def level_instances() -> list[Instance]:
+    return [
+        Instance(f"level-{grid_label(grid_size)}-{difficulty}", level["board"], level["goal"])
+        for grid_size, presets in LEVELS.items()
+        for difficulty, level in presets.items()
+    ]
+
+
+@lru_cache(maxsize=None)
+def _optimal_depth(board: tuple[tuple[int, ...], ...], goal: tuple[tuple[int, ...], ...]) -> int:
+    return solve_idastar([list(row) for row in board], [list(row) for row in goal], heuristic="linear-conflict")["moves"]
+
+
+def optimal_depth(board: Board, goal: Board) -> int:
+    """Optimal solution length (IDA*, cached per board)."""
+
+    return _optimal_depth(tuple(map(tuple, board)), tuple(map(tuple, goal)))
+
+
+def walk_instances() -> list[Instance]:
+    rng = random.Random(WALK_SEED)
+    instances = []
+    for size in (3, 4):
+        goal = make_goal(size, size)
+        by_size = []
+        for walk in WALK_DEPTHS:
+            for index in range(WALKS_PER_DEPTH):
+                board = random_walk_board(goal, walk, rng)
+                name = f"walk-{size}x{size}-d{walk}-{index}"
+                by_size.append(Instance(name, board, goal, optimal_depth(board, goal)))
+        instances.extend(sorted(by_size, key=lambda instance: instance.depth))
+    return instances
+
+
+def generate_standard_boards() -> list[Board]:
+    rng = random.Random(STANDARD_SEED)
+    goal = make_goal(4, 4)
+    return [random_walk_board(goal, STANDARD_WALK, rng) for _ in range(STANDARD_COUNT)]
+
+
+def load_board_file(path: str) -> list[tuple[Board, int | None]]:
+    """``(board, depth)`` pairs: one 4x4 board per line, 16 numbers, optionally
+    followed by its optimal solution length; ``#`` comments and blank lines are skipped."""
+
+    boards = []
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            values = [int(v) for v in line.split()]
+            values, depth = (values[:16], values[16]) if len(values) == 17 else (values, None)
+            if sorted(values) != list(range(16)):
+                raise ValueError(f"{path}:{line_number}: expected the numbers 0-15, got {values}")
+            boards.append(([values[i : i + 4] for i in range(0, 16, 4)], depth))
+    return boards
+
+
+def standard_instances() -> list[Instance]:
+    """The standard boards, listed by depth (names keep their line number)."""
+
+    goal = make_goal(4, 4)
+    instances = [
+        Instance(f"std-4x4-{index:03d}", board, goal, depth)
+        for index, (board, depth) in enumerate(load_board_file(STANDARD_4x4_FILE))
+    ]
+    return sorted(instances, key=lambda instance: (instance.depth is None, instance.depth or 0))
+
+
+INSTANCE_SETS: dict[str, Callable[[], list[Instance]]] = {
+    "levels": level_instances,
+    "walks": walk_instances,
+    "standard": standard_instances,
+}
+
+
+def load_instance_set(name: str) -> list[Instance]:
+    if name not in INSTANCE_SETS:
+        raise KeyError(f"Unknown instance set '{name}' (known: {', '.join(INSTANCE_SETS)})")
+    return INSTANCE_SETS[name]()
+
+
+def main() -> None:
+    print(f"# {STANDARD_COUNT} 4x4 boards: {STANDARD_WALK}-move random walks from the goal, seed {STANDARD_SEED}.")
+    print("# 16 tiles, then the optimal solution length.")
+    print("# Generated by `python -m benchmarks.instances`; do not edit by hand.")
+    goal = make_goal(4, 4)
+    for board in generate_standard_boards():
+        values = [value for row in board for value in row] + [optimal_depth(board, goal)]
+        print(" ".join(str(value) for value in values))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""Run every solver in ``game.puzzle_solver`` over the benchmark instance sets.
+
+Examples (from the repository root):
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --sets levels,walks --baseline baseline.json
+
+Each solver/instance pair is timed with ``time.perf_counter`` under a per-run
+budget (enforced through the solvers' ``monitor`` hook), then solved once more
+under ``tracemalloc`` for its peak memory; tracing slows Python down several
+times, so the two are never measured in the same run, and the traced run gets
+``TRACE_SLOWDOWN`` times the budget (its peak is ``null`` if it runs out). Results are JSON. With
+``--baseline`` they are compared against an earlier run, regressions are listed
+and the exit status is 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+
+from .instances import INSTANCE_SETS, Instance, load_instance_set
+from game import puzzle_solver
+from game.packed_board import UnsupportedBoardError
+from game.search_monitor import SearchCancelled, SearchMonitor
+
+DEFAULT_BUDGET_S = 5.0
+# tracemalloc makes a solver run up to about 8x slower.
+TRACE_SLOWDOWN = 10
+DEFAULT_THRESHOLD = 0.25
+# Differences below these are noise, whatever the ratio.
+MIN_TIME_DELTA_MS = 5.0
+MIN_MEMORY_DELTA_KIB = 64.0
+
+SOLVED = "solved"
+TIMEOUT = "timeout"
+SKIPPED = "skipped"
+FAILED = "failed"
+# The solver rejects the board with UnsupportedBoardError (e.g. the 3x3 distance table on 4x4).
+UNSUPPORTED = "unsupported"
+
+
+def discover_solvers() -> dict[str, Callable]:
+    """Every ``solve_*`` function in ``game.puzzle_solver``, in definition order."""
+
+    return {
+        name[len("solve_") :]: func
+        for name, func in vars(puzzle_solver).items()
+        if name.startswith("solve_") and callable(func)
+    }
+
+
+class BudgetMonitor(SearchMonitor):
+    """Cancels the search from inside ``report`` once ``budget_s`` has elapsed."""
+
+    __slots__ = ("budget_s",)
+
+    def __init__(self, budget_s: float):
+        super().__init__()
+        self.budget_s = budget_s
+
+    def report(self, nodes_explored: int) -> None:
+        if self.elapsed > self.budget_s:
+            self.cancel()
+        super().report(nodes_explored)
+
+
+@dataclass
+class Measurement:
+    set: str
+    instance: str
+    size: str
+    solver: str
+    status: str
+    moves: int | None = None
+    nodes_explored: int = 0
+    wall_ms: float = 0.0
+    nodes_per_sec: float = 0.0
+    peak_kib: float | None = None
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return (self.set, self.instance, self.solver)
+
+
+def measure(
+    set_name: str,
+    instance: Instance,
+    solver_name: str,
+    solver: Callable,
+    *,
+    budget_s: float = DEFAULT_BUDGET_S,
+    memory: bool = True,
+) -> Measurement:
+    measurement = Measurement(set_name, instance.name, instance.size, solver_name, FAILED)
+
+    gc.collect()
+    monitor = BudgetMonitor(budget_s)
+    start = time.perf_counter()
+    try:
+        result = solver(instance.board, instance.goal, monitor=monitor)
+    except SearchCancelled:
+        result = None
+        measurement.status = TIMEOUT
+    except UnsupportedBoardError:
+        result = None
+        measurement.status = UNSUPPORTED
+    elapsed = time.perf_counter() - start
+
+    measurement.wall_ms = elapsed * 1000
+    if result is not None:
+        measurement.status = SOLVED
+        measurement.moves = result["moves"]
+        measurement.nodes_explored = result["nodes_explored"]
+    else:
+        measurement.nodes_explored = monitor.nodes_explored
+    if elapsed > 0:
+        measurement.nodes_per_sec = measurement.nodes_explored / elapsed
+
+    if memory and measurement.status == SOLVED:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            solver(instance.board, instance.goal, monitor=BudgetMonitor(budget_s * TRACE_SLOWDOWN))
+            measurement.peak_kib = tracemalloc.get_traced_memory()[1] / 1024
+        except SearchCancelled:
+            pass
+        finally:
+            tracemalloc.stop()
+
+    return measurement
+
+
+def run_suite(
+    set_names: Iterable[str],
+    solver_names: Iterable[str],
+    *,
+    budget_s: float = DEFAULT_BUDGET_S,
+    memory: bool = True,
+    progress: Callable[[Measurement], None] | None = None,
+) -> list[Measurement]:
+    """Measure every solver on every instance of the named sets.
+
+    Once a solver times out on an instance of known ``depth``, it is skipped for
+    the instances of the same set and board size that are at least as deep, so
+    hopeless pairings such as BFS on the standard 4x4 set cost one budget instead
+    of a hundred. Instances of unknown depth are never skipped for a timeout. A
+    solver that rejects a board size is skipped for the rest of that size. Skipped
+    pairs are still listed, with status ``skipped``.
+    """
+
+    solvers = discover_solvers()
+    solver_names = list(solver_names)
+    for name in solver_names:
+        if name not in solvers:
+            raise KeyError(f"Unknown solver '{name}' (known: {', '.join(solvers)})")
+
+    measurements: list[Measurement] = []
+    # Shallowest depth each (set, size, solver) group has timed out at.
+    timed_out: dict[tuple[str, str, str], int] = {}
+    unsupported: set[tuple[str, str, str]] = set()
+
+    for set_name in set_names:
+        for instance in load_instance_set(set_name):
+            for solver_name in solver_names:
+                group = (set_name, instance.size, solver_name)
+                if group in unsupported or (
+                    instance.depth is not None and group in timed_out and instance.depth >= timed_out[group]
+                ):
+                    measurement = Measurement(set_name, instance.name, instance.size, solver_name, SKIPPED)
+                else:
+                    measurement = measure(
+                        set_name, instance, solver_name, solvers[solver_name], budget_s=budget_s, memory=memory
+                    )
+                    if measurement.status == UNSUPPORTED:
+                        unsupported.add(group)
+                    elif measurement.status == TIMEOUT and instance.depth is not None:
+                        timed_out[group] = min(instance.depth, timed_out.get(group, instance.depth))
+
+                measurements.append(measurement)
+                if progress is not None:
+                    progress(measurement)
+
+    return measurements
+
+
+def summarize(measurements: Iterable[Measurement]) -> dict[str, dict[str, dict[str, float]]]:
+    """Per set and solver: instances solved, timeouts, total time/nodes, max peak memory."""
+
+    summary: dict[str, dict[str, dict[str, float]]] = {}
+    for m in measurements:
+        entry = summary.setdefault(m.set, {}).setdefault(
+            m.solver,
+            {"solved": 0, "timeouts": 0, "skipped": 0, "total_ms": 0.0, "total_nodes": 0, "max_peak_kib": 0.0},
+        )
+        if m.status == SOLVED:
+            entry["solved"] += 1
+            entry["total_ms"] += m.wall_ms
+            entry["total_nodes"] += m.nodes_explored
+            entry["max_peak_kib"] = max(entry["max_peak_kib"], m.peak_kib or 0.0)
+        elif m.status == TIMEOUT:
+            entry["timeouts"] += 1
+        elif m.status == SKIPPED:
+            entry["skipped"] += 1
+
+    for by_solver in summary.values():
+        for entry in by_solver.values():
+            seconds = entry["total_ms"] / 1000
+            entry["nodes_per_sec"] = entry["total_nodes"] / seconds if seconds > 0 else 0.0
+    return summary
+
+
+def build_report(measurements: list[Measurement], *, budget_s: float, memory: bool) -> dict[str, object]:
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "budget_s": budget_s,
+            "memory": memory,
+        },
+        "results": [asdict(m) for m in measurements],
+        "summary": summarize(measurements),
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    key: tuple[str, str, str]
+    metric: str
+    baseline: object
+    current: object
+
+    def describe(self) -> str:
+        set_name, instance, solver = self.key
+        return f"{set_name}/{instance} {solver}: {self.metric} {self.baseline} -> {self.current}"
+
+
+def compare(
+    current: dict[str, object],
+    baseline: dict[str, object],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Regressions of ``current`` against ``baseline`` (both ``build_report`` dicts).
+
+    Flagged: a pair the baseline solved that no longer is, a longer solution, and
+    nodes, time or peak memory above ``baseline * (1 + threshold)``. Time and memory
+    also have to move by more than a small absolute amount, so fast instances do
+    not flap. Pairs missing from either side are ignored.
+    """
+
+    def index(report: dict[str, object]) -> dict[tuple[str, str, str], dict[str, object]]:
+        return {(r["set"], r["instance"], r["solver"]): r for r in report["results"]}
+
+    before = index(baseline)
+    regressions: list[Regression] = []
+    limit = 1 + threshold
+
+    for key, now in index(current).items():
+        old = before.get(key)
+        if old is None or old["status"] != SOLVED:
+            continue
+        if now["status"] != SOLVED:
+            regressions.append(Regression(key, "status", old["status"], now["status"]))
+            continue
+
+        if now["moves"] > old["moves"]:
+            regressions.append(Regression(key, "moves", old["moves"], now["moves"]))
+        if now["nodes_explored"] > old["nodes_explored"] * limit:
+            regressions.append(Regression(key, "nodes_explored", old["nodes_explored"], now["nodes_explored"]))
+        if now["wall_ms"] > old["wall_ms"] * limit and now["wall_ms"] - old["wall_ms"] > MIN_TIME_DELTA_MS:
+            regressions.append(Regression(key, "wall_ms", round(old["wall_ms"], 1), round(now["wall_ms"], 1)))
+        old_peak, new_peak = old.get("peak_kib"), now.get("peak_kib")
+        if (
+            old_peak is not None
+            and new_peak is not None
+            and new_peak > old_peak * limit
+            and new_peak - old_peak > MIN_MEMORY_DELTA_KIB
+        ):
+            regressions.append(Regression(key, "peak_kib", round(old_peak, 1), round(new_peak, 1)))
+
+    return regressions
+
+
+def render_progress_line(m: Measurement) -> str:
+    if m.status == SOLVED:
+        peak = "" if m.peak_kib is None else f"  peak {m.peak_kib:,.0f} KiB"
+        return (
+            f"{m.set:<9} {m.instance:<22} {m.solver:<18} {m.moves:>4} moves  "
+            f"{m.wall_ms:>10.1f} ms  {m.nodes_explored:>10,} nodes  {m.nodes_per_sec:>10,.0f}/s{peak}"
+        )
+    return f"{m.set:<9} {m.instance:<22} {m.solver:<18} {m.status}"
+
+
+def render_summary(summary: dict[str, dict[str, dict[str, float]]]) -> str:
+    lines = [
+        f"{'set':<9} {'solver':<18} {'solved':>7} {'timeout':>8} {'skipped':>8} "
+        f"{'total ms':>11} {'nodes/s':>11} {'peak KiB':>10}"
+    ]
+    for set_name, by_solver in summary.items():
+        for solver, e in by_solver.items():
+            lines.append(
+                f"{set_name:<9} {solver:<18} {e['solved']:>7} {e['timeouts']:>8} {e['skipped']:>8} "
+                f"{e['total_ms']:>11.1f} {e['nodes_per_sec']:>11,.0f} {e['max_peak_kib']:>10,.0f}"
+            )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    solvers = list(discover_solvers())
+    parser = argparse.ArgumentParser(description="Sliding puzzle solver benchmarks")
+    parser.add_argument(
+        "--sets",
+        default=",".join(INSTANCE_SETS),
+        help=f"Comma-separated instance sets (default: all of {', '.join(INSTANCE_SETS)}).",
+    )
+    parser.add_argument(
+        "--solvers",
+        default=",".join(solvers),
+        help=f"Comma-separated solvers (default: all of {', '.join(solvers)}).",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=DEFAULT_BUDGET_S,
+        help="Seconds per solver run before it counts as a timeout.",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory runs.")
+    parser.add_argument("--output", default=None, help="Write the JSON report here (default: stdout).")
+    parser.add_argument("--baseline", default=None, help="Compare against this earlier JSON report.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative increase in nodes/time/memory reported as a regression (default: 0.25).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    memory = not args.no_memory
+
+    def progress(m: Measurement) -> None:
+        print(render_progress_line(m), file=sys.stderr, flush=True)
+
+    measurements = run_suite(
+        args.sets.split(","),
+        args.solvers.split(","),
+        budget_s=args.budget,
+        memory=memory,
+        progress=progress,
+    )
+    report = build_report(measurements, budget_s=args.budget, memory=memory)
+    print("\n" + render_summary(report["summary"]), file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            regressions = compare(report, json.load(handle), threshold=args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression.describe()}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions against {args.baseline}.", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
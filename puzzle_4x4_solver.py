@@ -3,7 +3,7 @@
 
 This script prints output in 3 parts:
 1) Initial & Goal state (ASCII table with box-drawing chars)
-2) Algorithm steps (BFS, DFS, A*) showing first 5 + last 5 steps
+2) Algorithm steps (BFS, DFS, A*, IDA*, Reduction) showing first 5 + last 5 steps
 3) Clean comparison table + winners
 
 Usage (Colab / local):
@@ -12,6 +12,11 @@ Usage (Colab / local):
 Optional arguments:
     !python puzzle_4x4_solver.py --difficulty hard --shuffle-moves 12 --seed 123
 
+Batch mode (solves many boards across worker processes; IDA* and Reduction by
+default, since BFS and A* keep every visited board in memory):
+    !python puzzle_4x4_solver.py --batch 200 --workers 8 --seed 1
+    !python puzzle_4x4_solver.py --batch-file boards.txt --workers 8 --algorithms astar,idastar
+
 Notes:
 - Pure Python (no pygame).
 - Uses the existing solver implementations in sliding_puzzle/game.
@@ -24,6 +29,8 @@ import os
 import random
 import sys
 import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 
 
@@ -34,6 +41,9 @@ if SLIDING_PUZZLE_DIR not in sys.path:
 
 from game.puzzle_state import PuzzleState  # noqa: E402
 from game import puzzle_solver  # noqa: E402
+from game.solution_path import SolutionPath, encode_actions  # noqa: E402
+from game.transposition import DEFAULT_TT_BYTES, TranspositionTable  # noqa: E402
+from utils.solvability import is_solvable  # noqa: E402
 
 
 Board = list[list[int]]
@@ -111,7 +121,7 @@ def generate_solvable_puzzle_4x4(shuffle_moves: int, rng: random.Random) -> Boar
     while True:
         state = PuzzleState(GOAL_4x4)
         last_move: str | None = None
-        seen = {state.get_board_tuple()}
+        seen = {state.key}
         completed = True
 
         for _ in range(shuffle_moves):
@@ -122,7 +132,7 @@ def generate_solvable_puzzle_4x4(shuffle_moves: int, rng: random.Random) -> Boar
                     s for s in possible if s.action is None or s.action != OPPOSITE_MOVE[last_move]
                 ]
 
-            non_repeating = [s for s in possible if s.get_board_tuple() not in seen]
+            non_repeating = [s for s in possible if s.key not in seen]
             if non_repeating:
                 possible = non_repeating
 
@@ -132,7 +142,7 @@ def generate_solvable_puzzle_4x4(shuffle_moves: int, rng: random.Random) -> Boar
 
             state = rng.choice(possible)
             last_move = state.action
-            seen.add(state.get_board_tuple())
+            seen.add(state.key)
 
         if completed and state.board != GOAL_4x4:
             return copy_board(state.board)
@@ -146,9 +156,7 @@ class AlgoResult:
     nodes_explored: int
 
 
-def _format_result_without_time(
-    solution_path: list[PuzzleState], nodes_explored: int
-) -> dict[str, object]:
+def _format_result_without_time(solution_path: SolutionPath, nodes_explored: int) -> dict[str, object]:
     moves = len(solution_path) - 1
     return {
         "path": solution_path,
@@ -158,46 +166,66 @@ def _format_result_without_time(
         "solution_path": solution_path,
         "steps": moves,
         "time_taken": 0.0,
+        "status": puzzle_solver.SOLVED,
+        "initial_board": solution_path.initial_board,
+        "move_sequence": solution_path.moves,
     }
 
 
-def solve_iddfs(initial_board: Board, goal_board: Board, max_depth: int) -> dict[str, object] | None:
+def solve_iddfs(
+    initial_board: Board,
+    goal_board: Board,
+    max_depth: int,
+    *,
+    tt_bytes: int = DEFAULT_TT_BYTES,
+) -> dict[str, object] | None:
+    """Iterative deepening DFS sharing one bounded transposition table across depths.
+
+    A board whose subtree failed with ``remaining`` moves left is stored with the
+    lower bound ``remaining + 1``; it is skipped whenever it is reached again from
+    the same parent with no more depth left than that, in this iteration or a
+    later one. The search only refuses to move the blank straight back, so that
+    is the single move a stored bound excludes (see ``game.transposition``).
+    """
+
     initial_state = PuzzleState(initial_board)
+    layout = initial_state.layout
+    goal_key = layout.pack(goal_board)[0]
 
-    if initial_state.is_goal(goal_board):
-        return _format_result_without_time([initial_state], 1)
+    if initial_state.key == goal_key:
+        return _format_result_without_time(SolutionPath(initial_board), 1)
+
+    if not is_solvable(initial_board, goal_board):
+        return puzzle_solver.format_unsolvable(time.perf_counter())
 
     nodes_explored = 0
+    actions: list[str] = []
+    table = TranspositionTable(layout, tt_bytes)
 
-    def dfs_limited(
-        state: PuzzleState, remaining_depth: int, path_set: set[tuple[tuple[int, ...], ...]]
-    ) -> PuzzleState | None:
+    def dfs_limited(key: int, blank: int, remaining_depth: int, previous_blank: int) -> bool:
         nonlocal nodes_explored
         nodes_explored += 1
 
-        if state.is_goal(goal_board):
-            return state
-        if remaining_depth == 0:
-            return None
+        if key == goal_key:
+            return True
+        if remaining_depth == 0 or table.bound(key, previous_blank) > remaining_depth:
+            return False
 
-        for next_state in state.get_possible_moves():
-            t = next_state.get_board_tuple()
-            if t in path_set:
+        for target, action in layout.neighbors[blank]:
+            if target == previous_blank:
                 continue
 
-            path_set.add(t)
-            found = dfs_limited(next_state, remaining_depth - 1, path_set)
-            if found is not None:
-                return found
-            path_set.remove(t)
+            actions.append(action)
+            if dfs_limited(layout.apply_move(key, blank, target), target, remaining_depth - 1, blank):
+                return True
+            actions.pop()
 
-        return None
+        table.store(key, limit - remaining_depth, remaining_depth + 1, previous_blank)
+        return False
 
     for limit in range(max_depth + 1):
-        path_set = {initial_state.get_board_tuple()}
-        found_goal_state = dfs_limited(initial_state, limit, path_set)
-        if found_goal_state is not None:
-            solution_path = puzzle_solver.build_solution_path(found_goal_state)
+        if dfs_limited(initial_state.key, initial_state.blank, limit, -1):
+            solution_path = SolutionPath(initial_board, encode_actions(actions))
             return _format_result_without_time(solution_path, nodes_explored)
 
     return None
@@ -217,38 +245,68 @@ def run_solver_timed(func, *args, **kwargs) -> dict[str, object] | None:
     return out
 
 
-def solve_all_algorithms(
-    initial_board: Board, goal_board: Board, *, max_depth_for_dfs: int
-) -> dict[str, dict[str, object]]:
-    bfs = run_solver_timed(puzzle_solver.solve_bfs, initial_board, goal_board)
-    dfs = run_solver_timed(solve_iddfs, initial_board, goal_board, max_depth_for_dfs)
-    astar = run_solver_timed(puzzle_solver.solve_astar, initial_board, goal_board)
+# Name shown in the tables -> solver(initial, goal, max_depth_for_dfs, heuristic).
+ALGORITHMS: dict[str, Callable[[Board, Board, int, str], dict[str, object] | None]] = {
+    "BFS": lambda initial, goal, max_depth, heuristic: puzzle_solver.solve_bfs(initial, goal),
+    "DFS": lambda initial, goal, max_depth, heuristic: solve_iddfs(initial, goal, max_depth),
+    "A*": lambda initial, goal, max_depth, heuristic: puzzle_solver.solve_astar(initial, goal, heuristic=heuristic),
+    "IDA*": lambda initial, goal, max_depth, heuristic: puzzle_solver.solve_idastar(initial, goal, heuristic=heuristic),
+    "Reduction": lambda initial, goal, max_depth, heuristic: puzzle_solver.solve_reduction(initial, goal),
+}
+# Not optimal, so it is left out of the move-count check.
+NON_OPTIMAL_ALGORITHMS = frozenset({"Reduction"})
+# Batch mode runs many boards at once, so by default it skips BFS and A* (their
+# visited sets grow with the board's depth) and IDDFS (exponential time).
+BATCH_ALGORITHMS: tuple[str, ...] = ("IDA*", "Reduction")
 
-    if bfs is None or dfs is None or astar is None:
-        raise RuntimeError(
-            "One of the solvers returned no solution (puzzle too hard / depth limit too low)."
-        )
 
-    bfs_moves = int(bfs["moves"])
-    dfs_moves = int(dfs["moves"])
-    astar_moves = int(astar["moves"])
+def parse_algorithms(text: str) -> tuple[str, ...]:
+    """``"astar,IDA*,reduction"`` -> ``("A*", "IDA*", "Reduction")`` (``*`` may be spelled ``star``)."""
 
-    if not (bfs_moves == dfs_moves == astar_moves):
+    by_alias = {name.lower().replace("*", "star"): name for name in ALGORITHMS}
+    names: list[str] = []
+    for part in text.split(","):
+        alias = part.strip().lower().replace("*", "star")
+        if alias not in by_alias:
+            raise ValueError(f"Unknown algorithm '{part.strip()}' (known: {', '.join(sorted(by_alias))})")
+        if by_alias[alias] not in names:
+            names.append(by_alias[alias])
+    return tuple(names)
+
+
+def solve_all_algorithms(
+    initial_board: Board,
+    goal_board: Board,
+    *,
+    max_depth_for_dfs: int,
+    heuristic: str = "manhattan",
+    algorithms: Sequence[str] = tuple(ALGORITHMS),
+) -> dict[str, dict[str, object]]:
+    solver_results: dict[str, dict[str, object]] = {}
+    for algo in algorithms:
+        result = run_solver_timed(ALGORITHMS[algo], initial_board, goal_board, max_depth_for_dfs, heuristic)
+        if result is None:
+            raise RuntimeError(
+                f"{algo} returned no solution (puzzle too hard / depth limit too low)."
+            )
+        solver_results[algo] = result
+
+    optimal_moves = {
+        algo: int(result["moves"])
+        for algo, result in solver_results.items()
+        if algo not in NON_OPTIMAL_ALGORITHMS
+    }
+    if len(set(optimal_moves.values())) > 1:
         raise RuntimeError(
             "Move counts differ (expected all optimal). "
-            f"BFS={bfs_moves} DFS={dfs_moves} A*={astar_moves}."
+            + " ".join(f"{algo}={moves}" for algo, moves in optimal_moves.items())
+            + "."
         )
 
-    return {"BFS": bfs, "DFS": dfs, "A*": astar}
+    return solver_results
 
 
 def build_algo_results(solver_results: dict[str, dict[str, object]]) -> list[AlgoResult]:
-    ordered = [
-        ("BFS", solver_results["BFS"]),
-        ("DFS", solver_results["DFS"]),
-        ("A*", solver_results["A*"]),
-    ]
-
     return [
         AlgoResult(
             algo,
@@ -256,11 +314,10 @@ def build_algo_results(solver_results: dict[str, dict[str, object]]) -> list[Alg
             float(res["time_ms"]),
             int(res["nodes_explored"]),
         )
-        for algo, res in ordered
+        for algo, res in solver_results.items()
     ]
 
-
-def render_algorithm_steps(algorithm: str, solution_path: list[PuzzleState]) -> str:
+def render_algorithm_steps(algorithm: str, solution_path: Sequence[PuzzleState]) -> str:
     total_moves = len(solution_path) - 1
     if total_moves < 0:
         total_moves = 0
@@ -268,32 +325,35 @@ def render_algorithm_steps(algorithm: str, solution_path: list[PuzzleState]) ->
     lines: list[str] = [f"{algorithm} Algorithm:"]
 
     if total_moves == 0:
+        first_board = board_list_repr(next(iter(solution_path)).board)
         lines.append("[First 5 Steps]")
-        lines.append(f"Step 0: {board_list_repr(solution_path[0].board)} → SOLVED! ✓")
+        lines.append(f"Step 0: {first_board} → SOLVED! ✓")
         lines.append("[Last 5 Steps]")
-        lines.append(f"Step 0: {board_list_repr(solution_path[0].board)} → SOLVED! ✓")
+        lines.append(f"Step 0: {first_board} → SOLVED! ✓")
         return "\n".join(lines)
 
     first_end = min(5, total_moves)
-    lines.append("[First 5 Steps]")
-    for i in range(1, first_end + 1):
-        step_state = solution_path[i]
+    last_start = max(1, total_moves - 4)
+
+    # One pass over the path: a SolutionPath replays its states while iterating,
+    # so indexing each shown step would replay the moves again every time.
+    shown: dict[int, str] = {}
+    for i, step_state in enumerate(solution_path):
+        if i == 0 or (first_end < i < last_start):
+            continue
         desc = ACTION_TO_DESCRIPTION.get(step_state.action or "", "")
         if i == total_moves:
             desc = "SOLVED! ✓"
-        lines.append(f"Step {i}: {board_list_repr(step_state.board)} → {desc}")
+        shown[i] = f"Step {i}: {board_list_repr(step_state.board)} → {desc}"
+
+    lines.append("[First 5 Steps]")
+    lines.extend(shown[i] for i in range(1, first_end + 1))
 
     if total_moves > 10:
         lines.append(f"... [{total_moves - 10} more steps] ...")
 
-    last_start = max(1, total_moves - 4)
     lines.append("[Last 5 Steps]")
-    for i in range(last_start, total_moves + 1):
-        step_state = solution_path[i]
-        desc = ACTION_TO_DESCRIPTION.get(step_state.action or "", "")
-        if i == total_moves:
-            desc = "SOLVED! ✓"
-        lines.append(f"Step {i}: {board_list_repr(step_state.board)} → {desc}")
+    lines.extend(shown[i] for i in range(last_start, total_moves + 1))
 
     return "\n".join(lines)
 
@@ -342,6 +402,165 @@ def print_winners(results: list[AlgoResult]) -> None:
     )
 
 
+@dataclass(frozen=True)
+class BatchItem:
+    index: int
+    board: Board
+    results: list[AlgoResult]
+    error: str | None = None
+
+
+def load_boards(path: str) -> list[Board]:
+    """Read one 4x4 board per line: 16 numbers separated by spaces or commas.
+
+    Blank lines and lines starting with ``#`` are skipped.
+    """
+
+    boards: list[Board] = []
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            values = [int(v) for v in line.replace(",", " ").replace("[", " ").replace("]", " ").split()]
+            if sorted(values) != list(range(16)):
+                raise ValueError(f"{path}:{line_number}: expected the numbers 0-15, got {values}")
+            boards.append([values[i : i + 4] for i in range(0, 16, 4)])
+    return boards
+
+
+def generate_batch(count: int, shuffle_moves: int, rng: random.Random) -> list[Board]:
+    return [generate_solvable_puzzle_4x4(shuffle_moves=shuffle_moves, rng=rng) for _ in range(count)]
+
+
+def solve_batch_item(
+    index: int,
+    board: Board,
+    max_depth_for_dfs: int,
+    heuristic: str,
+    algorithms: Sequence[str] = BATCH_ALGORITHMS,
+) -> BatchItem:
+    """Worker entry point: solve one board with each of ``algorithms``.
+
+    Only the per-algorithm metrics travel back to the parent process; a failure
+    (unsolvable board, depth limit too low, a solver running out of memory or
+    raising) is reported on the item instead of aborting the whole batch.
+    """
+
+    if not is_solvable(board, GOAL_4x4):
+        return BatchItem(index, board, [], "unsolvable")
+
+    try:
+        solver_results = solve_all_algorithms(
+            board, GOAL_4x4, max_depth_for_dfs=max_depth_for_dfs, heuristic=heuristic, algorithms=algorithms
+        )
+    except Exception as exc:
+        return BatchItem(index, board, [], f"{type(exc).__name__}: {exc}")
+    return BatchItem(index, board, build_algo_results(solver_results))
+
+
+def run_batch(
+    boards: list[Board],
+    *,
+    workers: int,
+    max_depth_for_dfs: int,
+    heuristic: str = "manhattan",
+    algorithms: Sequence[str] = BATCH_ALGORITHMS,
+) -> Iterator[BatchItem]:
+    """Yield a ``BatchItem`` per board in completion order.
+
+    ``workers <= 1`` solves in this process; otherwise boards are fanned out over a
+    ``ProcessPoolExecutor`` and results stream back as soon as each one finishes.
+    """
+
+    if workers <= 1:
+        for index, board in enumerate(boards):
+            yield solve_batch_item(index, board, max_depth_for_dfs, heuristic, algorithms)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(solve_batch_item, index, board, max_depth_for_dfs, heuristic, algorithms)
+            for index, board in enumerate(boards)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile, ``q`` in [0, 100]."""
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def render_batch_line(item: BatchItem, done: int, total: int) -> str:
+    prefix = f"[{done}/{total}] #{item.index}"
+    if item.error is not None:
+        return f"{prefix} {board_list_repr(item.board)} → FAILED: {item.error}"
+    timings = "  ".join(f"{r.algorithm} {r.time_ms:.1f} ms" for r in item.results)
+    return f"{prefix} {board_list_repr(item.board)} → {item.results[0].moves} moves  {timings}"
+
+
+def render_batch_summary(items: list[BatchItem], elapsed: float, workers: int) -> str:
+    solved = [item for item in items if item.error is None]
+    throughput = len(items) / elapsed if elapsed > 0 else 0.0
+
+    lines = [
+        f"Solved {len(solved)}/{len(items)} puzzles in {elapsed:.2f} s "
+        f"with {workers} worker(s): {throughput:.2f} puzzles/sec"
+    ]
+    if not solved:
+        return "\n".join(lines)
+
+    headers = ["Algoritma", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Max (ms)", "Mean nodes"]
+    rows: list[list[str]] = []
+    for position, algorithm in enumerate(r.algorithm for r in solved[0].results):
+        times = [item.results[position].time_ms for item in solved]
+        nodes = [item.results[position].nodes_explored for item in solved]
+        rows.append(
+            [algorithm]
+            + [f"{percentile(times, q):.1f}" for q in (50, 90, 99)]
+            + [f"{max(times):.1f}", f"{sum(nodes) / len(nodes):.0f}"]
+        )
+
+    widths = [max(len(headers[i]), max(len(row[i]) for row in rows)) for i in range(len(headers))]
+    lines.append("  ".join(h.ljust(widths[i]) if i == 0 else h.rjust(widths[i]) for i, h in enumerate(headers)))
+    for row in rows:
+        lines.append("  ".join(v.ljust(widths[i]) if i == 0 else v.rjust(widths[i]) for i, v in enumerate(row)))
+    return "\n".join(lines)
+
+
+def main_batch(
+    boards: list[Board],
+    *,
+    workers: int,
+    max_depth_for_dfs: int,
+    heuristic: str,
+    algorithms: Sequence[str] = BATCH_ALGORITHMS,
+    write: Callable[[str], None] = print,
+) -> list[BatchItem]:
+    start = time.perf_counter()
+    items: list[BatchItem] = []
+
+    batch = run_batch(
+        boards, workers=workers, max_depth_for_dfs=max_depth_for_dfs, heuristic=heuristic, algorithms=algorithms
+    )
+    for item in batch:
+        items.append(item)
+        write(render_batch_line(item, len(items), len(boards)))
+
+    elapsed = time.perf_counter() - start
+    write("")
+    write(render_batch_summary(items, elapsed, workers))
+    return items
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Puzzle 4x4 Solver (Headless, Colab-friendly)")
 
@@ -358,12 +577,55 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         help="Override the number of shuffle moves (kept low so BFS is feasible).",
     )
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility.")
+    parser.add_argument(
+        "--heuristic",
+        choices=sorted(puzzle_solver.HEURISTICS.keys()),
+        default="manhattan",
+        help="Heuristic used by A* and IDA* (pdb-* need tables built with game.pattern_database).",
+    )
+
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument("--batch", type=int, default=None, help="Solve N generated boards instead of one.")
+    batch.add_argument(
+        "--batch-file",
+        default=None,
+        help="Solve the boards in this file (one board per line, 16 numbers).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for batch mode (default: all cores, 1 = in-process).",
+    )
+    parser.add_argument(
+        "--algorithms",
+        default=None,
+        help=(
+            "Comma-separated algorithms to run: bfs, dfs, astar, idastar, reduction "
+            f"(default: all for one board, {','.join(BATCH_ALGORITHMS)} in batch mode)."
+        ),
+    )
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=None,
+        help="Depth limit for IDDFS (default: twice the shuffle moves, at least 20).",
+    )
 
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(sys.argv[1:] if argv is None else argv)
+    batch_mode = args.batch is not None or args.batch_file is not None
+
+    if args.algorithms is not None:
+        try:
+            algorithms = parse_algorithms(args.algorithms)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from None
+    else:
+        algorithms = BATCH_ALGORITHMS if batch_mode else tuple(ALGORITHMS)
 
     shuffle_moves = (
         int(args.shuffle_moves)
@@ -374,6 +636,21 @@ def main(argv: list[str] | None = None) -> int:
         raise SystemExit("shuffle_moves must be >= 1")
 
     rng = random.Random(args.seed)
+    max_depth = args.max_depth if args.max_depth is not None else max(shuffle_moves * 2, 20)
+
+    if batch_mode:
+        if args.batch_file is not None:
+            boards = load_boards(args.batch_file)
+        else:
+            boards = generate_batch(args.batch, shuffle_moves, rng)
+        items = main_batch(
+            boards,
+            workers=max(1, args.workers),
+            max_depth_for_dfs=max_depth,
+            heuristic=args.heuristic,
+            algorithms=algorithms,
+        )
+        return 0 if all(item.error is None for item in items) else 1
 
     initial_board = generate_solvable_puzzle_4x4(shuffle_moves=shuffle_moves, rng=rng)
 
@@ -385,11 +662,19 @@ def main(argv: list[str] | None = None) -> int:
     print(render_board_ascii_table(GOAL_4x4))
     print()
 
-    max_depth = max(shuffle_moves * 2, 20)
-    solver_results = solve_all_algorithms(initial_board, GOAL_4x4, max_depth_for_dfs=max_depth)
+    print(f"Heuristic (A*, IDA*): {args.heuristic}")
+    print()
+
+    solver_results = solve_all_algorithms(
+        initial_board,
+        GOAL_4x4,
+        max_depth_for_dfs=max_depth,
+        heuristic=args.heuristic,
+        algorithms=algorithms,
+    )
 
-    for algo in ("BFS", "DFS", "A*"):
-        solution_path = solver_results[algo]["solution_path"]
+    for algo, result in solver_results.items():
+        solution_path = result["solution_path"]
         print(render_algorithm_steps(algo, solution_path))
         print()
 
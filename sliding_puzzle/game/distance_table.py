@@ -0,0 +1,194 @@
+"""Complete distance table for the 3x3 puzzle.
+
+Only 181,440 arrangements of a 3x3 board can reach a given goal, few enough to
+store the exact distance of every one. The table has one byte per permutation of
+the nine cells, indexed by ``rank_positions`` of the flattened board (a perfect
+hash onto ``0 .. 9! - 1``); the unreachable half stays ``UNSEEN``. It is filled by
+one retrograde BFS from the goal, on first use, and written under
+``data/tables`` so later runs read 362,880 bytes instead of searching again.
+
+Build it ahead of time (from the ``sliding_puzzle`` directory)::
+
+    python -m game.distance_table
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+from math import factorial
+
+from .packed_board import UnsupportedBoardError, get_layout, layout_for
+from .pattern_database import UNSEEN
+from .permutation_rank import rank_positions
+
+Board = list[list[int]]
+
+SIDE = 3
+CELLS = SIDE * SIDE
+TABLE_SIZE = factorial(CELLS)
+
+GOAL_3x3: Board = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+DEFAULT_TABLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "tables")
+
+
+def check_board(board: Board) -> None:
+    """Raise ``UnsupportedBoardError`` unless ``board`` is 3x3."""
+
+    if len(board) != SIDE or any(len(row) != SIDE for row in board):
+        raise UnsupportedBoardError(f"The distance table only covers {SIDE}x{SIDE} boards")
+
+
+def _flatten(board: Board) -> list[int]:
+    check_board(board)
+    return [value for row in board for value in row]
+
+
+def table_file_name(goal_board: Board) -> str:
+    return "distance_3x3_" + "".join(str(value) for value in _flatten(goal_board)) + ".bin"
+
+
+def build_distance_table(goal_board: Board, *, progress=None) -> bytearray:
+    """Retrograde BFS from the goal; entry ``rank_positions(board)`` is its distance."""
+
+    goal = _flatten(goal_board)
+    layout = get_layout(SIDE, SIDE)
+    neighbors = [[target for target, _ in layout.neighbors[pos]] for pos in range(CELLS)]
+
+    table = bytearray(b"\xff") * TABLE_SIZE
+    table[rank_positions(goal, CELLS)] = 0
+    layer = [(goal, goal.index(0))]
+    depth = 0
+
+    while layer:
+        next_layer = []
+        for state, blank in layer:
+            for target in neighbors[blank]:
+                child = state[:]
+                child[blank], child[target] = child[target], 0
+                index = rank_positions(child, CELLS)
+                if table[index] == UNSEEN:
+                    table[index] = depth + 1
+                    next_layer.append((child, target))
+
+        layer = next_layer
+        depth += 1
+        if progress is not None:
+            progress(depth, len(layer))
+
+    return table
+
+
+class DistanceTable:
+    """Exact distances to one 3x3 goal, with the downhill walk that solves a board."""
+
+    def __init__(self, goal_board: Board, table: bytes | bytearray):
+        if len(table) != TABLE_SIZE:
+            raise ValueError(f"A 3x3 distance table has {TABLE_SIZE} entries, got {len(table)}")
+        self.goal = _flatten(goal_board)
+        self.table = table
+        self.layout = get_layout(SIDE, SIDE)
+
+    def distance(self, board: Board) -> int:
+        """Optimal number of moves from ``board`` to the goal; ``ValueError`` if unreachable."""
+
+        distance = self.table[rank_positions(_flatten(board), CELLS)]
+        if distance == UNSEEN:
+            raise ValueError("Board cannot reach the goal (wrong permutation parity)")
+        return distance
+
+    def solve(self, board: Board) -> tuple[list[str], int]:
+        """``(actions, lookups)``: an optimal path found by always stepping to a
+        neighbour one move closer, and the table reads it took (at most four per move)."""
+
+        flat = _flatten(board)
+        table = self.table
+        neighbors = self.layout.neighbors
+        blank = flat.index(0)
+        distance = self.distance(board)
+        actions = []
+        lookups = 1
+
+        while distance:
+            for target, action in neighbors[blank]:
+                flat[blank], flat[target] = flat[target], 0
+                lookups += 1
+                if table[rank_positions(flat, CELLS)] == distance - 1:
+                    actions.append(action)
+                    blank = target
+                    distance -= 1
+                    break
+                flat[target], flat[blank] = flat[blank], 0
+
+        return actions, lookups
+
+
+@lru_cache(maxsize=None)
+def _load_cached(goal: tuple[int, ...], directory: str) -> DistanceTable:
+    goal_board = [list(goal[i : i + SIDE]) for i in range(0, CELLS, SIDE)]
+    path = os.path.join(directory, table_file_name(goal_board))
+
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) == TABLE_SIZE:
+            return DistanceTable(goal_board, data)
+
+    table = build_distance_table(goal_board)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(table)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # A read-only checkout just rebuilds the table in each process.
+    return DistanceTable(goal_board, table)
+
+
+def load_distance_table(goal_board: Board, directory: str | None = None) -> DistanceTable:
+    """The table for ``goal_board``: cached per process, read from disk, or built
+    (about a second) and saved on first use."""
+
+    goal = tuple(_flatten(goal_board))
+    return _load_cached(goal, os.path.abspath(directory or DEFAULT_TABLE_DIR))
+
+
+class DistanceTableHeuristic:
+    """Exact 3x3 distance as a heuristic: A* and IDA* then expand only the optimal path."""
+
+    name = "distance-table"
+
+    def __init__(self, goal_board: Board):
+        self.layout = layout_for(goal_board)
+        self.distances = load_distance_table(goal_board)
+
+    def _lookup(self, key: int) -> int:
+        tile_at = self.layout.tile_at
+        return self.distances.table[rank_positions([tile_at(key, pos) for pos in range(CELLS)], CELLS)]
+
+    def evaluate(self, key: int) -> int:
+        return self._lookup(key)
+
+    def update(self, h: int, key: int, tile: int, from_pos: int, to_pos: int) -> int:
+        return self._lookup(self.layout.apply_move(key, to_pos, from_pos))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the complete 3x3 distance table for the standard goal")
+    parser.add_argument("--directory", default=DEFAULT_TABLE_DIR, help="Where to write the table file.")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    table = load_distance_table(GOAL_3x3, args.directory)
+    reachable = [value for value in table.table if value != UNSEEN]
+    path = os.path.join(args.directory, table_file_name(GOAL_3x3))
+    print(f"{path}: {len(reachable)} reachable states, maximum distance {max(reachable)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
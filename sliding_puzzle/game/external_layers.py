@@ -0,0 +1,144 @@
+"""BFS layers of packed board keys kept as sorted files on disk.
+
+``solve_bfs(..., spill_dir=...)`` builds each layer with a ``LayerWriter``: keys
+are buffered in a set and, once ``spill_keys`` of them are buffered, written out
+as a sorted run file. ``finish`` merges the runs (an external merge that holds one
+chunk per run in memory), drops duplicates and keys of the layer before, and
+leaves a ``SortedLayer``: one sorted, duplicate-free file that is streamed in
+chunks and answers membership by binary search on disk.
+
+Keys are stored as 8-byte ``array('Q')`` items, so only layouts whose keys fit in
+64 bits (up to 4x4 and 3x5) can spill.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+from array import array
+from collections.abc import Iterable, Iterator
+
+DEFAULT_SPILL_KEYS = 1 << 20
+CHUNK_KEYS = 1 << 14
+
+_KEY_BYTES = array("Q").itemsize
+
+
+def _read_chunks(path: str) -> Iterator[array]:
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(CHUNK_KEYS * _KEY_BYTES)
+            if not data:
+                return
+            chunk = array("Q")
+            chunk.frombytes(data)
+            yield chunk
+
+
+def _iter_keys(path: str) -> Iterator[int]:
+    for chunk in _read_chunks(path):
+        yield from chunk
+
+
+class SortedLayer:
+    """A finished layer: ``count`` sorted, distinct keys in the file at ``path``."""
+
+    __slots__ = ("path", "count")
+
+    def __init__(self, path: str, count: int):
+        self.path = path
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[int]:
+        return _iter_keys(self.path)
+
+    def __contains__(self, key: int) -> bool:
+        lo, hi = 0, self.count
+        with open(self.path, "rb") as f:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                f.seek(mid * _KEY_BYTES)
+                value = array("Q", f.read(_KEY_BYTES))[0]
+                if value < key:
+                    lo = mid + 1
+                elif value > key:
+                    hi = mid
+                else:
+                    return True
+        return False
+
+
+class LayerWriter:
+    """Collects the keys of one layer in ``directory`` as ``<name>.layer``."""
+
+    def __init__(self, directory: str, name: str, spill_keys: int = DEFAULT_SPILL_KEYS):
+        if spill_keys < 1:
+            raise ValueError("spill_keys must be positive")
+        self.path = os.path.join(directory, f"{name}.layer")
+        self.spill_keys = spill_keys
+        self.runs: list[str] = []
+        self._buffer: set[int] = set()
+
+    def add(self, key: int) -> None:
+        buffer = self._buffer
+        buffer.add(key)
+        if len(buffer) >= self.spill_keys:
+            self._spill()
+
+    def _spill(self) -> None:
+        path = f"{self.path}.run{len(self.runs)}"
+        with open(path, "wb") as f:
+            array("Q", sorted(self._buffer)).tofile(f)
+        self.runs.append(path)
+        self._buffer.clear()
+
+    def finish(self, exclude: Iterable[int] | None = None) -> SortedLayer:
+        """Merge everything added into a ``SortedLayer``, without keys in ``exclude``
+        (sorted, e.g. the previous layer). Run files are removed."""
+
+        if self.runs:
+            if self._buffer:
+                self._spill()
+            keys = heapq.merge(*(_iter_keys(path) for path in self.runs))
+        else:
+            keys = iter(sorted(self._buffer))
+            self._buffer = set()
+
+        excluded = iter(exclude if exclude is not None else ())
+        next_excluded = next(excluded, None)
+        previous = None
+        count = 0
+        chunk = array("Q")
+        with open(self.path, "wb") as f:
+            for key in keys:
+                if key == previous:
+                    continue
+                previous = key
+                while next_excluded is not None and next_excluded < key:
+                    next_excluded = next(excluded, None)
+                if key == next_excluded:
+                    continue
+                chunk.append(key)
+                if len(chunk) >= CHUNK_KEYS:
+                    chunk.tofile(f)
+                    count += len(chunk)
+                    chunk = array("Q")
+            chunk.tofile(f)
+            count += len(chunk)
+
+        for path in self.runs:
+            os.remove(path)
+        self.runs = []
+        return SortedLayer(self.path, count)
+
+
+def write_layer(directory: str, name: str, keys: Iterable[int]) -> SortedLayer:
+    """A ``SortedLayer`` holding ``keys`` (small layers, such as the start)."""
+
+    writer = LayerWriter(directory, name)
+    for key in keys:
+        writer.add(key)
+    return writer.finish()
@@ -0,0 +1,92 @@
+"""Open lists for best-first search keyed on small integer f-costs."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Any
+
+
+class HeapFrontier:
+    """Binary heap ordered by f, FIFO among equal f (insertion counter)."""
+
+    __slots__ = ("_heap", "_tie")
+
+    def __init__(self):
+        self._heap: list[tuple[int, int, Any]] = []
+        self._tie = itertools.count()
+
+    def push(self, f: int, g: int, item: Any) -> None:
+        heapq.heappush(self._heap, (f, next(self._tie), item))
+
+    def pop(self) -> Any:
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class BucketFrontier:
+    """Array of buckets indexed by f, then by g; O(1) push and amortised O(1) pop.
+
+    Among entries with the lowest f, the deepest g is popped first and entries of
+    the same (f, g) come out LIFO. Deeper nodes are closer to the goal for the same
+    f, and the order no longer depends on object ids, so runs are reproducible.
+    ``_min_f`` only moves forward while buckets are empty; a push below it (possible
+    with an inconsistent heuristic) pulls it back.
+    """
+
+    __slots__ = ("_buckets", "_min_f", "_size")
+
+    def __init__(self):
+        # _buckets[f][g] -> list of items
+        self._buckets: list[list[list[Any]]] = []
+        self._min_f = 0
+        self._size = 0
+
+    def push(self, f: int, g: int, item: Any) -> None:
+        buckets = self._buckets
+        while len(buckets) <= f:
+            buckets.append([])
+        by_g = buckets[f]
+        while len(by_g) <= g:
+            by_g.append([])
+        by_g[g].append(item)
+
+        if f < self._min_f:
+            self._min_f = f
+        self._size += 1
+
+    def pop(self) -> Any:
+        if not self._size:
+            raise IndexError("pop from an empty frontier")
+
+        buckets = self._buckets
+        f = self._min_f
+        while not buckets[f]:
+            f += 1
+        self._min_f = f
+
+        by_g = buckets[f]
+        bucket = by_g[-1]
+        item = bucket.pop()
+        # Trim exhausted g lists so by_g[-1] is always the deepest non-empty one.
+        while by_g and not by_g[-1]:
+            by_g.pop()
+        self._size -= 1
+        return item
+
+    def __len__(self) -> int:
+        return self._size
+
+
+FRONTIERS = {
+    "heap": HeapFrontier,
+    "bucket": BucketFrontier,
+}
+
+
+def make_frontier(frontier: str):
+    if frontier not in FRONTIERS:
+        raise KeyError(f"Unknown frontier '{frontier}' (known: {', '.join(FRONTIERS)})")
+    return FRONTIERS[frontier]()
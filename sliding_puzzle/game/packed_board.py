@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+Board = list[list[int]]
+
+# (row delta, col delta, action) for moving the blank.
+DIRECTIONS: tuple[tuple[int, int, str], ...] = (
+    (-1, 0, "UP"),
+    (1, 0, "DOWN"),
+    (0, -1, "LEFT"),
+    (0, 1, "RIGHT"),
+)
+
+OPPOSITE: dict[str, str] = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
+
+
+class UnsupportedBoardError(ValueError):
+    """A solver or heuristic does not handle this board shape or goal layout."""
+
+
+class BoardLayout:
+    """Packed integer encoding for boards of one shape.
+
+    Cells are stored row-major in a single int, ``cell_bits`` bits per cell, with
+    cell 0 in the lowest bits. 3x3 and 4x4 boards use 4 bits per cell (36 and 64
+    bits). Applying a move is a shift-and-mask on the key, so search code never has
+    to allocate or hash nested lists.
+    """
+
+    __slots__ = ("rows", "cols", "size", "cell_bits", "cell_mask", "neighbors", "targets")
+
+    def __init__(self, rows: int, cols: int):
+        if rows < 1 or cols < 1:
+            raise ValueError(f"Invalid board shape {rows}x{cols}")
+
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.cell_bits = max(4, (self.size - 1).bit_length())
+        self.cell_mask = (1 << self.cell_bits) - 1
+
+        # neighbors[blank] -> ((target, action), ...) in DIRECTIONS order.
+        neighbors = []
+        for pos in range(self.size):
+            row, col = divmod(pos, cols)
+            reachable = []
+            for dr, dc, action in DIRECTIONS:
+                nr, nc = row + dr, col + dc
+                if 0 <= nr < rows and 0 <= nc < cols:
+                    reachable.append((nr * cols + nc, action))
+            neighbors.append(tuple(reachable))
+        self.neighbors: tuple[tuple[tuple[int, str], ...], ...] = tuple(neighbors)
+        # targets[blank][action] -> target, for replaying and undoing moves.
+        self.targets: tuple[dict[str, int], ...] = tuple(
+            {action: target for target, action in reachable} for reachable in neighbors
+        )
+
+    def pack(self, board: Board) -> tuple[int, int]:
+        """Return ``(key, blank_index)`` for a list-of-lists board (blank is -1 if absent)."""
+
+        if len(board) != self.rows or any(len(row) != self.cols for row in board):
+            raise ValueError(f"Board does not match layout {self.rows}x{self.cols}")
+
+        key = 0
+        blank = -1
+        shift = 0
+        bits = self.cell_bits
+        for row in board:
+            for value in row:
+                if value == 0:
+                    blank = shift // bits
+                key |= value << shift
+                shift += bits
+        return key, blank
+
+    def unpack(self, key: int) -> Board:
+        bits = self.cell_bits
+        mask = self.cell_mask
+        cols = self.cols
+        return [
+            [(key >> ((i * cols + j) * bits)) & mask for j in range(cols)]
+            for i in range(self.rows)
+        ]
+
+    def to_tuple(self, key: int) -> tuple[tuple[int, ...], ...]:
+        return tuple(tuple(row) for row in self.unpack(key))
+
+    def tile_at(self, key: int, pos: int) -> int:
+        return (key >> (pos * self.cell_bits)) & self.cell_mask
+
+    def find_blank(self, key: int) -> int:
+        for pos in range(self.size):
+            if (key >> (pos * self.cell_bits)) & self.cell_mask == 0:
+                return pos
+        return -1
+
+    def apply_move(self, key: int, blank: int, target: int) -> int:
+        """Slide the tile at ``target`` into ``blank`` and return the new key."""
+
+        bits = self.cell_bits
+        tile = (key >> (target * bits)) & self.cell_mask
+        return key - (tile << (target * bits)) + (tile << (blank * bits))
+
+
+@lru_cache(maxsize=None)
+def get_layout(rows: int, cols: int) -> BoardLayout:
+    return BoardLayout(rows, cols)
+
+
+def layout_for(board: Board) -> BoardLayout:
+    return get_layout(len(board), len(board[0]))
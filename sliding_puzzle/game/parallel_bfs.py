@@ -0,0 +1,343 @@
+"""Level-synchronous BFS layers expanded by a pool of processes.
+
+``solve_bfs(..., workers=n)`` keeps every layer as a ``SortedKeys``: sorted
+packed board keys (``array('Q')``) with the blank cell of each alongside
+(``array('B')``). To expand a layer it is copied once into ``SharedMemory``
+blocks, and pool workers are sent only block names and index ranges, so no keys
+are pickled. Each layer takes two rounds:
+
+1. ``expand_chunk``: a worker expands a slice of the layer and writes its
+   children, sorted, into its own region of the run blocks (four slots per
+   parent).
+2. ``merge_range``: the key space is cut at quantiles of the layer, and a worker
+   takes one range. It merges that range of every run with ``heapq.merge``,
+   drops duplicates, and drops keys of the previous and current layers with a
+   linear merge against their slices.
+
+The ranges come back in key order, so the parent only concatenates them. Keys
+are 8-byte items, so only layouts whose keys fit in 64 bits (up to 4x4 and 3x5)
+are supported.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .packed_board import BoardLayout, UnsupportedBoardError, get_layout
+
+# Layers smaller than this are expanded in the calling process.
+MIN_PARALLEL_LAYER = 4096
+CHUNKS_PER_WORKER = 4
+
+_KEY_BYTES = array("Q").itemsize
+_MAX_CHILDREN = 4
+
+
+def _blank_bits(layout: BoardLayout) -> int:
+    return max(1, (layout.size - 1).bit_length())
+
+
+def _read(name: str, typecode: str, start: int, stop: int) -> array:
+    """Copy items ``start:stop`` of a shared block into a new array."""
+
+    values = array(typecode)
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        values.frombytes(block.buf[start * values.itemsize : stop * values.itemsize])
+    finally:
+        block.close()
+    return values
+
+
+def _write(name: str, start: int, values: array) -> None:
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        offset = start * values.itemsize
+        block.buf[offset : offset + len(values) * values.itemsize] = values.tobytes()
+    finally:
+        block.close()
+
+
+class _Pair:
+    """Shared key and blank blocks with room for ``capacity`` entries."""
+
+    __slots__ = ("keys", "blanks")
+
+    def __init__(self, capacity: int):
+        self.keys = shared_memory.SharedMemory(create=True, size=max(1, capacity * _KEY_BYTES))
+        self.blanks = shared_memory.SharedMemory(create=True, size=max(1, capacity))
+
+    @property
+    def names(self) -> tuple[str, str]:
+        return self.keys.name, self.blanks.name
+
+    def release(self) -> None:
+        for block in (self.keys, self.blanks):
+            block.close()
+            block.unlink()
+
+
+class SortedKeys:
+    """A BFS layer: sorted, distinct keys and their blanks, optionally shared."""
+
+    __slots__ = ("keys", "blanks", "shared")
+
+    def __init__(self, keys: array, blanks: array):
+        self.keys = keys
+        self.blanks = blanks
+        self.shared: _Pair | None = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.keys)
+
+    def __contains__(self, key: int) -> bool:
+        keys = self.keys
+        index = bisect_left(keys, key)
+        return index < len(keys) and keys[index] == key
+
+    def share(self) -> tuple[str, str]:
+        """Names of shared blocks holding the keys and blanks, created on first use."""
+
+        if self.shared is None:
+            self.shared = _Pair(len(self.keys))
+            self.shared.keys.buf[: len(self.keys) * _KEY_BYTES] = self.keys.tobytes()
+            self.shared.blanks.buf[: len(self.blanks)] = self.blanks.tobytes()
+        return self.shared.names
+
+    def unshare(self) -> None:
+        if self.shared is not None:
+            self.shared.release()
+            self.shared = None
+
+
+def expand_chunk(rows: int, cols: int, layer: tuple[str, str], runs: tuple[str, str], start: int, stop: int) -> int:
+    """Expand entries ``start:stop`` of the shared layer; returns how many children
+    were written, sorted by key, at slot ``4 * start`` of the run blocks."""
+
+    layout = get_layout(rows, cols)
+    bits = layout.cell_bits
+    mask = layout.cell_mask
+    blank_bits = _blank_bits(layout)
+    moves = [[(target, target * bits) for target, _ in layout.neighbors[pos]] for pos in range(layout.size)]
+
+    keys = _read(layer[0], "Q", start, stop)
+    blanks = _read(layer[1], "B", start, stop)
+
+    # A child is kept as ``key << blank_bits | blank``: sorting these sorts by key.
+    children = []
+    append = children.append
+    for key, blank in zip(keys, blanks):
+        blank_shift = blank * bits
+        for target, target_shift in moves[blank]:
+            tile = (key >> target_shift) & mask
+            append(((key - (tile << target_shift) + (tile << blank_shift)) << blank_bits) | target)
+    children.sort()
+
+    blank_mask = (1 << blank_bits) - 1
+    _write(runs[0], _MAX_CHILDREN * start, array("Q", [child >> blank_bits for child in children]))
+    _write(runs[1], _MAX_CHILDREN * start, array("B", [child & blank_mask for child in children]))
+    return len(children)
+
+
+def merge_range(
+    rows: int,
+    cols: int,
+    runs: tuple[str, str],
+    slices: list[tuple[int, int]],
+    previous: tuple[str, int, int] | None,
+    current: tuple[str, int, int],
+    out: tuple[str, str],
+    out_start: int,
+) -> int:
+    """Merge the run ``slices`` (one key range), without duplicates or keys in the
+    ``(keys block, start, stop)`` slices of the previous and current layers.
+    Returns how many entries were written at ``out_start`` of the ``out`` blocks."""
+
+    blank_bits = _blank_bits(get_layout(rows, cols))
+    sources = []
+    for start, stop in slices:
+        keys = _read(runs[0], "Q", start, stop)
+        blanks = _read(runs[1], "B", start, stop)
+        sources.append([(key << blank_bits) | blank for key, blank in zip(keys, blanks)])
+
+    # The two layers are disjoint sorted runs; sorting their concatenation is a
+    # single linear merge.
+    seen_keys = _read(current[0], "Q", current[1], current[2])
+    if previous is not None:
+        seen_keys += _read(previous[0], "Q", previous[1], previous[2])
+    seen = iter(sorted(seen_keys))
+    head = next(seen, None)
+
+    out_keys = array("Q")
+    out_blanks = array("B")
+    blank_mask = (1 << blank_bits) - 1
+    last = -1
+    for child in heapq.merge(*sources):
+        key = child >> blank_bits
+        if key == last:
+            continue
+        last = key
+        while head is not None and head < key:
+            head = next(seen, None)
+        if key != head:
+            out_keys.append(key)
+            out_blanks.append(child & blank_mask)
+
+    _write(out[0], out_start, out_keys)
+    _write(out[1], out_start, out_blanks)
+    return len(out_keys)
+
+
+def _chunk_bounds(count: int, chunks: int) -> list[tuple[int, int]]:
+    size = max(1, -(-count // chunks))
+    return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+class LayerPool:
+    """Process pool that turns one layer into the next; use as a context manager."""
+
+    def __init__(self, layout: BoardLayout, workers: int):
+        if layout.size * layout.cell_bits > 64:
+            raise UnsupportedBoardError(
+                f"Parallel BFS needs keys of at most 64 bits; {layout.rows}x{layout.cols} keys are wider"
+            )
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        self.layout = layout
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._shared: list[SortedKeys] = []
+
+    def __enter__(self) -> LayerPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        for layer in self._shared:
+            layer.unshare()
+        self._shared = []
+
+    def _share(self, layer: SortedKeys) -> tuple[str, str]:
+        if layer.shared is None:
+            self._shared.append(layer)
+        return layer.share()
+
+    def _run(self, func, tasks: list[tuple], local: bool, on_done=None) -> list:
+        """``func(*task)`` for every task, in this process if ``local``, else in the
+        pool; results in task order. ``on_done(index)`` is called after each task."""
+
+        if local:
+            results = []
+            for index, task in enumerate(tasks):
+                results.append(func(*task))
+                if on_done is not None:
+                    on_done(index)
+            return results
+
+        futures = [self._executor.submit(func, *task) for task in tasks]
+        results = []
+        for index, future in enumerate(futures):
+            results.append(future.result())
+            if on_done is not None:
+                on_done(index)
+        return results
+
+    def expand(self, layer: SortedKeys, previous: SortedKeys | None, monitor=None, explored: int = 0):
+        """``(next_layer, explored)``: the children of ``layer`` that are in neither
+        ``layer`` nor ``previous``, and the node count after expanding it (reported
+        to ``monitor`` as chunks finish)."""
+
+        count = len(layer)
+        rows, cols = self.layout.rows, self.layout.cols
+        local = self._executor is None or count < MIN_PARALLEL_LAYER
+        chunks = 1 if local else self.workers * CHUNKS_PER_WORKER
+        bounds = _chunk_bounds(count, chunks)
+        layer_names = self._share(layer)
+        runs = _Pair(_MAX_CHILDREN * count)
+        out = _Pair(_MAX_CHILDREN * count)
+        try:
+            def chunk_done(index: int) -> None:
+                nonlocal explored
+                start, stop = bounds[index]
+                explored += stop - start
+                if monitor is not None:
+                    monitor.report(explored)
+
+            tasks = [(rows, cols, layer_names, runs.names, start, stop) for start, stop in bounds]
+            lengths = self._run(expand_chunk, tasks, local, chunk_done)
+
+            # Cut the key space at quantiles of this layer; children are one move
+            # away from it, so the ranges get similar shares of them.
+            splitters = [layer.keys[i * count // chunks] for i in range(1, chunks)]
+            cuts = self._run_cuts(runs, bounds, lengths, splitters)
+            previous_names = self._share(previous) if previous is not None else None
+            limits = [0] + splitters + [None]
+
+            tasks = []
+            out_start = 0
+            for part in range(len(splitters) + 1):
+                slices = [(run_cuts[part], run_cuts[part + 1]) for run_cuts in cuts]
+                lo, hi = limits[part], limits[part + 1]
+                tasks.append((
+                    rows,
+                    cols,
+                    runs.names,
+                    slices,
+                    self._layer_slice(previous, previous_names, lo, hi),
+                    self._layer_slice(layer, layer_names, lo, hi),
+                    out.names,
+                    out_start,
+                ))
+                out_start += sum(stop - start for start, stop in slices)
+            written = self._run(merge_range, tasks, local)
+
+            next_keys = array("Q")
+            next_blanks = array("B")
+            for task, length in zip(tasks, written):
+                start = task[-1]
+                next_keys.frombytes(out.keys.buf[start * _KEY_BYTES : (start + length) * _KEY_BYTES])
+                next_blanks.frombytes(out.blanks.buf[start : start + length])
+        finally:
+            runs.release()
+            out.release()
+
+        # The previous layer is not needed for the next expansion.
+        if previous is not None:
+            previous.unshare()
+            self._shared.remove(previous)
+        return SortedKeys(next_keys, next_blanks), explored
+
+    @staticmethod
+    def _run_cuts(runs: _Pair, bounds, lengths, splitters) -> list[list[int]]:
+        """For every run, the absolute slot of its start, each splitter and its end."""
+
+        cuts = []
+        view = runs.keys.buf.cast("Q")
+        try:
+            for (start, _), length in zip(bounds, lengths):
+                first = _MAX_CHILDREN * start
+                with view[first : first + length] as run:
+                    cuts.append([first] + [first + bisect_left(run, key) for key in splitters] + [first + length])
+        finally:
+            view.release()
+        return cuts
+
+    @staticmethod
+    def _layer_slice(layer: SortedKeys | None, names, lo: int, hi: int | None):
+        if layer is None:
+            return None
+        keys = layer.keys
+        return names[0], bisect_left(keys, lo), len(keys) if hi is None else bisect_left(keys, hi)
@@ -0,0 +1,350 @@
+"""Additive disjoint pattern databases for the sliding puzzle.
+
+Each database covers one group of tiles. Its entries hold the minimum number of
+moves of *those* tiles needed to bring them home, over all placements of the
+blank, so the values of disjoint groups can be summed into an admissible
+heuristic. Tables are built once by retrograde 0-1 BFS from the goal and stored as
+one byte per entry; solver processes memory-map them instead of rebuilding.
+
+Build the default 4x4 tables (from the ``sliding_puzzle`` directory)::
+
+    python -m game.pattern_database --partition 6-6-3
+
+The 6-tile tables have 5,765,760 entries each (about 11 MB for the partition) and
+take on the order of ten minutes each to build in pure Python; loading them takes
+a few milliseconds. The 8-tile table of the 7-8 partition needs a 4 GB scratch
+array during the build, so 6-6-3 is the practical default.
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+
+from .packed_board import BoardLayout, UnsupportedBoardError, get_layout, layout_for
+from .permutation_rank import pattern_table_size, rank_positions
+
+Board = list[list[int]]
+
+GOAL_4x4: Board = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]]
+
+PARTITIONS: dict[str, tuple[tuple[int, ...], ...]] = {
+    "6-6-3": ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)),
+    "7-8": ((1, 2, 3, 4, 5, 6, 7), (8, 9, 10, 11, 12, 13, 14, 15)),
+}
+
+DEFAULT_PDB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "pdb")
+
+_MAGIC = b"SPDB"
+_VERSION = 1
+UNSEEN = 0xFF
+# Per-group positions and values remembered for recently seen keys; the cache is
+# emptied when full.
+ENTRY_CACHE_SIZE = 1 << 16
+
+
+def resolve_partition(partition: str | Sequence[Sequence[int]]) -> tuple[tuple[int, ...], ...]:
+    if isinstance(partition, str):
+        if partition not in PARTITIONS:
+            raise KeyError(f"Unknown pattern partition '{partition}' (known: {', '.join(PARTITIONS)})")
+        return PARTITIONS[partition]
+
+    groups = tuple(tuple(tiles) for tiles in partition)
+    seen: set[int] = set()
+    for tiles in groups:
+        if 0 in tiles or seen.intersection(tiles):
+            raise ValueError("Pattern groups must be disjoint and must not contain the blank (0)")
+        seen.update(tiles)
+    return groups
+
+
+def pattern_file_name(layout: BoardLayout, tiles: Sequence[int]) -> str:
+    return f"pdb_{layout.rows}x{layout.cols}_" + "-".join(str(t) for t in tiles) + ".bin"
+
+
+class PatternDatabase:
+    """Byte-per-entry distance table for one group of tiles."""
+
+    def __init__(
+        self,
+        layout: BoardLayout,
+        tiles: Sequence[int],
+        goal_positions: Sequence[int],
+        goal_blank: int,
+        table: bytearray | memoryview,
+        *,
+        source: mmap.mmap | None = None,
+    ):
+        self.layout = layout
+        self.tiles = tuple(tiles)
+        self.goal_positions = tuple(goal_positions)
+        self.goal_blank = goal_blank
+        self.table = table
+        self._source = source
+
+    def lookup(self, positions: Sequence[int]) -> int:
+        return self.table[rank_positions(positions, self.layout.size)]
+
+    def _header(self) -> bytes:
+        k = len(self.tiles)
+        return struct.pack(
+            f"<4sBBBBB{k}B{k}B",
+            _MAGIC,
+            _VERSION,
+            self.layout.rows,
+            self.layout.cols,
+            k,
+            self.goal_blank,
+            *self.tiles,
+            *self.goal_positions,
+        )
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._header())
+            f.write(self.table)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> PatternDatabase:
+        """Memory-map a table written by ``save``; entries are paged in on demand."""
+
+        with open(path, "rb") as f:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, rows, cols, k, goal_blank = struct.unpack_from("<4sBBBBB", source, 0)
+        if magic != _MAGIC or version != _VERSION:
+            source.close()
+            raise ValueError(f"{path} is not a pattern database file")
+
+        offset = struct.calcsize("<4sBBBBB")
+        tiles = struct.unpack_from(f"<{k}B", source, offset)
+        goal_positions = struct.unpack_from(f"<{k}B", source, offset + k)
+        offset += 2 * k
+
+        layout = get_layout(rows, cols)
+        table = memoryview(source)[offset:]
+        if len(table) != pattern_table_size(layout.size, k):
+            table.release()
+            source.close()
+            raise ValueError(f"{path} is truncated")
+
+        return cls(layout, tiles, goal_positions, goal_blank, table, source=source)
+
+
+def build_pattern_database(goal_board: Board, tiles: Sequence[int], *, progress=None) -> PatternDatabase:
+    """Retrograde 0-1 BFS from the goal over (pattern tile cells, blank cell).
+
+    Moving the blank into a non-pattern cell costs 0 and sliding a pattern tile costs
+    1, so each entry counts only this group's moves and groups stay additive.
+    """
+
+    layout = layout_for(goal_board)
+    cells = layout.size
+    k = len(tiles)
+
+    goal_key, goal_blank = layout.pack(goal_board)
+    goal_cell = {layout.tile_at(goal_key, pos): pos for pos in range(cells)}
+    missing = [tile for tile in tiles if tile not in goal_cell or tile == 0]
+    if missing or goal_blank < 0:
+        raise UnsupportedBoardError(f"Tiles {missing} are not on the goal board")
+
+    goal_positions = [goal_cell[tile] for tile in tiles]
+    neighbors = [[target for target, _ in layout.neighbors[pos]] for pos in range(cells)]
+
+    # Full states include the blank as the last "tile".
+    seen = bytearray(b"\xff") * pattern_table_size(cells, k + 1)
+    table = bytearray(b"\xff") * pattern_table_size(cells, k)
+
+    start = tuple(goal_positions) + (goal_blank,)
+    seen[rank_positions(start, cells)] = 0
+    layer = [start]
+    depth = 0
+
+    while layer:
+        next_layer = []
+        stack = layer
+
+        while stack:
+            state = stack.pop()
+            pattern_index = rank_positions(state[:k], cells)
+            if table[pattern_index] == UNSEEN:
+                table[pattern_index] = depth
+
+            blank = state[k]
+            for target in neighbors[blank]:
+                if target in state[:k]:
+                    slot = state.index(target)
+                    child = state[:slot] + (blank,) + state[slot + 1 : k] + (target,)
+                    child_index = rank_positions(child, cells)
+                    if seen[child_index] == UNSEEN:
+                        seen[child_index] = depth + 1
+                        next_layer.append(child)
+                else:
+                    child = state[:k] + (target,)
+                    child_index = rank_positions(child, cells)
+                    if seen[child_index] > depth:
+                        seen[child_index] = depth
+                        stack.append(child)
+
+        # Drop states that were later reached for free at the current depth.
+        layer = [state for state in next_layer if seen[rank_positions(state, cells)] == depth + 1]
+        depth += 1
+        if progress is not None:
+            progress(depth, len(layer))
+
+    return PatternDatabase(layout, tiles, goal_positions, goal_blank, table)
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path: str) -> PatternDatabase:
+    return PatternDatabase.load(path)
+
+
+def load_pattern_database(goal_board: Board, tiles: Sequence[int], directory: str | None = None) -> PatternDatabase:
+    """Load a saved table for ``tiles``, checking it matches ``goal_board``."""
+
+    layout = layout_for(goal_board)
+    path = os.path.join(directory or DEFAULT_PDB_DIR, pattern_file_name(layout, tiles))
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"Pattern database {path} not found; build it with "
+            "'python -m game.pattern_database' from the sliding_puzzle directory"
+        )
+
+    pdb = _load_cached(os.path.abspath(path))
+
+    goal_key, goal_blank = layout.pack(goal_board)
+    goal_cell = {layout.tile_at(goal_key, pos): pos for pos in range(layout.size)}
+    expected = tuple(goal_cell.get(tile, -1) for tile in tiles)
+    if pdb.layout.size != layout.size or pdb.goal_positions != expected or pdb.goal_blank != goal_blank:
+        raise ValueError(f"Pattern database {path} was built for a different goal board")
+    return pdb
+
+
+def build_partition(
+    goal_board: Board,
+    partition: str | Sequence[Sequence[int]],
+    directory: str | None = None,
+    *,
+    progress=None,
+) -> list[str]:
+    """Build and save every group of a partition; returns the written paths."""
+
+    layout = layout_for(goal_board)
+    paths = []
+    for tiles in resolve_partition(partition):
+        pdb = build_pattern_database(goal_board, tiles, progress=progress)
+        path = os.path.join(directory or DEFAULT_PDB_DIR, pattern_file_name(layout, tiles))
+        pdb.save(path)
+        _load_cached.cache_clear()
+        paths.append(path)
+    return paths
+
+
+class PatternDatabaseHeuristic:
+    """Sum of disjoint pattern database lookups, updated per move.
+
+    A move only changes the entry of the group that owns the slid tile. The
+    positions and value of every group are kept per key in a bounded cache
+    filled by ``evaluate`` and by earlier updates, so ``update`` copies the
+    parent's entries, replaces the moved tile's cell in its group and re-ranks
+    that one group; the other groups keep their values unchanged.
+    """
+
+    name = "pdb"
+
+    def __init__(
+        self,
+        goal_board: Board,
+        partition: str | Sequence[Sequence[int]] = "6-6-3",
+        directory: str | None = None,
+    ):
+        self.layout = layout_for(goal_board)
+        self.groups = resolve_partition(partition)
+        self.databases = [load_pattern_database(goal_board, tiles, directory) for tiles in self.groups]
+
+        # tile -> (group index, slot within the group)
+        self.owner: list[tuple[int, int] | None] = [None] * self.layout.size
+        for g, tiles in enumerate(self.groups):
+            for slot, tile in enumerate(tiles):
+                self.owner[tile] = (g, slot)
+        self.shift = [pos * self.layout.cell_bits for pos in range(self.layout.size)]
+        # key -> ((positions, value) of every group)
+        self._entry_cache: dict[int, tuple[tuple[tuple[int, ...], int], ...]] = {}
+
+    def _group_positions(self, key: int) -> list[list[int]]:
+        layout = self.layout
+        positions = [[0] * len(tiles) for tiles in self.groups]
+        owner = self.owner
+        for pos in range(layout.size):
+            entry = owner[layout.tile_at(key, pos)]
+            if entry is not None:
+                positions[entry[0]][entry[1]] = pos
+        return positions
+
+    def _entries(self, key: int) -> tuple[tuple[tuple[int, ...], int], ...]:
+        entries = self._entry_cache.get(key)
+        if entries is None:
+            entries = tuple(
+                (tuple(positions), db.lookup(positions))
+                for db, positions in zip(self.databases, self._group_positions(key))
+            )
+            self._remember(key, entries)
+        return entries
+
+    def _remember(self, key: int, entries: tuple[tuple[tuple[int, ...], int], ...]) -> None:
+        cache = self._entry_cache
+        if len(cache) >= ENTRY_CACHE_SIZE:
+            cache.clear()
+        cache[key] = entries
+
+    def evaluate(self, key: int) -> int:
+        return sum(value for _, value in self._entries(key))
+
+    def update(self, h: int, key: int, tile: int, from_pos: int, to_pos: int) -> int:
+        entries = self._entries(key)
+        child = key - (tile << self.shift[from_pos]) + (tile << self.shift[to_pos])
+        entry = self.owner[tile]
+        if entry is None:
+            self._remember(child, entries)
+            return h
+
+        group, slot = entry
+        positions, before = entries[group]
+        moved = positions[:slot] + (to_pos,) + positions[slot + 1 :]
+        after = self.databases[group].lookup(moved)
+        self._remember(child, entries[:group] + ((moved, after),) + entries[group + 1 :])
+        return h - before + after
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build additive pattern databases for the 4x4 puzzle")
+    parser.add_argument("--partition", choices=sorted(PARTITIONS), default="6-6-3")
+    parser.add_argument("--directory", default=DEFAULT_PDB_DIR, help="Where to write the table files.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    def report(depth: int, layer_size: int) -> None:
+        print(f"  depth {depth}: {layer_size} states", flush=True)
+
+    for tiles in PARTITIONS[args.partition]:
+        print(f"Building pattern {tiles} ...", flush=True)
+        paths = build_partition(GOAL_4x4, [tiles], args.directory, progress=report)
+        print(f"Wrote {paths[0]}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,187 @@
+"""Dense integer indices for boards and tile patterns.
+
+A board of ``n`` cells is a permutation of ``0 .. n-1`` (cell -> tile), and the
+cells of ``k`` chosen tiles form a k-permutation; either maps to a unique index
+in ``range(n!)`` or ``range(n! / (n-k)!)``, so visited sets and distance tables can
+be flat bit or byte arrays instead of Python sets of boards.
+
+Two orders are provided:
+
+* Myrvold–Ruskey (``rank_permutation``, ``rank_pattern`` and their inverses):
+  linear time, one swap per digit and no bit counting. Use these for new,
+  in-memory indices.
+* Lexicographic (``rank_positions`` / ``unrank_positions``): the order the pattern
+  database and 3x3 distance table files on disk are written in. Unranking pops
+  from a list of free cells, O(n·k), so it is kept only for those files.
+
+``rank_key`` and ``rank_keys`` rank packed board keys (``packed_board``) directly,
+the latter a whole batch into an ``array('Q')``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+
+from .packed_board import BoardLayout
+
+
+def pattern_table_size(cell_count: int, tile_count: int) -> int:
+    """Number of ways to place ``tile_count`` distinct tiles on ``cell_count`` cells."""
+
+    size = 1
+    for i in range(tile_count):
+        size *= cell_count - i
+    return size
+
+
+def rank_permutation(perm: Sequence[int]) -> int:
+    """Myrvold–Ruskey rank of a permutation of ``0 .. n-1``, in ``range(n!)``."""
+
+    n = len(perm)
+    perm = list(perm)
+    inverse = [0] * n
+    for i, value in enumerate(perm):
+        inverse[value] = i
+
+    rank = 0
+    radix = 1
+    for i in range(n - 1, 0, -1):
+        # Swap value i into slot i; the value it displaces is this digit.
+        digit = perm[i]
+        slot = inverse[i]
+        perm[slot] = digit
+        inverse[digit] = slot
+        rank += digit * radix
+        radix *= i + 1
+    return rank
+
+
+def unrank_permutation(index: int, n: int) -> list[int]:
+    """Inverse of ``rank_permutation``."""
+
+    perm = list(range(n))
+    for i in range(n - 1, 0, -1):
+        index, digit = divmod(index, i + 1)
+        perm[i], perm[digit] = perm[digit], perm[i]
+    return perm
+
+
+def rank_pattern(positions: Sequence[int], cell_count: int) -> int:
+    """Myrvold–Ruskey rank of the cells of ``k`` tiles, in ``range(n! / (n-k)!)``.
+
+    Only the first ``k`` digits of the full rank depend on these tiles, so the
+    other tiles are never looked at. ``positions[j]`` is the cell of pattern tile ``j``.
+    """
+
+    k = len(positions)
+    perm = [-1] * cell_count
+    inverse = [-1] * cell_count
+    for j, pos in enumerate(positions):
+        perm[cell_count - 1 - j] = pos
+        inverse[pos] = cell_count - 1 - j
+
+    rank = 0
+    radix = 1
+    for i in range(cell_count - 1, cell_count - 1 - k, -1):
+        digit = perm[i]
+        slot = inverse[i]
+        # ``slot`` is -1 when value i sits with the untracked tiles; ``digit``
+        # then goes there too.
+        if slot >= 0:
+            perm[slot] = digit
+        inverse[digit] = slot
+        rank += digit * radix
+        radix *= i + 1
+    return rank
+
+
+def unrank_pattern(index: int, cell_count: int, tile_count: int) -> list[int]:
+    """Inverse of ``rank_pattern``."""
+
+    perm = list(range(cell_count))
+    for i in range(cell_count - 1, cell_count - 1 - tile_count, -1):
+        index, digit = divmod(index, i + 1)
+        perm[i], perm[digit] = perm[digit], perm[i]
+    return [perm[cell_count - 1 - j] for j in range(tile_count)]
+
+
+def rank_positions(positions: Sequence[int], cell_count: int) -> int:
+    """Lexicographic index of an ordered placement of distinct cells (a k-permutation)."""
+
+    index = 0
+    used = 0
+    for i, pos in enumerate(positions):
+        smaller_used = (used & ((1 << pos) - 1)).bit_count()
+        index = index * (cell_count - i) + (pos - smaller_used)
+        used |= 1 << pos
+    return index
+
+
+def unrank_positions(index: int, cell_count: int, tile_count: int) -> list[int]:
+    """Inverse of ``rank_positions``."""
+
+    digits = []
+    for i in range(tile_count - 1, -1, -1):
+        index, digit = divmod(index, cell_count - i)
+        digits.append(digit)
+    digits.reverse()
+
+    free = list(range(cell_count))
+    return [free.pop(digit) for digit in digits]
+
+
+def rank_key(layout: BoardLayout, key: int) -> int:
+    """``rank_permutation`` of a packed board."""
+
+    bits = layout.cell_bits
+    mask = layout.cell_mask
+    return rank_permutation([(key >> (pos * bits)) & mask for pos in range(layout.size)])
+
+
+def unrank_key(layout: BoardLayout, index: int) -> tuple[int, int]:
+    """``(key, blank)`` of the board with ``rank_key`` ``index``."""
+
+    bits = layout.cell_bits
+    key = 0
+    blank = -1
+    for pos, tile in enumerate(unrank_permutation(index, layout.size)):
+        key |= tile << (pos * bits)
+        if tile == 0:
+            blank = pos
+    return key, blank
+
+
+def rank_keys(layout: BoardLayout, keys: Iterable[int]) -> array:
+    """``rank_key`` of every key, as an ``array('Q')`` (8 bytes per board).
+
+    Fits boards up to 20 cells (20! < 2**64), which covers 4x4 and 4x5.
+    """
+
+    n = layout.size
+    bits = layout.cell_bits
+    mask = layout.cell_mask
+    shifts = [pos * bits for pos in range(n)]
+    radices = [0] * n
+    radix = 1
+    for i in range(n - 1, 0, -1):
+        radices[i] = radix
+        radix *= i + 1
+    steps = [(i, radices[i]) for i in range(n - 1, 0, -1)]
+    inverse = [0] * n
+
+    ranks = array("Q")
+    append = ranks.append
+    for key in keys:
+        perm = [(key >> shift) & mask for shift in shifts]
+        for i, value in enumerate(perm):
+            inverse[value] = i
+        rank = 0
+        for i, radix in steps:
+            digit = perm[i]
+            slot = inverse[i]
+            perm[slot] = digit
+            inverse[digit] = slot
+            rank += digit * radix
+        append(rank)
+    return ranks
@@ -1,7 +1,41 @@
 import random
 import time
+from functools import wraps
 
-from utils.constants import SHUFFLE_MOVES_3x3, SHUFFLE_MOVES_4x4
+from utils.constants import shuffle_moves_for
+from utils.solvability import is_solvable
+
+
+def _bumps_revision(method):
+    @wraps(method)
+    def mutate(self, *args, **kwargs):
+        self.revision += 1
+        return method(self, *args, **kwargs)
+
+    return mutate
+
+
+class MetricsResults(list):
+    """Solver result rows of a game; ``revision`` changes on every mutation.
+
+    The list is shared by the game, its screen and the metrics window, so views
+    compare the revision to tell whether the rows changed since they last drew.
+    """
+
+    revision = 0
+
+    append = _bumps_revision(list.append)
+    extend = _bumps_revision(list.extend)
+    insert = _bumps_revision(list.insert)
+    remove = _bumps_revision(list.remove)
+    pop = _bumps_revision(list.pop)
+    clear = _bumps_revision(list.clear)
+    sort = _bumps_revision(list.sort)
+    reverse = _bumps_revision(list.reverse)
+    __setitem__ = _bumps_revision(list.__setitem__)
+    __delitem__ = _bumps_revision(list.__delitem__)
+    __iadd__ = _bumps_revision(list.__iadd__)
+    __imul__ = _bumps_revision(list.__imul__)
 
 
 class PuzzleGame:
@@ -22,8 +56,9 @@ class PuzzleGame:
         self.is_animating = False
         self.move_history: list[list[list[int]]] = []
         self.has_scrambled = self.current_board != self.goal_board
+        self.is_solvable = is_solvable(self.current_board, self.goal_board)
 
-        self.metrics_results: list[dict[str, object]] = []
+        self.metrics_results = MetricsResults()
 
     def find_blank(self) -> tuple[int, int] | None:
         for i, row in enumerate(self.current_board):
@@ -47,6 +82,7 @@ class PuzzleGame:
         self.is_animating = False
         self.move_history = []
         self.has_scrambled = self.current_board != self.goal_board
+        self.is_solvable = is_solvable(self.current_board, self.goal_board)
 
     def clear_metrics(self) -> None:
         self.metrics_results.clear()
@@ -54,15 +90,16 @@ class PuzzleGame:
     def shuffle(self, move_count: int | None = None) -> list[list[int]]:
         """Generate a solvable shuffle by applying random blank moves from the goal state."""
 
-        n = len(self.goal_board)
+        rows = len(self.goal_board)
+        cols = len(self.goal_board[0])
         if move_count is None:
-            move_count = SHUFFLE_MOVES_4x4 if n == 4 else SHUFFLE_MOVES_3x3
+            move_count = shuffle_moves_for(rows, cols)
 
         board = [row[:] for row in self.goal_board]
 
         blank_row = blank_col = None
-        for i in range(n):
-            for j in range(n):
+        for i in range(rows):
+            for j in range(cols):
                 if board[i][j] == 0:
                     blank_row, blank_col = i, j
                     break
@@ -70,7 +107,7 @@ class PuzzleGame:
                 break
 
         if blank_row is None:
-            blank_row, blank_col = n - 1, n - 1
+            blank_row, blank_col = rows - 1, cols - 1
 
         last_action = None
         opposite = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
@@ -84,7 +121,7 @@ class PuzzleGame:
 
                 nr = blank_row + dr
                 nc = blank_col + dc
-                if 0 <= nr < n and 0 <= nc < n:
+                if 0 <= nr < rows and 0 <= nc < cols:
                     possible.append((nr, nc, action))
 
             if not possible:
@@ -100,7 +137,7 @@ class PuzzleGame:
             for dr, dc, action in directions:
                 nr = blank_row + dr
                 nc = blank_col + dc
-                if 0 <= nr < n and 0 <= nc < n:
+                if 0 <= nr < rows and 0 <= nc < cols:
                     possible.append((nr, nc, action))
 
             if possible:
@@ -113,7 +150,9 @@ class PuzzleGame:
         return board
 
     def can_solve(self) -> bool:
-        return self.has_scrambled and not self.is_solved()
+        """Whether running a solver makes sense (scrambled, unsolved and solvable)."""
+
+        return self.has_scrambled and self.is_solvable and not self.is_solved()
 
     def handle_tile_click(self, row: int, col: int) -> bool:
         if self.is_animating or self.blank_pos is None:
@@ -1,7 +1,29 @@
+from array import array
 from collections import deque
+from fractions import Fraction
+from functools import lru_cache
+from math import factorial
+import tempfile
 import time
-import heapq
+from .distance_table import DistanceTableHeuristic, check_board, load_distance_table
+from .external_layers import DEFAULT_SPILL_KEYS, LayerWriter, write_layer
+from .frontier import make_frontier
+from .packed_board import OPPOSITE, UnsupportedBoardError, layout_for
+from .parallel_bfs import LayerPool, SortedKeys
+from .pattern_database import PatternDatabaseHeuristic
+from .permutation_rank import rank_permutation, unrank_permutation
 from .puzzle_state import PuzzleState
+from .search_monitor import PROGRESS_MASK
+from .solution_path import ACTIONS_BY_CODE, MOVE_CODES, SolutionPath, encode_actions
+from .transposition import DEFAULT_TT_BYTES, TranspositionTable
+from .walking_distance import WalkingDistanceHeuristic
+from utils.solvability import is_solvable
+
+SOLVED = 'solved'
+UNSOLVABLE = 'unsolvable'
+
+# Largest board the compact BFS accepts: 12! ranks are two 60 MB bitsets.
+BITSET_MAX_CELLS = 12
 
 
 def build_solution_path(goal_state):
@@ -16,79 +38,465 @@ def build_solution_path(goal_state):
     return path
 
 
+def trace_moves(layout, came_from, key, blank):
+    """Recover the move string that reached ``key`` from per-key move codes.
+    
+    ``came_from`` maps each reached key to the code of the move that produced it
+    (``None`` for the root). Undoing that move gives the parent key, so solvers do
+    not need to keep parent links on their nodes.
+    """
+    codes = []
+    code = came_from[key]
+    
+    while code is not None:
+        codes.append(code)
+        previous_blank = layout.targets[blank][OPPOSITE[ACTIONS_BY_CODE[code]]]
+        key = layout.apply_move(key, blank, previous_blank)
+        blank = previous_blank
+        code = came_from[key]
+    
+    codes.reverse()
+    return ''.join(codes)
+
+
 def format_result(solution_path, nodes_explored, start_time):
-    """Format the solver result in a consistent format."""
-    time_ms = (time.time() - start_time) * 1000
+    """Format the solver result in a consistent format.
+    
+    ``start_time`` comes from ``time.perf_counter()`` (monotonic, high resolution).
+    ``solution_path`` is a ``SolutionPath``; ``path`` and ``solution_path`` refer to
+    the same object, and ``move_sequence`` is its compact "UDLR" string.
+    """
+    elapsed = time.perf_counter() - start_time
     moves = len(solution_path) - 1
     
     return {
         'path': solution_path,
         'moves': moves,
-        'time_ms': time_ms,
+        'time_ms': elapsed * 1000,
         'nodes_explored': nodes_explored,
         'solution_path': solution_path,
         'steps': moves,
-        'time_taken': time.time() - start_time,
+        'time_taken': elapsed,
+        'status': SOLVED,
+        'initial_board': solution_path.initial_board,
+        'move_sequence': solution_path.moves,
+    }
+
+
+def format_unsolvable(start_time):
+    """Result for a board whose parity can never reach the goal; no search is run."""
+    elapsed = time.perf_counter() - start_time
+    return {
+        'path': [],
+        'moves': None,
+        'time_ms': elapsed * 1000,
+        'nodes_explored': 0,
+        'solution_path': [],
+        'steps': None,
+        'time_taken': elapsed,
+        'status': UNSOLVABLE,
     }
 
 
-def solve_bfs(initial_board, goal_board):
-    start_time = time.time()
+def is_unsolvable(result):
+    return result is not None and result.get('status') == UNSOLVABLE
+
+
+def solve_bfs(initial_board, goal_board, compact=False, spill_dir=None, spill_keys=DEFAULT_SPILL_KEYS,
+              workers=1, monitor=None):
+    """Breadth-first search.
+    
+    Like every solver here, it takes an optional ``SearchMonitor`` that is given the
+    node count periodically and can stop the search by raising ``SearchCancelled``.
+    
+    ``compact=True`` keeps the visited set as bitsets over permutation ranks
+    instead of a dict of keys (see ``_solve_bfs_bitset``); it needs boards of at
+    most ``BITSET_MAX_CELLS`` cells.
+    
+    ``spill_dir`` runs a frontier search whose layers live in sorted files in a
+    temporary directory under it, holding at most ``spill_keys`` new keys in
+    memory at a time (see ``_solve_bfs_external``).
+    
+    ``workers > 1`` expands each layer across that many processes (see
+    ``_solve_bfs_parallel``).
+    """
+    if sum((bool(compact), spill_dir is not None, workers > 1)) > 1:
+        raise ValueError('compact, spill_dir and workers are separate BFS modes')
+    start_time = time.perf_counter()
     
     initial_state = PuzzleState(initial_board)
+    goal_key = initial_state.layout.pack(goal_board)[0]
+    
+    if initial_state.key == goal_key:
+        return format_result(SolutionPath(initial_board), 1, start_time)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
     
-    if initial_state.is_goal(goal_board):
-        return format_result([initial_state], 1, start_time)
+    if compact:
+        return _solve_bfs_bitset(initial_board, goal_board, start_time, monitor)
+    if spill_dir is not None:
+        return _solve_bfs_external(initial_board, goal_board, start_time, spill_dir, spill_keys, monitor)
+    if workers > 1:
+        return _solve_bfs_parallel(initial_board, goal_board, start_time, workers, monitor)
     
-    queue = deque([initial_state])
-    visited = {initial_state.get_board_tuple()}
+    layout = initial_state.layout
+    neighbors = layout.neighbors
+    apply_move = layout.apply_move
+    
+    queue = deque([(initial_state.key, initial_state.blank)])
+    came_from = {initial_state.key: None}
     nodes_explored = 0
     
     while queue:
-        current_state = queue.popleft()
+        key, blank = queue.popleft()
         nodes_explored += 1
+        if monitor is not None and not nodes_explored & PROGRESS_MASK:
+            monitor.report(nodes_explored)
         
-        if current_state.is_goal(goal_board):
-            solution_path = build_solution_path(current_state)
-            return format_result(solution_path, nodes_explored, start_time)
+        if key == goal_key:
+            moves = trace_moves(layout, came_from, key, blank)
+            return format_result(SolutionPath(initial_board, moves), nodes_explored, start_time)
+        
+        for target, action_name in neighbors[blank]:
+            next_key = apply_move(key, blank, target)
+            if next_key not in came_from:
+                came_from[next_key] = MOVE_CODES[action_name]
+                queue.append((next_key, target))
+    
+    return None
+
+
+def _solve_bfs_bitset(initial_board, goal_board, start_time, monitor=None):
+    """Layer-by-layer BFS over Myrvold-Ruskey ranks of the flattened board.
+    
+    Every rank owns two bits: one in ``visited`` and, in ``depth_bits``, bit 1 of
+    the depth it was reached at. Each layer is an ``array('Q')`` of ranks, so
+    memory is about n!/4 bytes plus the widest layer: 90 KB for 3x3, 120 MB
+    for 3x4. No parents are stored; ``_trace_bitset_path`` recovers the path.
+    """
+    layout = layout_for(initial_board)
+    cells = layout.size
+    if cells > BITSET_MAX_CELLS:
+        raise UnsupportedBoardError(f'Compact BFS supports at most {BITSET_MAX_CELLS} cells, not {cells}')
+    
+    neighbors = layout.neighbors
+    goal = [value for row in goal_board for value in row]
+    goal_rank = rank_permutation(goal)
+    
+    visited = bytearray((factorial(cells) + 7) >> 3)
+    depth_bits = bytearray(len(visited))
+    rank = rank_permutation([value for row in initial_board for value in row])
+    visited[rank >> 3] |= 1 << (rank & 7)
+    frontier = array('Q', [rank])
+    depth = 0
+    nodes_explored = 0
+    
+    while frontier:
+        next_frontier = array('Q')
+        depth_bit = (depth + 1) >> 1 & 1
         
-        for next_state in current_state.get_possible_moves():
-            state_tuple = next_state.get_board_tuple()
-            if state_tuple not in visited:
-                visited.add(state_tuple)
-                queue.append(next_state)
+        for rank in frontier:
+            nodes_explored += 1
+            if monitor is not None and not nodes_explored & PROGRESS_MASK:
+                monitor.report(nodes_explored)
+            
+            perm = unrank_permutation(rank, cells)
+            blank = perm.index(0)
+            for target, _ in neighbors[blank]:
+                perm[blank], perm[target] = perm[target], 0
+                child = rank_permutation(perm)
+                perm[target], perm[blank] = perm[blank], 0
+                
+                byte, bit = child >> 3, 1 << (child & 7)
+                if visited[byte] & bit:
+                    continue
+                visited[byte] |= bit
+                if depth_bit:
+                    depth_bits[byte] |= bit
+                
+                if child == goal_rank:
+                    moves = _trace_bitset_path(layout, goal, depth + 1, visited, depth_bits)
+                    return format_result(SolutionPath(initial_board, moves), nodes_explored, start_time)
+                next_frontier.append(child)
+        
+        frontier = next_frontier
+        depth += 1
+    
+    return None
+
+
+def _trace_bitset_path(layout, goal, depth, visited, depth_bits):
+    """Walk back from ``goal`` (reached at ``depth``) to the start.
+    
+    Every move flips the colour of the blank's cell, so the neighbours of a board
+    at depth d sit at depth d - 1 or d + 1, and bit 1 of the depth tells the two
+    apart: the visited neighbour whose bit matches d - 1 is a parent.
+    """
+    neighbors = layout.neighbors
+    perm = goal[:]
+    blank = perm.index(0)
+    codes = []
+    
+    for parent_depth in range(depth - 1, -1, -1):
+        want = parent_depth >> 1 & 1
+        for target, action_name in neighbors[blank]:
+            perm[blank], perm[target] = perm[target], 0
+            rank = rank_permutation(perm)
+            byte, bit = rank >> 3, 1 << (rank & 7)
+            if visited[byte] & bit and bool(depth_bits[byte] & bit) == want:
+                # The parent's blank was at ``target``; it slid back here.
+                codes.append(MOVE_CODES[OPPOSITE[action_name]])
+                blank = target
+                break
+            perm[target], perm[blank] = perm[blank], 0
+    
+    codes.reverse()
+    return ''.join(codes)
+
+
+def _solve_bfs_external(initial_board, goal_board, start_time, spill_dir, spill_keys, monitor=None):
+    """Frontier BFS with layers spilled to disk (``external_layers``).
+    
+    Every move flips the colour of the blank's cell, so a child of layer d is in
+    layer d - 1 or d + 1; deduplicating the next layer against the previous one
+    is enough, and the search only ever reads the current layer and merges
+    against the previous one. Older layers stay on disk, untouched, for
+    ``_trace_layers``; the whole directory is removed when the search ends.
+    """
+    layout = layout_for(initial_board)
+    if layout.size * layout.cell_bits > 64:
+        raise UnsupportedBoardError(f'Disk BFS needs keys of at most 64 bits; {layout.rows}x{layout.cols} keys are wider')
+    
+    neighbors = layout.neighbors
+    apply_move = layout.apply_move
+    find_blank = layout.find_blank
+    start_key = layout.pack(initial_board)[0]
+    goal_key, goal_blank = layout.pack(goal_board)
+    nodes_explored = 0
+    
+    with tempfile.TemporaryDirectory(prefix='bfs-', dir=spill_dir) as directory:
+        layers = [write_layer(directory, '0', [start_key])]
+        
+        while layers[-1].count:
+            writer = LayerWriter(directory, str(len(layers)), spill_keys)
+            
+            for key in layers[-1]:
+                nodes_explored += 1
+                if monitor is not None and not nodes_explored & PROGRESS_MASK:
+                    monitor.report(nodes_explored)
+                
+                blank = find_blank(key)
+                for target, _ in neighbors[blank]:
+                    next_key = apply_move(key, blank, target)
+                    if next_key == goal_key:
+                        moves = _trace_layers(layout, layers, goal_key, goal_blank)
+                        return format_result(SolutionPath(initial_board, moves), nodes_explored, start_time)
+                    writer.add(next_key)
+            
+            layers.append(writer.finish(exclude=layers[-2] if len(layers) > 1 else None))
+    
+    return None
+
+
+def _solve_bfs_parallel(initial_board, goal_board, start_time, workers, monitor=None):
+    """Level-synchronous BFS; ``parallel_bfs.LayerPool`` expands each layer.
+    
+    Layers are kept as sorted key arrays (8 bytes per board, no parents), and the
+    path is recovered by ``_trace_layers`` like the disk BFS does.
+    """
+    layout = layout_for(initial_board)
+    start_key, start_blank = layout.pack(initial_board)
+    goal_key, goal_blank = layout.pack(goal_board)
+    nodes_explored = 0
+    
+    with LayerPool(layout, workers) as pool:
+        layers = [SortedKeys(array('Q', [start_key]), array('B', [start_blank]))]
+        while layers[-1]:
+            previous = layers[-2] if len(layers) > 1 else None
+            next_layer, nodes_explored = pool.expand(layers[-1], previous, monitor, nodes_explored)
+            if goal_key in next_layer:
+                moves = _trace_layers(layout, layers, goal_key, goal_blank)
+                return format_result(SolutionPath(initial_board, moves), nodes_explored, start_time)
+            layers.append(next_layer)
     
     return None
 
 
-def solve_dfs(initial_board, goal_board, depth_limit=50):
-    start_time = time.time()
+def _trace_layers(layout, layers, key, blank):
+    """Walk back from ``key``, one layer past ``layers[-1]``, to ``layers[0]``.
+    
+    Each step looks the neighbours of the current board up in the layer before
+    it; one of them must be there, and it is a parent. Layers only need ``in``.
+    """
+    codes = []
+    
+    for layer in reversed(layers):
+        for target, action_name in layout.neighbors[blank]:
+            parent = layout.apply_move(key, blank, target)
+            if parent in layer:
+                codes.append(MOVE_CODES[OPPOSITE[action_name]])
+                key, blank = parent, target
+                break
+    
+    codes.reverse()
+    return ''.join(codes)
+
+
+def _expand_layer(layout, frontier, came_from, depths, other_depths, depth, monitor=None, explored=0):
+    """Expand one BFS layer; returns the next layer and the best meeting point.
+    
+    ``came_from`` holds the code of the blank move that first reached each key on
+    this side and ``depths`` its BFS depth. ``explored`` is the node count before
+    this layer, for progress reports.
+    """
+    next_frontier = []
+    best_meet = None
+    
+    for index, (key, blank) in enumerate(frontier, start=explored + 1):
+        if monitor is not None and not index & PROGRESS_MASK:
+            monitor.report(index)
+        
+        for target, action_name in layout.neighbors[blank]:
+            next_key = layout.apply_move(key, blank, target)
+            if next_key in came_from:
+                continue
+            
+            came_from[next_key] = MOVE_CODES[action_name]
+            depths[next_key] = depth + 1
+            next_frontier.append((next_key, target))
+            
+            other_depth = other_depths.get(next_key)
+            if other_depth is not None:
+                total = depth + 1 + other_depth
+                if best_meet is None or total < best_meet[0]:
+                    best_meet = (total, next_key, target)
+    
+    return next_frontier, best_meet
+
+
+def _reverse_moves(moves):
+    """Moves that walk a path backwards: reversed order, opposite directions."""
+    return ''.join(MOVE_CODES[OPPOSITE[ACTIONS_BY_CODE[code]]] for code in reversed(moves))
+
+
+def solve_bidirectional_bfs(initial_board, goal_board, monitor=None):
+    """Bidirectional BFS meeting in the middle.
+    
+    Alternates whole-layer expansions of a forward frontier from the start and a
+    backward frontier from the goal (always the smaller one), so each side only
+    searches about half the solution depth. The best meeting point of the first
+    layer that connects the two sides gives an optimal path.
+    """
+    start_time = time.perf_counter()
+    
+    initial_state = PuzzleState(initial_board)
+    layout = initial_state.layout
+    goal_key, goal_blank = layout.pack(goal_board)
+    
+    if initial_state.key == goal_key:
+        return format_result(SolutionPath(initial_board), 1, start_time)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
+    
+    forward_came_from = {initial_state.key: None}
+    backward_came_from = {goal_key: None}
+    forward_depths = {initial_state.key: 0}
+    backward_depths = {goal_key: 0}
+    forward_frontier = [(initial_state.key, initial_state.blank)]
+    backward_frontier = [(goal_key, goal_blank)]
+    forward_depth = backward_depth = 0
+    nodes_explored = 0
+    
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            layer_size = len(forward_frontier)
+            forward_frontier, meet = _expand_layer(
+                layout, forward_frontier, forward_came_from, forward_depths, backward_depths, forward_depth,
+                monitor, nodes_explored,
+            )
+            forward_depth += 1
+        else:
+            layer_size = len(backward_frontier)
+            backward_frontier, meet = _expand_layer(
+                layout, backward_frontier, backward_came_from, backward_depths, forward_depths, backward_depth,
+                monitor, nodes_explored,
+            )
+            backward_depth += 1
+        nodes_explored += layer_size
+        
+        if meet is not None:
+            _, meet_key, meet_blank = meet
+            moves = trace_moves(layout, forward_came_from, meet_key, meet_blank)
+            moves += _reverse_moves(trace_moves(layout, backward_came_from, meet_key, meet_blank))
+            return format_result(SolutionPath(initial_board, moves), nodes_explored, start_time)
+    
+    return None
+
+
+def solve_dfs(initial_board, goal_board, depth_limit=50, monitor=None, tt_bytes=DEFAULT_TT_BYTES):
+    """Depth-limited DFS returning the first path found (not necessarily the shortest).
+    
+    Instead of a visited set that only grows (and wrongly prunes boards later reached
+    by a shorter route), boards are recorded in a ``TranspositionTable`` capped at
+    ``tt_bytes`` with the smallest depth they were reached at. A board is skipped
+    only when it is reached again no shallower; evicted entries just cost a repeat
+    expansion.
+    """
+    start_time = time.perf_counter()
     
     initial_state = PuzzleState(initial_board)
+    goal_key = initial_state.layout.pack(goal_board)[0]
+    
+    if initial_state.key == goal_key:
+        return format_result(SolutionPath(initial_board), 1, start_time)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
+    
+    layout = initial_state.layout
+    neighbors = layout.neighbors
+    apply_move = layout.apply_move
+    table = TranspositionTable(layout, tt_bytes)
     
-    if initial_state.is_goal(goal_board):
-        return format_result([initial_state], 1, start_time)
+    best_g = table.best_g
+    store = table.store
     
-    stack = [initial_state]
-    visited = {initial_state.get_board_tuple()}
+    actions = []
     nodes_explored = 0
     
-    while stack:
-        current_state = stack.pop()
+    def search(key, blank, g, previous_blank):
+        nonlocal nodes_explored
         nodes_explored += 1
+        if monitor is not None and not nodes_explored & PROGRESS_MASK:
+            monitor.report(nodes_explored)
         
-        if current_state.is_goal(goal_board):
-            solution_path = build_solution_path(current_state)
-            return format_result(solution_path, nodes_explored, start_time)
+        if key == goal_key:
+            return True
+        if g >= depth_limit:
+            return False
         
-        if current_state.level >= depth_limit:
-            continue
+        for target, action_name in neighbors[blank]:
+            if target == previous_blank:
+                continue
+            
+            next_key = apply_move(key, blank, target)
+            if best_g(next_key) <= g + 1:
+                continue
+            store(next_key, g + 1, 0)
+            
+            actions.append(action_name)
+            if search(next_key, target, g + 1, blank):
+                return True
+            actions.pop()
         
-        for next_state in current_state.get_possible_moves():
-            state_tuple = next_state.get_board_tuple()
-            if state_tuple not in visited:
-                visited.add(state_tuple)
-                stack.append(next_state)
+        return False
+    
+    store(initial_state.key, 0, 0)
+    if search(initial_state.key, initial_state.blank, 0, -1):
+        solution_path = SolutionPath(initial_board, encode_actions(actions))
+        return format_result(solution_path, nodes_explored, start_time)
     
     return None
 
@@ -129,44 +537,918 @@ def manhattan_distance(board, goal_positions):
     return distance
 
 
-def solve_astar(initial_board, goal_board):
-    """A* algorithm for solving sliding puzzle with Manhattan distance heuristic."""
-    start_time = time.time()
+class ManhattanHeuristic:
+    """Manhattan distance on packed boards with O(1) per-move updates.
+    
+    ``distance[tile][pos]`` is precomputed for every tile and cell, so a move only
+    needs the two table entries for the tile that slid.
+    """
+    
+    name = 'manhattan'
+    
+    def __init__(self, goal_board):
+        self.layout = layout_for(goal_board)
+        goal_positions = precompute_goal_positions(goal_board)
+        cols = self.layout.cols
+        
+        self.distance = [[0] * self.layout.size for _ in range(self.layout.size)]
+        for tile, (goal_i, goal_j) in goal_positions.items():
+            for pos in range(self.layout.size):
+                i, j = divmod(pos, cols)
+                self.distance[tile][pos] = abs(i - goal_i) + abs(j - goal_j)
+    
+    def evaluate(self, key):
+        """Full evaluation, used once for the start state."""
+        layout = self.layout
+        distance = self.distance
+        return sum(distance[layout.tile_at(key, pos)][pos] for pos in range(layout.size))
+    
+    def update(self, h, key, tile, from_pos, to_pos):
+        """Return h after ``tile`` slides from ``from_pos`` to ``to_pos`` in ``key``."""
+        distance = self.distance[tile]
+        return h - distance[from_pos] + distance[to_pos]
+
+
+def _line_penalty(goal_lines):
+    """Extra moves forced by tiles in their goal line but in reversed order.
+    
+    ``goal_lines`` holds the goal position along the line for each such tile, in
+    board order; every tile outside the longest increasing run must step out of
+    the line and back, costing two moves.
+    """
+    longest = []
+    for value in goal_lines:
+        # Patience sorting: longest[i] is the smallest tail of a run of length i + 1.
+        lo, hi = 0, len(longest)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if longest[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(longest):
+            longest.append(value)
+        else:
+            longest[lo] = value
+    return 2 * (len(goal_lines) - len(longest))
+
+
+class LinearConflictHeuristic(ManhattanHeuristic):
+    """Manhattan distance plus linear conflicts in rows and columns.
+    
+    A vertical move can only change the conflicts of the two rows involved (the
+    order within the tile's column is unchanged), and a horizontal move only those
+    of the two columns, so ``update`` re-scores just those two lines.
+    """
+    
+    name = 'linear-conflict'
+    
+    def __init__(self, goal_board):
+        super().__init__(goal_board)
+        layout = self.layout
+        goal_positions = precompute_goal_positions(goal_board)
+        
+        self.goal_row = [-1] * layout.size
+        self.goal_col = [-1] * layout.size
+        for tile, (goal_i, goal_j) in goal_positions.items():
+            self.goal_row[tile] = goal_i
+            self.goal_col[tile] = goal_j
+        
+        cols = layout.cols
+        self.row_cells = [tuple(range(i * cols, (i + 1) * cols)) for i in range(layout.rows)]
+        self.col_cells = [tuple(range(j, layout.size, cols)) for j in range(cols)]
+        self._penalties = {}
+    
+    def _penalty(self, key, cells, line, own_line, along):
+        tile_at = self.layout.tile_at
+        goal_lines = tuple(
+            along[tile]
+            for tile in (tile_at(key, pos) for pos in cells)
+            if tile and own_line[tile] == line
+        )
+        penalty = self._penalties.get(goal_lines)
+        if penalty is None:
+            penalty = self._penalties[goal_lines] = _line_penalty(goal_lines)
+        return penalty
+    
+    def evaluate(self, key):
+        h = super().evaluate(key)
+        for i, cells in enumerate(self.row_cells):
+            h += self._penalty(key, cells, i, self.goal_row, self.goal_col)
+        for j, cells in enumerate(self.col_cells):
+            h += self._penalty(key, cells, j, self.goal_col, self.goal_row)
+        return h
+    
+    def update(self, h, key, tile, from_pos, to_pos):
+        h = super().update(h, key, tile, from_pos, to_pos)
+        cols = self.layout.cols
+        moved_key = self.layout.apply_move(key, to_pos, from_pos)
+        
+        if from_pos // cols != to_pos // cols:
+            lines = (from_pos // cols, to_pos // cols)
+            cells, own_line, along = self.row_cells, self.goal_row, self.goal_col
+        else:
+            lines = (from_pos % cols, to_pos % cols)
+            cells, own_line, along = self.col_cells, self.goal_col, self.goal_row
+        
+        for line in lines:
+            h -= self._penalty(key, cells[line], line, own_line, along)
+            h += self._penalty(moved_key, cells[line], line, own_line, along)
+        return h
+
+
+HEURISTICS = {}
+
+
+def register_heuristic(name, factory):
+    """Make ``factory(goal_board)`` selectable by ``name`` in the informed solvers.
+    
+    Heuristic objects provide ``evaluate(key)`` for the start state and
+    ``update(h, key, tile, from_pos, to_pos)`` returning h after one move.
+    """
+    HEURISTICS[name] = factory
+    return factory
+
+
+register_heuristic('manhattan', ManhattanHeuristic)
+register_heuristic('linear-conflict', LinearConflictHeuristic)
+register_heuristic('walking-distance', WalkingDistanceHeuristic)
+register_heuristic('pdb-663', lambda goal_board: PatternDatabaseHeuristic(goal_board, '6-6-3'))
+register_heuristic('pdb-78', lambda goal_board: PatternDatabaseHeuristic(goal_board, '7-8'))
+register_heuristic('distance-table', DistanceTableHeuristic)
+
+
+def make_heuristic(heuristic, goal_board):
+    """Resolve a heuristic name from ``HEURISTICS`` (or pass an instance through)."""
+    if not isinstance(heuristic, str):
+        return heuristic
+    if heuristic not in HEURISTICS:
+        raise KeyError(f"Unknown heuristic '{heuristic}' (known: {', '.join(HEURISTICS)})")
+    return HEURISTICS[heuristic](goal_board)
+
+
+def _weight_ratio(weight):
+    """``(num, den)`` with ``num / den == weight``, so ``den * g + num * h`` orders
+    boards by ``g + weight * h`` while staying an integer bucket index."""
+    ratio = Fraction(weight).limit_denominator(100)
+    if ratio < 1:
+        raise ValueError(f'A* weight must be at least 1, got {weight}')
+    return ratio.numerator, ratio.denominator
+
+
+def solve_astar(initial_board, goal_board, heuristic='manhattan', frontier='bucket', monitor=None, weight=1):
+    """A* algorithm for solving sliding puzzle.
+    
+    ``heuristic`` is a name from ``HEURISTICS`` (Manhattan distance by default) or
+    a heuristic instance. ``frontier`` picks the open list from ``FRONTIERS``:
+    ``'bucket'`` (one bucket per f, deepest g first) or ``'heap'`` (binary heap).
+    
+    ``weight`` > 1 runs weighted A*, ordering boards by g + weight * h. With a
+    consistent heuristic the path found is at most ``weight`` times longer than
+    optimal (expanded boards are never reopened, which keeps that bound).
+    """
+    start_time = time.perf_counter()
+    num, den = _weight_ratio(weight)
     
     initial_state = PuzzleState(initial_board)
+    goal_key = initial_state.layout.pack(goal_board)[0]
     
-    if initial_state.is_goal(goal_board):
-        return format_result([initial_state], 1, start_time)
+    if initial_state.key == goal_key:
+        return format_result(SolutionPath(initial_board), 1, start_time)
     
-    goal_positions = precompute_goal_positions(goal_board)
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
     
-    open_set = []
-    initial_h = manhattan_distance(initial_board, goal_positions)
-    heapq.heappush(open_set, (initial_h, id(initial_state), initial_state))
+    heuristic = make_heuristic(heuristic, goal_board)
+    update_h = heuristic.update
+    layout = initial_state.layout
+    tile_at = layout.tile_at
+    apply_move = layout.apply_move
+    neighbors = layout.neighbors
     
-    visited = set()
+    # Open-list entries are plain tuples (g, h, key, blank, move code).
+    open_set = make_frontier(frontier)
+    push = open_set.push
+    pop = open_set.pop
+    initial_h = heuristic.evaluate(initial_state.key)
+    push(num * initial_h, 0, (0, initial_h, initial_state.key, initial_state.blank, None))
+    
+    came_from = {}
     nodes_explored = 0
     
     while open_set:
-        _, _, current_state = heapq.heappop(open_set)
+        g, h, key, blank, code = pop()
         
-        state_tuple = current_state.get_board_tuple()
-        if state_tuple in visited:
+        if key in came_from:
             continue
         
-        visited.add(state_tuple)
+        came_from[key] = code
         nodes_explored += 1
+        if monitor is not None and not nodes_explored & PROGRESS_MASK:
+            monitor.report(nodes_explored)
         
-        if current_state.is_goal(goal_board):
-            solution_path = build_solution_path(current_state)
-            return format_result(solution_path, nodes_explored, start_time)
+        if key == goal_key:
+            moves = trace_moves(layout, came_from, key, blank)
+            return format_result(SolutionPath(initial_board, moves), nodes_explored, start_time)
+        
+        for target, action_name in neighbors[blank]:
+            next_key = apply_move(key, blank, target)
+            if next_key not in came_from:
+                next_h = update_h(h, key, tile_at(key, target), target, blank)
+                push(den * (g + 1) + num * next_h, g + 1, (g + 1, next_h, next_key, target, MOVE_CODES[action_name]))
+    
+    return None
+
+
+# Weights tried in turn by ``solve_anytime_astar``; the last one makes it exact.
+ANYTIME_WEIGHTS = (3, 2, 1.5, 1.25, 1)
+
+
+def solve_anytime_astar(initial_board, goal_board, heuristic='manhattan', weights=ANYTIME_WEIGHTS,
+                        time_budget=None, on_solution=None, monitor=None):
+    """Anytime repairing A* (ARA*, Likhachev et al. 2003).
+    
+    Runs weighted A* with each of ``weights`` in turn, reusing the search so far:
+    boards whose g improved after they were expanded are kept aside and reopened
+    for the next, smaller weight instead of starting over. Every result carries a
+    ``'bound'`` (its length is at most ``bound`` times the optimum; 1 means proven
+    optimal) and is passed to ``on_solution(result)`` and the monitor's
+    ``report_solution`` whenever the path gets shorter or the bound tighter.
+    
+    Stops once the bound reaches 1, or when ``time_budget`` seconds have passed
+    after a first solution, and returns the best result found.
+    """
+    start_time = time.perf_counter()
+    
+    def publish(result):
+        if on_solution is not None:
+            on_solution(result)
+        if monitor is not None:
+            monitor.report_solution(result)
+        return result
+    
+    initial_state = PuzzleState(initial_board)
+    layout = initial_state.layout
+    goal_key, goal_blank = layout.pack(goal_board)
+    
+    if initial_state.key == goal_key:
+        result = format_result(SolutionPath(initial_board), 1, start_time)
+        result['bound'] = 1
+        return publish(result)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
+    
+    heuristic = make_heuristic(heuristic, goal_board)
+    update_h = heuristic.update
+    tile_at = layout.tile_at
+    apply_move = layout.apply_move
+    neighbors = layout.neighbors
+    
+    start_key = initial_state.key
+    g_of = {start_key: 0}
+    h_of = {start_key: heuristic.evaluate(start_key)}
+    came_from = {start_key: None}
+    open_boards = {start_key: initial_state.blank}
+    inconsistent = {}
+    best = best_bound = None
+    nodes_explored = 0
+    
+    for weight in weights:
+        num, den = _weight_ratio(weight)
+        open_boards.update(inconsistent)
+        inconsistent = {}
+        closed = set()
+        open_set = make_frontier('bucket')
+        for key, blank in open_boards.items():
+            open_set.push(den * g_of[key] + num * h_of[key], g_of[key], (key, blank, g_of[key]))
+        
+        out_of_time = False
+        while open_set:
+            key, blank, g = open_set.pop()
+            if open_boards.get(key) != blank or g_of[key] != g:
+                continue
+            if goal_key in g_of and den * g_of[goal_key] <= den * g + num * h_of[key]:
+                break
+            
+            del open_boards[key]
+            closed.add(key)
+            nodes_explored += 1
+            if not nodes_explored & PROGRESS_MASK:
+                if monitor is not None:
+                    monitor.report(nodes_explored)
+                if best is not None and time_budget is not None and time.perf_counter() - start_time > time_budget:
+                    out_of_time = True
+                    break
+            
+            h = h_of[key]
+            for target, action_name in neighbors[blank]:
+                next_key = apply_move(key, blank, target)
+                if g_of.get(next_key, g + 2) <= g + 1:
+                    continue
+                g_of[next_key] = g + 1
+                came_from[next_key] = MOVE_CODES[action_name]
+                if next_key not in h_of:
+                    h_of[next_key] = update_h(h, key, tile_at(key, target), target, blank)
+                if next_key in closed:
+                    inconsistent[next_key] = target
+                else:
+                    open_boards[next_key] = target
+                    open_set.push(den * (g + 1) + num * h_of[next_key], g + 1, (next_key, target, g + 1))
+        
+        if out_of_time:
+            break
+        if goal_key not in g_of:
+            continue
+        
+        moves = g_of[goal_key]
+        lower = min(
+            (g_of[key] + h_of[key] for pending in (open_boards, inconsistent) for key in pending),
+            default=moves,
+        )
+        bound = max(1, min(Fraction(num, den), Fraction(moves, max(lower, 1))))
+        if best is None or moves < best['moves'] or bound < best_bound:
+            solution_path = SolutionPath(initial_board, trace_moves(layout, came_from, goal_key, goal_blank))
+            best = format_result(solution_path, nodes_explored, start_time)
+            best['bound'] = float(bound)
+            best_bound = bound
+            publish(best)
+        if bound == 1:
+            break
+    
+    return best
+
+
+def solve_idastar(initial_board, goal_board, max_depth=80, heuristic='manhattan', monitor=None,
+                  tt_bytes=DEFAULT_TT_BYTES):
+    """IDA* (iterative deepening A*), Manhattan distance heuristic by default.
+    
+    Runs depth-first searches bounded by f = g + h, raising the bound to the smallest
+    f that exceeded it on each iteration. Besides the current path, memory is a
+    ``TranspositionTable`` of at most ``tt_bytes`` shared by all iterations: a subtree
+    that fails stores the lower bound it proved, which replaces h when larger, so
+    boards reached again are cut off without re-expanding them. The search never
+    moves back to the parent, so a bound is only reused by visits from the same
+    parent (see ``game.transposition``). Pass ``tt_bytes=0`` for plain IDA*.
+    """
+    start_time = time.perf_counter()
+    
+    initial_state = PuzzleState(initial_board)
+    layout = initial_state.layout
+    goal_key = layout.pack(goal_board)[0]
+    
+    if initial_state.key == goal_key:
+        return format_result(SolutionPath(initial_board), 1, start_time)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
+    
+    heuristic = make_heuristic(heuristic, goal_board)
+    update_h = heuristic.update
+    tile_at = layout.tile_at
+    apply_move = layout.apply_move
+    neighbors = layout.neighbors
+    table = TranspositionTable(layout, tt_bytes) if tt_bytes else None
+    
+    found = -1
+    actions = []
+    nodes_explored = 0
+    
+    def search(key, blank, g, h, bound, previous_blank):
+        nonlocal nodes_explored
+        
+        # ``h`` stays the heuristic's own value so children can update it
+        # incrementally; only the pruning uses the table's tighter bound.
+        f_score = g + h
+        if table is not None:
+            stored = table.bound(key, previous_blank)
+            if g + stored > f_score:
+                f_score = g + stored
+        if f_score > bound:
+            return f_score
+        
+        nodes_explored += 1
+        if monitor is not None and not nodes_explored & PROGRESS_MASK:
+            monitor.report(nodes_explored)
+        if key == goal_key:
+            return found
+        
+        minimum = float('inf')
+        
+        for target, action_name in neighbors[blank]:
+            if target == previous_blank:
+                continue
+            
+            next_h = update_h(h, key, tile_at(key, target), target, blank)
+            
+            actions.append(action_name)
+            t = search(apply_move(key, blank, target), target, g + 1, next_h, bound, blank)
+            if t == found:
+                return found
+            actions.pop()
+            
+            if t < minimum:
+                minimum = t
         
-        for next_state in current_state.get_possible_moves():
-            next_tuple = next_state.get_board_tuple()
-            if next_tuple not in visited:
-                h_score = manhattan_distance(next_state.board, goal_positions)
-                g_score = next_state.level
-                f_score = g_score + h_score
-                heapq.heappush(open_set, (f_score, id(next_state), next_state))
+        if table is not None and minimum != float('inf'):
+            table.store(key, g, minimum - g, previous_blank)
+        return minimum
+    
+    initial_h = heuristic.evaluate(initial_state.key)
+    bound = initial_h
+    
+    while bound <= max_depth:
+        t = search(initial_state.key, initial_state.blank, 0, initial_h, bound, -1)
+        if t == found:
+            solution_path = SolutionPath(initial_board, encode_actions(actions))
+            return format_result(solution_path, nodes_explored, start_time)
+        if t == float('inf'):
+            return None
+        bound = t
     
     return None
+
+
+class _BidirectionalSide:
+    """One direction of ``solve_bidirectional_astar``: open list, best g per board
+    and a count of open boards per priority.
+    
+    ``to_goal`` estimates the distance to this side's target and ``to_start`` the
+    distance back to where it began. The counts give the smallest open priority
+    without scanning the open list; entries made stale by a better g are
+    discounted at once and skipped when popped.
+    """
+    
+    def __init__(self, key, blank, to_goal, to_start):
+        self.to_goal = to_goal
+        self.to_start = to_start
+        self.frontier = make_frontier('bucket')
+        self.best_g = {key: 0}
+        self.came_from = {key: None}
+        self.open = {}
+        self.counts = []
+        self.push(key, blank, 0, to_goal.evaluate(key), to_start.evaluate(key))
+    
+    def push(self, key, blank, g, h, back_h):
+        stale = self.open.get(key)
+        if stale is not None:
+            self.counts[2 * stale[0] + stale[1] - stale[2]] -= 1
+        self.open[key] = (g, h, back_h)
+        priority = 2 * g + h - back_h
+        while len(self.counts) <= priority:
+            self.counts.append(0)
+        self.counts[priority] += 1
+        self.frontier.push(priority, g, (g, h, back_h, key, blank))
+    
+    def pop(self):
+        """Open board with the lowest priority, as ``(g, h, back_h, key, blank)``."""
+        while True:
+            g, h, back_h, key, blank = self.frontier.pop()
+            if self.open.get(key) == (g, h, back_h):
+                del self.open[key]
+                self.counts[2 * g + h - back_h] -= 1
+                return g, h, back_h, key, blank
+    
+    def min_priority(self):
+        return next(priority for priority, count in enumerate(self.counts) if count)
+
+
+def solve_bidirectional_astar(initial_board, goal_board, heuristic='manhattan', monitor=None):
+    """Bidirectional heuristic search with a proof of optimality (DIBBS).
+    
+    A forward search from the start and a backward one from the goal. Each board
+    is scored 2g + h - h_back, where h estimates the distance to the side's target
+    and h_back the distance to its own root; subtracting h_back credits the part
+    of g the heuristic already accounts for, so the two searches meet near the
+    middle. The side with the lower smallest priority expands next. Every board
+    the other side has already reached gives a candidate path. The shortest, of
+    length U, is returned once ``U <= ceil((min_forward + min_backward) / 2)``,
+    which is a lower bound on any path not yet found.
+    
+    The backward heuristic is ``heuristic`` built with the start board as its
+    goal, so it has to work for any goal (pattern databases do not).
+    """
+    start_time = time.perf_counter()
+    
+    initial_state = PuzzleState(initial_board)
+    layout = initial_state.layout
+    goal_key, goal_blank = layout.pack(goal_board)
+    
+    if initial_state.key == goal_key:
+        return format_result(SolutionPath(initial_board), 1, start_time)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
+    
+    to_goal = make_heuristic(heuristic, goal_board)
+    to_start = make_heuristic(heuristic, initial_board)
+    forward = _BidirectionalSide(initial_state.key, initial_state.blank, to_goal, to_start)
+    backward = _BidirectionalSide(goal_key, goal_blank, to_start, to_goal)
+    tile_at = layout.tile_at
+    apply_move = layout.apply_move
+    neighbors = layout.neighbors
+    
+    best_length = float('inf')
+    meet = None
+    nodes_explored = 0
+    
+    # A side that runs out of boards has reached everything it can reach, so
+    # every meeting has been seen.
+    while forward.open and backward.open:
+        forward_min = forward.min_priority()
+        backward_min = backward.min_priority()
+        if best_length <= (forward_min + backward_min + 1) // 2:
+            break
+        
+        side, other = (forward, backward) if forward_min <= backward_min else (backward, forward)
+        g, h, back_h, key, blank = side.pop()
+        nodes_explored += 1
+        if monitor is not None and not nodes_explored & PROGRESS_MASK:
+            monitor.report(nodes_explored)
+        
+        update_h = side.to_goal.update
+        update_back_h = side.to_start.update
+        best_g = side.best_g
+        for target, action_name in neighbors[blank]:
+            next_key = apply_move(key, blank, target)
+            if best_g.get(next_key, g + 2) <= g + 1:
+                continue
+            tile = tile_at(key, target)
+            best_g[next_key] = g + 1
+            side.came_from[next_key] = MOVE_CODES[action_name]
+            side.push(
+                next_key, target, g + 1,
+                update_h(h, key, tile, target, blank), update_back_h(back_h, key, tile, target, blank),
+            )
+            
+            other_g = other.best_g.get(next_key)
+            if other_g is not None and g + 1 + other_g < best_length:
+                best_length = g + 1 + other_g
+                meet = (next_key, target)
+    
+    if meet is None:
+        return None
+    
+    meet_key, meet_blank = meet
+    moves = trace_moves(layout, forward.came_from, meet_key, meet_blank)
+    moves += _reverse_moves(trace_moves(layout, backward.came_from, meet_key, meet_blank))
+    return format_result(SolutionPath(initial_board, moves), nodes_explored, start_time)
+
+
+def solve_table3x3(initial_board, goal_board, monitor=None):
+    """Optimal 3x3 solver reading the complete distance table (``game.distance_table``).
+    
+    Every step goes to a neighbour one move closer to the goal, so the path takes
+    O(depth) table lookups, which are what ``nodes_explored`` counts. The table
+    for ``goal_board`` is built once (about a second) and cached on disk; solved
+    and unsolvable boards are answered without it.
+    """
+    start_time = time.perf_counter()
+    
+    check_board(initial_board)
+    check_board(goal_board)
+    if initial_board == goal_board:
+        return format_result(SolutionPath(initial_board), 1, start_time)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
+    
+    table = load_distance_table(goal_board)
+    actions, lookups = table.solve(initial_board)
+    return format_result(SolutionPath(initial_board, encode_actions(actions)), lookups, start_time)
+
+
+# Boards with more cells than this are left to ``solve_greedy``: the exact
+# solvers are exponential and a 5x5 board already takes them minutes or more.
+EXACT_SEARCH_MAX_CELLS = 16
+
+
+@lru_cache(maxsize=None)
+def _cell_distances(layout):
+    """``distance[a][b]``: Manhattan distance between cells ``a`` and ``b``."""
+    cols = layout.cols
+    return [
+        [abs(a // cols - b // cols) + abs(a % cols - b % cols) for b in range(layout.size)]
+        for a in range(layout.size)
+    ]
+
+
+def placement_stages(goal_board):
+    """Goal cells filled by ``solve_greedy``, grouped into stages placed in order.
+    
+    Rows are filled top-down while more than two remain, one tile at a time except
+    the last two of a row, which go in together. The last two rows are then filled
+    column by column, a column's two tiles together, leaving a 2x2 block whose
+    three tiles make the final stage. The goal blank must lie in that block.
+    """
+    rows = len(goal_board)
+    cols = len(goal_board[0])
+    if rows < 2 or cols < 2:
+        raise UnsupportedBoardError(f'solve_greedy needs at least a 2x2 board, got {rows}x{cols}')
+    
+    stages = []
+    for i in range(rows - 2):
+        stages.extend([i * cols + j] for j in range(cols - 2))
+        stages.append([i * cols + cols - 2, i * cols + cols - 1])
+    for j in range(cols - 2):
+        stages.append([(rows - 2) * cols + j, (rows - 1) * cols + j])
+    
+    block = [(rows - 2) * cols + cols - 2, (rows - 2) * cols + cols - 1,
+             (rows - 1) * cols + cols - 2, (rows - 1) * cols + cols - 1]
+    goal_flat = [value for row in goal_board for value in row]
+    if goal_flat.index(0) not in block:
+        raise UnsupportedBoardError('solve_greedy needs the goal blank in the bottom-right 2x2 block')
+    stages.append([cell for cell in block if goal_flat[cell] != 0])
+    return stages
+
+
+def _place_tiles(layout, frozen, blank, positions, targets, monitor=None, explored=0):
+    """Blank moves taking the tiles at ``positions`` to ``targets``.
+    
+    Weighted A* over just the blank and the moving tiles (at most three), so every
+    other free tile is interchangeable and the state space stays small on any board
+    size. h is the tiles' Manhattan distance plus the blank's walk to the nearest
+    misplaced tile, counted twice so the search heads straight for a placement.
+    Cells in ``frozen`` are never entered. Returns ``(actions, explored)``.
+    """
+    distance = _cell_distances(layout)
+    neighbors = layout.neighbors
+    goal_cells = tuple(targets)
+    
+    def h_of(blank, cells):
+        h = 0
+        approach = None
+        for cell, target in zip(cells, goal_cells):
+            if cell != target:
+                h += distance[cell][target]
+                walk = distance[blank][cell] - 1
+                if approach is None or walk < approach:
+                    approach = walk
+        return 2 * h + (approach or 0)
+    
+    start = (blank, *positions)
+    open_set = make_frontier('bucket')
+    open_set.push(h_of(blank, tuple(positions)), 0, (0, start, None, None))
+    came_from = {}
+    
+    while open_set:
+        g, state, parent, action = open_set.pop()
+        if state in came_from:
+            continue
+        
+        came_from[state] = (parent, action)
+        explored += 1
+        if monitor is not None and not explored & PROGRESS_MASK:
+            monitor.report(explored)
+        
+        cells = state[1:]
+        if cells == goal_cells:
+            actions = []
+            while action is not None:
+                actions.append(action)
+                state = parent
+                parent, action = came_from[state]
+            actions.reverse()
+            return actions, explored
+        
+        blank = state[0]
+        for target, action_name in neighbors[blank]:
+            if target in frozen:
+                continue
+            moved = tuple(blank if cell == target else cell for cell in cells)
+            next_state = (target, *moved)
+            if next_state not in came_from:
+                open_set.push(g + 1 + h_of(target, moved), g + 1, (g + 1, next_state, state, action_name))
+    
+    raise RuntimeError('Tiles cannot reach their goal cells (unsolvable stage)')
+
+
+def solve_greedy(initial_board, goal_board, monitor=None):
+    """Fast, suboptimal solver for boards of any shape (meant for 5x5 up to 8x8).
+    
+    Tiles are placed stage by stage in the order of ``placement_stages``; each stage
+    is a small weighted A* over the blank and at most three tiles, with every tile
+    already placed frozen. An 8x8 board takes a few hundred milliseconds, at the
+    cost of paths several times longer than optimal. ``nodes_explored`` counts the
+    stage searches' expansions.
+    """
+    start_time = time.perf_counter()
+    
+    layout = layout_for(initial_board)
+    if initial_board == goal_board:
+        return format_result(SolutionPath(initial_board), 1, start_time)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
+    
+    flat = [value for row in initial_board for value in row]
+    goal_flat = [value for row in goal_board for value in row]
+    where = {value: cell for cell, value in enumerate(flat)}
+    targets_of = layout.targets
+    
+    actions = []
+    frozen = set()
+    nodes_explored = 0
+    
+    for stage in placement_stages(goal_board):
+        tiles = [goal_flat[cell] for cell in stage]
+        stage_actions, nodes_explored = _place_tiles(
+            layout, frozen, where[0], [where[tile] for tile in tiles], stage, monitor, nodes_explored
+        )
+        
+        for action in stage_actions:
+            blank = where[0]
+            target = targets_of[blank][action]
+            tile = flat[target]
+            flat[blank], flat[target] = tile, 0
+            where[tile], where[0] = blank, target
+        
+        actions.extend(stage_actions)
+        frozen.update(stage)
+    
+    solution_path = SolutionPath(initial_board, encode_actions(actions))
+    return format_result(solution_path, nodes_explored, start_time)
+
+
+class _Reducer:
+    """Board state ``solve_reduction`` works on: tiles, frozen cells and the moves so far.
+    
+    Every move goes through ``slide``, so the board, the blank and ``actions`` never
+    drift apart. ``explored`` counts the cells the blank-routing BFS visits.
+    """
+    
+    def __init__(self, layout, flat, monitor=None):
+        self.layout = layout
+        self.flat = flat
+        self.where = {value: cell for cell, value in enumerate(flat)}
+        self.frozen = set()
+        self.actions = []
+        self.monitor = monitor
+        self.explored = 0
+    
+    def slide(self, target):
+        """Move the tile at ``target`` (next to the blank) into the blank."""
+        blank = self.where[0]
+        action = next(action for cell, action in self.layout.neighbors[blank] if cell == target)
+        tile = self.flat[target]
+        self.flat[blank], self.flat[target] = tile, 0
+        self.where[tile], self.where[0] = blank, target
+        self.actions.append(action)
+    
+    def blank_route(self, goal, avoid):
+        """Cells the blank walks through to reach ``goal`` without entering frozen
+        cells or ``avoid``; ``None`` if it cannot get there."""
+        start = self.where[0]
+        came_from = {start: None}
+        queue = deque([start])
+        
+        while queue:
+            cell = queue.popleft()
+            self.explored += 1
+            if self.monitor is not None and not self.explored & PROGRESS_MASK:
+                self.monitor.report(self.explored)
+            if cell == goal:
+                route = []
+                while cell != start:
+                    route.append(cell)
+                    cell = came_from[cell]
+                route.reverse()
+                return route
+            for target, _ in self.layout.neighbors[cell]:
+                if target not in came_from and target != avoid and target not in self.frozen:
+                    came_from[target] = cell
+                    queue.append(target)
+        
+        return None
+    
+    def move_tile(self, tile, goal):
+        """Walk ``tile`` to ``goal`` one cell at a time, bringing the blank round in
+        front of it each step by the shortest route that leaves the tile alone."""
+        distance = _cell_distances(self.layout)
+        
+        while (cell := self.where[tile]) != goal:
+            best = None
+            for step, _ in self.layout.neighbors[cell]:
+                if step in self.frozen or distance[step][goal] >= distance[cell][goal]:
+                    continue
+                route = self.blank_route(step, avoid=cell)
+                if route is not None and (best is None or len(route) < len(best)):
+                    best = route
+            if best is None:
+                raise RuntimeError(f'Tile {tile} is walled in on its way to cell {goal}')
+            for target in best:
+                self.slide(target)
+            self.slide(cell)
+    
+    def place_line(self, cells, tiles, across):
+        """Put ``tiles`` on ``cells`` (a row or column of the unsolved region, in
+        order) and freeze them. ``across`` is the index step from a cell of the line
+        to its neighbour in the next line of the region.
+        
+        The last two tiles cannot simply be walked in one after the other, so the
+        last one goes onto the second-last cell with the second-last one beside it
+        in the next line, and two moves turn the pair into place.
+        """
+        *head, x_cell, y_cell = cells
+        *head_tiles, x, y = tiles
+        
+        for cell, tile in zip(head, head_tiles):
+            self.move_tile(tile, cell)
+            self.frozen.add(cell)
+        
+        if self.where[x] == x_cell and self.where[y] == y_cell:
+            self.frozen.update((x_cell, y_cell))
+            return
+        
+        for _ in range(4):
+            self.move_tile(y, x_cell)
+            self.frozen.add(x_cell)
+            boxed_in = self.where[x] == y_cell or (
+                self.where[0] == y_cell and self.where[x] == y_cell + across
+            )
+            if not boxed_in:
+                break
+            # x is boxed into the end of the line behind y, or the blank is and
+            # only x can let it out: take x two lines further in and redo y.
+            self.frozen.discard(x_cell)
+            self.move_tile(x, x_cell + 2 * across)
+        else:
+            raise RuntimeError(f'Tile {x} keeps getting boxed in at cell {y_cell}')
+        
+        self.move_tile(x, x_cell + across)
+        self.frozen.add(x_cell + across)
+        for target in self.blank_route(y_cell, avoid=None):
+            self.slide(target)
+        self.slide(x_cell)
+        self.slide(x_cell + across)
+        self.frozen.discard(x_cell + across)
+        self.frozen.add(y_cell)
+
+
+def solve_reduction(initial_board, goal_board, exact_side=3, monitor=None):
+    """Constructive solver for boards of any size: solve the top row or the left
+    column of the unsolved region, shrink the region and repeat.
+    
+    The longer side is reduced first, until the region is at most
+    ``exact_side`` x ``exact_side`` (3 or 4); that remainder is relabelled and
+    handed to IDA* with linear conflict, so the last moves are optimal. Each tile
+    is walked in with O(rows + cols) moves, O(n^3) in total for an n x n board.
+    The only search before the hand-off is the BFS that routes the blank, which
+    seldom leaves the tile's neighbourhood; an 8x8 board takes milliseconds. A
+    scrambled 4x4 remainder can keep IDA* busy for minutes, so 3 is the default.
+    The goal blank must lie in the bottom-right ``exact_side`` x ``exact_side`` block.
+    """
+    start_time = time.perf_counter()
+    
+    if exact_side not in (3, 4):
+        raise ValueError(f'exact_side must be 3 or 4, got {exact_side}')
+    
+    layout = layout_for(initial_board)
+    rows, cols = layout.rows, layout.cols
+    goal_flat = [value for row in goal_board for value in row]
+    blank_goal = goal_flat.index(0)
+    if blank_goal // cols < rows - exact_side or blank_goal % cols < cols - exact_side:
+        raise UnsupportedBoardError(
+            f'solve_reduction needs the goal blank in the bottom-right {exact_side}x{exact_side} block'
+        )
+    
+    if initial_board == goal_board:
+        return format_result(SolutionPath(initial_board), 1, start_time)
+    
+    if not is_solvable(initial_board, goal_board):
+        return format_unsolvable(start_time)
+    
+    reducer = _Reducer(layout, [value for row in initial_board for value in row], monitor)
+    top = left = 0
+    
+    while rows - top > exact_side or cols - left > exact_side:
+        if rows - top >= cols - left:
+            cells = [top * cols + j for j in range(left, cols)]
+            reducer.place_line(cells, [goal_flat[cell] for cell in cells], across=cols)
+            top += 1
+        else:
+            cells = [i * cols + left for i in range(top, rows)]
+            reducer.place_line(cells, [goal_flat[cell] for cell in cells], across=1)
+            left += 1
+    
+    # Relabel the remainder 1..k in goal order so it packs as a small board.
+    region = [[i * cols + j for j in range(left, cols)] for i in range(top, rows)]
+    tiles = [goal_flat[cell] for line in region for cell in line if goal_flat[cell]]
+    labels = {tile: rank for rank, tile in enumerate(tiles, start=1)}
+    labels[0] = 0
+    sub_initial = [[labels[reducer.flat[cell]] for cell in line] for line in region]
+    sub_goal = [[labels[goal_flat[cell]] for cell in line] for line in region]
+    
+    result = solve_idastar(sub_initial, sub_goal, heuristic='linear-conflict', monitor=monitor)
+    
+    moves = encode_actions(reducer.actions) + result['move_sequence']
+    solution_path = SolutionPath(initial_board, moves)
+    return format_result(solution_path, reducer.explored + result['nodes_explored'], start_time)
+
+
+def solve_auto(initial_board, goal_board, monitor=None):
+    """Optimal IDA* (linear conflict) up to ``EXACT_SEARCH_MAX_CELLS`` cells, ``solve_greedy`` above."""
+    cells = len(initial_board) * len(initial_board[0])
+    if cells <= EXACT_SEARCH_MAX_CELLS:
+        return solve_idastar(initial_board, goal_board, heuristic='linear-conflict', monitor=monitor)
+    return solve_greedy(initial_board, goal_board, monitor=monitor)
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from .packed_board import BoardLayout, layout_for
+
 
 class PuzzleState:
     """Immutable-ish representation of a puzzle board for search algorithms.
 
+    The board is held as a packed integer key (see ``BoardLayout``) together with the
+    blank index, so successors are produced by shifting and masking rather than by
+    copying rows. ``board`` is decoded on demand for the UI and printed output.
+    Informed solvers also carry the heuristic value ``h`` and update it per move.
+
     Each state keeps a parent link so solvers can reconstruct the solution path.
     """
 
+    __slots__ = ("layout", "key", "blank", "parent", "action", "level", "h")
+
     def __init__(
         self,
         board: list[list[int]],
@@ -14,55 +23,90 @@ class PuzzleState:
         action: str | None = None,
         level: int = 0,
     ):
-        self.board = [row[:] for row in board]
+        self.layout = layout_for(board)
+        self.key, self.blank = self.layout.pack(board)
         self.parent = parent
         self.action = action
         self.level = level
-        self.blank_pos = self.find_blank()
+        self.h = 0
+
+    @classmethod
+    def from_packed(
+        cls,
+        layout: BoardLayout,
+        key: int,
+        blank: int,
+        parent: PuzzleState | None = None,
+        action: str | None = None,
+        level: int = 0,
+    ) -> PuzzleState:
+        state = cls.__new__(cls)
+        state.layout = layout
+        state.key = key
+        state.blank = blank
+        state.parent = parent
+        state.action = action
+        state.level = level
+        state.h = 0
+        return state
+
+    @property
+    def board(self) -> list[list[int]]:
+        return self.layout.unpack(self.key)
+
+    @property
+    def blank_pos(self) -> tuple[int, int] | None:
+        if self.blank < 0:
+            return None
+        return divmod(self.blank, self.layout.cols)
 
     def find_blank(self) -> tuple[int, int] | None:
-        for i, row in enumerate(self.board):
-            for j, value in enumerate(row):
-                if value == 0:
-                    return (i, j)
-        return None
+        return self.blank_pos
 
-    def get_possible_moves(self) -> list[PuzzleState]:
-        """Return a list of next states reachable with one blank move."""
+    def get_possible_moves(self, heuristic=None) -> list[PuzzleState]:
+        """Return a list of next states reachable with one blank move.
+
+        When a heuristic is given, each child's ``h`` is derived from this state's
+        ``h`` using only the tile that slid (``heuristic.update``).
+        """
 
         moves: list[PuzzleState] = []
-        if self.blank_pos is None:
+        if self.blank < 0:
             return moves
 
-        row, col = self.blank_pos
-        n = len(self.board)
-        m = len(self.board[0])
-
-        directions = [(-1, 0, "UP"), (1, 0, "DOWN"), (0, -1, "LEFT"), (0, 1, "RIGHT")]
-
-        for dr, dc, action_name in directions:
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < n and 0 <= new_col < m:
-                new_board = [r[:] for r in self.board]
-                new_board[row][col], new_board[new_row][new_col] = new_board[new_row][new_col], new_board[row][col]
+        layout = self.layout
+        key = self.key
+        blank = self.blank
+        level = self.level + 1
 
-                moves.append(PuzzleState(new_board, parent=self, action=action_name, level=self.level + 1))
+        for target, action_name in layout.neighbors[blank]:
+            new_key = layout.apply_move(key, blank, target)
+            child = PuzzleState.from_packed(layout, new_key, target, self, action_name, level)
+            if heuristic is not None:
+                child.h = heuristic.update(self.h, key, layout.tile_at(key, target), target, blank)
+            moves.append(child)
 
         return moves
 
-    def is_goal(self, goal_board: list[list[int]]) -> bool:
-        return self.board == goal_board
+    def is_goal(self, goal: list[list[int]] | int) -> bool:
+        """Compare against a goal board or an already packed goal key."""
+
+        if isinstance(goal, int):
+            return self.key == goal
+        if len(goal) != self.layout.rows or len(goal[0]) != self.layout.cols:
+            return False
+        return self.key == self.layout.pack(goal)[0]
 
     def get_board_tuple(self) -> tuple[tuple[int, ...], ...]:
-        return tuple(tuple(row) for row in self.board)
+        return self.layout.to_tuple(self.key)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, PuzzleState):
             return False
-        return self.get_board_tuple() == other.get_board_tuple()
+        return self.layout is other.layout and self.key == other.key
 
     def __hash__(self) -> int:
-        return hash(self.get_board_tuple())
+        return hash(self.key)
 
     def __repr__(self) -> str:
         return f"PuzzleState(level={self.level}, action={self.action})"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+
+# Solvers report every PROGRESS_INTERVAL expanded nodes (a power of two, so the
+# check in the hot loop is a single mask).
+PROGRESS_INTERVAL = 1024
+PROGRESS_MASK = PROGRESS_INTERVAL - 1
+
+
+class SearchCancelled(Exception):
+    """Raised inside a solver when its monitor has been cancelled."""
+
+
+class SearchMonitor:
+    """Progress and cancellation shared between a running solver and its watcher.
+
+    Solvers accept ``monitor=None`` and call ``report(nodes_explored)`` every
+    ``PROGRESS_INTERVAL`` nodes; ``report`` raises ``SearchCancelled`` once
+    ``cancel()`` has been called from any thread. Anytime solvers also hand each
+    improved result to ``report_solution``, kept in ``solution``.
+    """
+
+    __slots__ = ("nodes_explored", "start_time", "solution", "_cancelled")
+
+    def __init__(self):
+        self.nodes_explored = 0
+        self.start_time = time.perf_counter()
+        self.solution: dict[str, object] | None = None
+        self._cancelled = threading.Event()
+
+    def report(self, nodes_explored: int) -> None:
+        self.nodes_explored = nodes_explored
+        if self._cancelled.is_set():
+            raise SearchCancelled(f"Search cancelled after {nodes_explored} nodes")
+
+    def report_solution(self, result: dict[str, object]) -> None:
+        self.solution = result
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+from .packed_board import layout_for
+from .puzzle_state import PuzzleState
+
+Board = list[list[int]]
+
+MOVE_CODES: dict[str, str] = {"UP": "U", "DOWN": "D", "LEFT": "L", "RIGHT": "R"}
+ACTIONS_BY_CODE: dict[str, str] = {code: action for action, code in MOVE_CODES.items()}
+
+
+def encode_actions(actions: Sequence[str]) -> str:
+    """``["UP", "LEFT"]`` -> ``"UL"``."""
+
+    return "".join(MOVE_CODES[action] for action in actions)
+
+
+class SolutionPath(Sequence):
+    """A solver's answer as the start board plus a move string such as ``"ULDR"``.
+
+    It stands in for the old list of ``PuzzleState``: ``len()``, indexing and
+    iteration replay the states lazily from the packed start key, so only the moves
+    are stored, pickled or sent between processes. Indexing replays from the start;
+    iterate (or use ``boards()``) to walk the whole path.
+    """
+
+    __slots__ = ("layout", "start_key", "start_blank", "moves")
+
+    def __init__(self, initial_board: Board, moves: str = ""):
+        self.layout = layout_for(initial_board)
+        self.start_key, self.start_blank = self.layout.pack(initial_board)
+        self.moves = moves
+
+    @property
+    def initial_board(self) -> Board:
+        return self.layout.unpack(self.start_key)
+
+    @property
+    def actions(self) -> list[str]:
+        return [ACTIONS_BY_CODE[code] for code in self.moves]
+
+    def _replay(self, stop: int | None = None) -> Iterator[PuzzleState]:
+        layout = self.layout
+        key, blank = self.start_key, self.start_blank
+        yield PuzzleState.from_packed(layout, key, blank)
+
+        for level, code in enumerate(self.moves[:stop], start=1):
+            action = ACTIONS_BY_CODE[code]
+            target = layout.targets[blank].get(action)
+            if target is None:
+                raise ValueError(f"Invalid move '{action}' from blank index {blank}")
+            key = layout.apply_move(key, blank, target)
+            blank = target
+            yield PuzzleState.from_packed(layout, key, blank, action=action, level=level)
+
+    def __iter__(self) -> Iterator[PuzzleState]:
+        return self._replay()
+
+    def boards(self) -> Iterator[Board]:
+        """Replay the boards one at a time, e.g. for animation."""
+
+        for state in self._replay():
+            yield state.board
+
+    def __len__(self) -> int:
+        return len(self.moves) + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("solution path index out of range")
+
+        state = None
+        for state in self._replay(index):
+            pass
+        return state
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SolutionPath):
+            return NotImplemented
+        return self.layout is other.layout and self.start_key == other.start_key and self.moves == other.moves
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return (SolutionPath, (self.initial_board, self.moves))
+
+    def __repr__(self) -> str:
+        return f"SolutionPath(moves={self.moves!r})"
+
+
+def iter_boards(solution_path: Sequence[PuzzleState]) -> Iterator[Board]:
+    """Boards along a ``SolutionPath`` or a plain list of states."""
+
+    if isinstance(solution_path, SolutionPath):
+        return solution_path.boards()
+    return (state.board for state in solution_path)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+from .search_monitor import SearchCancelled, SearchMonitor
+
+Board = list[list[int]]
+
+
+class SolverWorker:
+    """Runs one solver on a daemon thread so the pygame loop keeps drawing.
+
+    The UI polls ``done`` and ``progress()`` once per frame and calls ``cancel()``
+    to stop the search at its next progress report. Afterwards exactly one of
+    ``result``, ``cancelled`` or ``error`` describes the outcome; cancelling an
+    anytime solver that has already found a solution keeps the best one as
+    ``result``.
+    """
+
+    def __init__(
+        self,
+        solver: Callable[..., dict[str, object] | None],
+        initial_board: Board,
+        goal_board: Board,
+        label: str,
+    ):
+        self.label = label
+        self.monitor = SearchMonitor()
+        self.result: dict[str, object] | None = None
+        self.error: BaseException | None = None
+        self.cancelled = False
+        self.elapsed = 0.0
+
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(solver, [row[:] for row in initial_board], [row[:] for row in goal_board]),
+            name=f"solver-{label}",
+            daemon=True,
+        )
+
+    def start(self) -> SolverWorker:
+        self._thread.start()
+        return self
+
+    def _run(self, solver, initial_board: Board, goal_board: Board) -> None:
+        try:
+            self.result = solver(initial_board, goal_board, monitor=self.monitor)
+        except SearchCancelled:
+            if self.monitor.solution is not None:
+                self.result = self.monitor.solution
+            else:
+                self.cancelled = True
+        except Exception as exc:  # surfaced to the UI thread via ``error``
+            self.error = exc
+        finally:
+            self.elapsed = self.monitor.elapsed
+
+    @property
+    def done(self) -> bool:
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def progress(self) -> tuple[int, float]:
+        """``(nodes_explored, elapsed_seconds)`` as last reported by the solver."""
+
+        if self.done:
+            return self.monitor.nodes_explored, self.elapsed
+        return self.monitor.nodes_explored, self.monitor.elapsed
+
+    def best_moves(self) -> int | None:
+        """Length of the best solution an anytime solver has reported so far."""
+
+        solution = self.monitor.solution
+        return None if solution is None else int(solution["moves"])
+
+    def cancel(self) -> None:
+        self.monitor.cancel()
+
+    def join(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
@@ -0,0 +1,152 @@
+"""Bounded transposition table for the depth-first solvers.
+
+Entries map a packed board key to the smallest depth ``g`` it was reached at and
+a proven lower bound on its distance to the goal (``bound``).
+
+* A single depth-limited DFS skips a board reached again at ``g >= best_g``: the
+  earlier visit had at least as much depth left. A shorter route re-opens it.
+* Iterative searches (IDDFS, IDA*) store ``bound`` when a subtree fails: the goal
+  is not within the depth that was left. Later visits prune with
+  ``g + bound > limit``, inside one iteration and across iterations.
+
+Those searches never move the blank straight back to the cell it came from, so a
+failed subtree only proves its bound for paths that do not start with that move.
+The entry records the excluded cell, and ``bound`` only returns it to a visit that
+excludes the same cell (one that arrived from the same parent). A bound proven
+with nothing excluded, e.g. at the root, holds for every visit.
+
+Storage is a fixed number of two-slot buckets in flat ``array`` columns, sized
+from a byte limit. Slot 0 keeps the shallower entry (it summarises a bigger
+subtree); slot 1 is always replaced.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from .packed_board import BoardLayout
+
+DEFAULT_TT_BYTES = 16 * 1024 * 1024
+
+# Bytes per entry for layouts whose keys fit in 64 bits: key + g + bound + excluded.
+_ENTRY_BYTES = 8 + 1 + 1 + 1
+# Larger keys live in a list of Python ints: pointer plus a ~40-byte int object.
+_LIST_ENTRY_BYTES = 8 + 40 + 1 + 1 + 1
+
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MAX_VALUE = 255
+
+
+class TranspositionTable:
+    """Fixed-capacity hash table of ``key -> (g, lower bound)``.
+
+    ``max_bytes`` caps the memory used by the columns; capacity is the largest
+    power of two that fits. Key 0 is the empty marker (a packed board always has
+    non-zero tiles).
+    """
+
+    __slots__ = ("capacity", "memory_bytes", "_mask", "_keys", "_g", "_bound", "_excluded", "stores", "hits")
+
+    def __init__(self, layout: BoardLayout, max_bytes: int = DEFAULT_TT_BYTES):
+        wide = layout.size * layout.cell_bits > 64
+        entry_bytes = _LIST_ENTRY_BYTES if wide else _ENTRY_BYTES
+
+        capacity = 2
+        while capacity * 2 * entry_bytes <= max_bytes:
+            capacity *= 2
+        self.capacity = capacity
+        self.memory_bytes = capacity * entry_bytes
+        self._mask = capacity // 2 - 1
+
+        self._keys = [0] * capacity if wide else array("Q", bytes(8 * capacity))
+        self._g = array("B", bytes(capacity))
+        self._bound = array("B", bytes(capacity))
+        # Excluded blank cell plus one; 0 when the bound holds for every first move.
+        self._excluded = array("B", bytes(capacity))
+        self.stores = 0
+        self.hits = 0
+
+    def _slot(self, key: int) -> int:
+        return ((((key * _MULTIPLIER) >> 29) ^ key) & self._mask) * 2
+
+    def _find(self, key: int) -> int:
+        slot = self._slot(key)
+        keys = self._keys
+        if keys[slot] == key:
+            self.hits += 1
+            return slot
+        if keys[slot + 1] == key:
+            self.hits += 1
+            return slot + 1
+        return -1
+
+    def bound(self, key: int, excluded: int = -1) -> int:
+        """Stored lower bound on the distance from ``key`` to the goal, 0 if unknown.
+
+        ``excluded`` is the cell the visiting search will not move the blank to
+        (-1 for none); bounds proven with another cell excluded are not returned.
+        """
+
+        index = self._find(key)
+        if index < 0:
+            return 0
+        stored = self._excluded[index]
+        return self._bound[index] if stored == 0 or stored == excluded + 1 else 0
+
+    def best_g(self, key: int) -> int:
+        """Smallest depth ``key`` was stored at, or 255 when it is not in the table."""
+
+        index = self._find(key)
+        return _MAX_VALUE if index < 0 else self._g[index]
+
+    def store(self, key: int, g: int, bound: int, excluded: int = -1) -> None:
+        """Record ``key`` reached at depth ``g``, at least ``bound`` moves from the goal
+        by any path whose first move is not to the cell ``excluded`` (-1 for none).
+
+        An existing entry keeps the smaller ``g``. Bounds with the same exclusion keep
+        the larger one. Bounds excluding two different cells together cover every
+        first move, so the smaller holds with nothing excluded. Otherwise the larger
+        bound is kept, with its own exclusion.
+        """
+
+        slot = self._slot(key)
+        keys = self._keys
+        g = min(g, _MAX_VALUE)
+        bound = min(bound, _MAX_VALUE)
+        excluded += 1
+        self.stores += 1
+
+        for index in (slot, slot + 1):
+            if keys[index] == key:
+                if g < self._g[index]:
+                    self._g[index] = g
+                stored_bound = self._bound[index]
+                stored_excluded = self._excluded[index]
+                if stored_excluded == excluded:
+                    if bound > stored_bound:
+                        self._bound[index] = bound
+                elif stored_excluded and excluded:
+                    self._bound[index] = min(bound, stored_bound)
+                    self._excluded[index] = 0
+                elif bound > stored_bound:
+                    self._bound[index] = bound
+                    self._excluded[index] = excluded
+                return
+
+        if keys[slot] == 0 or g <= self._g[slot]:
+            # Depth-preferred slot: move its entry to the always-replace slot.
+            keys[slot + 1] = keys[slot]
+            self._g[slot + 1] = self._g[slot]
+            self._bound[slot + 1] = self._bound[slot]
+            self._excluded[slot + 1] = self._excluded[slot]
+            index = slot
+        else:
+            index = slot + 1
+
+        keys[index] = key
+        self._g[index] = g
+        self._bound[index] = bound
+        self._excluded[index] = excluded
+
+    def __len__(self) -> int:
+        return sum(1 for key in self._keys if key)
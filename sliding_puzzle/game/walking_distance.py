@@ -0,0 +1,159 @@
+"""Walking distance heuristic (Takahashi) for boards up to 4x4.
+
+The vertical part of walking distance only tracks, for every row, how many tiles it
+holds from each goal row plus the row of the blank. A move of the blank up or down
+carries one tile between neighbouring rows, so the minimum number of vertical moves
+for every such configuration can be precomputed with a BFS from the goal. The
+horizontal part is the same table built over columns; the heuristic is the sum.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+
+from .packed_board import BoardLayout, UnsupportedBoardError, layout_for
+
+Board = list[list[int]]
+
+MAX_SIDE = 4
+# Per-axis codes remembered for recently seen keys; the cache is emptied when full.
+CODE_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=None)
+def build_walking_table(lines: int, line_length: int, goal_blank_line: int) -> dict[int, int]:
+    """BFS over line-occupancy configurations; returns ``{code: distance}``.
+
+    A configuration is ``lines x lines`` counts (tiles in line ``i`` whose goal is
+    line ``j``) plus the blank's line, encoded as a mixed-radix int by ``encode``.
+    """
+
+    start = [[0] * lines for _ in range(lines)]
+    for i in range(lines):
+        start[i][i] = line_length - (1 if i == goal_blank_line else 0)
+
+    base = line_length + 1
+    start_code = encode(start, goal_blank_line, lines, base)
+    table = {start_code: 0}
+    queue = deque([(start, goal_blank_line, 0)])
+
+    while queue:
+        counts, blank_line, distance = queue.popleft()
+        for other in (blank_line - 1, blank_line + 1):
+            if not 0 <= other < lines:
+                continue
+            for goal_line in range(lines):
+                if counts[other][goal_line] == 0:
+                    continue
+                moved = [row[:] for row in counts]
+                moved[other][goal_line] -= 1
+                moved[blank_line][goal_line] += 1
+                code = encode(moved, other, lines, base)
+                if code not in table:
+                    table[code] = distance + 1
+                    queue.append((moved, other, distance + 1))
+
+    return table
+
+
+def encode(counts: list[list[int]], blank_line: int, lines: int, base: int) -> int:
+    code = 0
+    for i in range(lines):
+        for j in range(lines):
+            code = code * base + counts[i][j]
+    return code * lines + blank_line
+
+
+class WalkingDistanceHeuristic:
+    """Vertical plus horizontal walking distance on packed boards.
+
+    ``update`` only touches the axis the move travels along: a vertical move leaves
+    the column configuration (and its table value) unchanged, and vice versa. The
+    codes of the parent come from a bounded cache filled by ``evaluate`` and by
+    earlier updates, and the child's code differs from it only by the moved tile's
+    and the blank's terms, so an update costs O(1) unless the parent was evicted.
+    """
+
+    name = "walking-distance"
+
+    def __init__(self, goal_board: Board):
+        self.layout = layout = layout_for(goal_board)
+        if layout.rows > MAX_SIDE or layout.cols > MAX_SIDE:
+            raise UnsupportedBoardError(f"Walking distance tables are only built for boards up to {MAX_SIDE}x{MAX_SIDE}")
+
+        goal_key, goal_blank = layout.pack(goal_board)
+        if goal_blank < 0:
+            raise ValueError("Goal board does not contain a blank tile (0)")
+        goal_row = [0] * layout.size
+        goal_col = [0] * layout.size
+        for pos in range(layout.size):
+            tile = layout.tile_at(goal_key, pos)
+            goal_row[tile], goal_col[tile] = divmod(pos, layout.cols)
+
+        blank_row, blank_col = divmod(goal_blank, layout.cols)
+        self.row_table = build_walking_table(layout.rows, layout.cols, blank_row)
+        self.col_table = build_walking_table(layout.cols, layout.rows, blank_col)
+
+        # Per-cell, per-tile code weights so a configuration code is a plain sum.
+        self.row_weight = self._weights(layout, goal_row, lambda pos: pos // layout.cols, layout.rows, layout.cols + 1)
+        self.col_weight = self._weights(layout, goal_col, lambda pos: pos % layout.cols, layout.cols, layout.rows + 1)
+        self.row_of = [pos // layout.cols for pos in range(layout.size)]
+        self.col_of = [pos % layout.cols for pos in range(layout.size)]
+        self.shift = [pos * layout.cell_bits for pos in range(layout.size)]
+        self._code_cache: dict[int, tuple[int, int]] = {}
+
+    @staticmethod
+    def _weights(layout: BoardLayout, goal_line, line_of, lines: int, base: int) -> list[list[int]]:
+        weights = [[0] * layout.size for _ in range(layout.size)]
+        for pos in range(layout.size):
+            line = line_of(pos)
+            for tile in range(1, layout.size):
+                digit = line * lines + goal_line[tile]
+                weights[pos][tile] = base ** (lines * lines - 1 - digit) * lines
+        return weights
+
+    def _codes(self, key: int) -> tuple[int, int]:
+        layout = self.layout
+        row_code = col_code = 0
+        blank = -1
+        for pos in range(layout.size):
+            tile = layout.tile_at(key, pos)
+            if tile == 0:
+                blank = pos
+                continue
+            row_code += self.row_weight[pos][tile]
+            col_code += self.col_weight[pos][tile]
+        return row_code + self.row_of[blank], col_code + self.col_of[blank]
+
+    def _cached_codes(self, key: int) -> tuple[int, int]:
+        codes = self._code_cache.get(key)
+        if codes is None:
+            codes = self._codes(key)
+            self._remember(key, codes)
+        return codes
+
+    def _remember(self, key: int, codes: tuple[int, int]) -> None:
+        cache = self._code_cache
+        if len(cache) >= CODE_CACHE_SIZE:
+            cache.clear()
+        cache[key] = codes
+
+    def evaluate(self, key: int) -> int:
+        row_code, col_code = self._cached_codes(key)
+        return self.row_table[row_code] + self.col_table[col_code]
+
+    def update(self, h: int, key: int, tile: int, from_pos: int, to_pos: int) -> int:
+        # The blank moves from to_pos to from_pos while the tile goes the other way.
+        row_code, col_code = self._cached_codes(key)
+        child = key - (tile << self.shift[from_pos]) + (tile << self.shift[to_pos])
+        if self.row_of[from_pos] != self.row_of[to_pos]:
+            row_of, weight = self.row_of, self.row_weight
+            moved = row_code - weight[from_pos][tile] + weight[to_pos][tile] - row_of[to_pos] + row_of[from_pos]
+            self._remember(child, (moved, col_code))
+            return h - self.row_table[row_code] + self.row_table[moved]
+
+        col_of, weight = self.col_of, self.col_weight
+        moved = col_code - weight[from_pos][tile] + weight[to_pos][tile] - col_of[to_pos] + col_of[from_pos]
+        self._remember(child, (row_code, moved))
+        return h - self.col_table[col_code] + self.col_table[moved]
@@ -1,89 +1,149 @@
+import logging
 import sys
+from functools import partial
 
 import pygame
 
 from game.puzzle_game import PuzzleGame
-from game.puzzle_solver import solve_astar, solve_bfs, solve_dfs
+from game.puzzle_solver import (
+    is_unsolvable,
+    solve_anytime_astar,
+    solve_astar,
+    solve_bfs,
+    solve_bidirectional_bfs,
+    solve_dfs,
+    solve_greedy,
+    solve_idastar,
+    solve_reduction,
+    solve_table3x3,
+)
+from game.solver_worker import SolverWorker
+from ui.animation import SolutionAnimator
 from ui.metrics_window import MetricsWindow
 from ui.screens import GameScreen, MenuScreen
-from utils.constants import COLOR_BACKGROUND, FPS, SOLVER_DELAY_MS, WINDOW_HEIGHT, WINDOW_WIDTH
-
-
-def animate_solution(
-    game: PuzzleGame,
-    screen: pygame.Surface,
-    game_screen: GameScreen,
-    solution_path,
-    *,
-    metrics_window: MetricsWindow | None = None,
-) -> None:
-    """Animate a solver's solution path by stepping through board states."""
-
-    game.is_animating = True
-
-    for state in solution_path:
-        game.apply_board_state(state.board)
-
-        screen.fill(COLOR_BACKGROUND)
-        game_screen.render(screen, game)
-        pygame.display.flip()
-
-        pygame.time.delay(SOLVER_DELAY_MS)
-
-        for event in pygame.event.get():
-            if metrics_window is not None:
-                metrics_window.handle_event(event)
-
-            if event.type == pygame.QUIT:
-                if metrics_window is not None:
-                    metrics_window.close()
-                pygame.quit()
-                sys.exit()
-
-    game.is_animating = False
-
-
-def solve_and_animate(
-    game: PuzzleGame,
-    screen: pygame.Surface,
-    game_screen: GameScreen,
-    solver_func,
-    algorithm_label: str,
-    *,
-    metrics_window: MetricsWindow | None = None,
-) -> dict[str, object] | None:
-    """Run a solver, record its metrics, and animate its solution path."""
-
-    if game.is_animating or game_screen.is_solving:
+from utils.constants import FPS, WINDOW_HEIGHT, WINDOW_WIDTH
+
+logger = logging.getLogger(__name__)
+
+# ARA* keeps improving its solution until proven optimal or this many seconds pass.
+ANYTIME_TIME_BUDGET = 10.0
+
+# GameScreen action -> (solver, label shown in the metrics table)
+SOLVER_ACTIONS = {
+    "solve_bfs": (solve_bfs, "BFS"),
+    "solve_dfs": (solve_dfs, "DFS"),
+    "solve_astar": (solve_astar, "A*"),
+    "solve_idastar": (solve_idastar, "IDA*"),
+    "solve_bidirectional_bfs": (solve_bidirectional_bfs, "Bi-BFS"),
+    "solve_greedy": (solve_greedy, "Greedy"),
+    "solve_reduction": (solve_reduction, "Reduction"),
+    "solve_anytime": (
+        partial(solve_anytime_astar, heuristic="linear-conflict", time_budget=ANYTIME_TIME_BUDGET),
+        "ARA*",
+    ),
+    "solve_table3x3": (solve_table3x3, "Table"),
+}
+
+SOLVER_KEYS = {
+    pygame.K_SPACE: "solve_bfs",
+    pygame.K_s: "solve_dfs",
+    pygame.K_a: "solve_astar",
+    pygame.K_i: "solve_idastar",
+    pygame.K_b: "solve_bidirectional_bfs",
+    pygame.K_g: "solve_greedy",
+    pygame.K_d: "solve_reduction",
+    pygame.K_w: "solve_anytime",
+    pygame.K_t: "solve_table3x3",
+}
+
+
+# Keys handled while a solution is being played back.
+PLAYBACK_KEYS = {
+    pygame.K_p: "toggle_pause",
+    pygame.K_SPACE: "toggle_pause",
+    pygame.K_n: "step",
+    pygame.K_RIGHT: "step",
+    pygame.K_PLUS: "speed_up",
+    pygame.K_EQUALS: "speed_up",
+    pygame.K_KP_PLUS: "speed_up",
+    pygame.K_UP: "speed_up",
+    pygame.K_MINUS: "slow_down",
+    pygame.K_KP_MINUS: "slow_down",
+    pygame.K_DOWN: "slow_down",
+    pygame.K_END: "skip_to_end",
+    pygame.K_RETURN: "skip_to_end",
+    pygame.K_ESCAPE: "stop",
+}
+
+
+class Playback:
+    """A solution being animated on the game board, restored to ``starting_board`` when done."""
+
+    def __init__(self, game: PuzzleGame, game_screen: GameScreen, solution_path):
+        self.game = game
+        self.game_screen = game_screen
+        self.starting_board = [row[:] for row in game.current_board]
+        self.animator = SolutionAnimator(solution_path)
+
+        game.is_animating = True
+        game_screen.animation = self.animator
+        game.apply_board_state(self.animator.board)
+
+    def handle_key(self, key: int) -> bool:
+        command = PLAYBACK_KEYS.get(key)
+        if command is None:
+            return False
+        getattr(self.animator, command)()
+        return True
+
+    def update(self, dt_ms: float) -> bool:
+        """Advance by one frame; returns False once playback has ended."""
+
+        self.animator.update(dt_ms)
+
+        if self.animator.finished:
+            self.game.apply_board_state(self.starting_board)
+            self.game.is_animating = False
+            self.game_screen.animation = None
+            return False
+
+        if self.game.current_board != self.animator.board:
+            self.game.apply_board_state(self.animator.board)
+        return True
+
+
+def start_solver(game: PuzzleGame, game_screen: GameScreen, action: str) -> SolverWorker | None:
+    """Start the solver for a GameScreen action on a background thread."""
+
+    if game.is_animating or game_screen.is_solving or not game_screen.solver_enabled(action):
         return None
 
-    starting_board = [row[:] for row in game.current_board]
+    solver_func, algorithm_label = SOLVER_ACTIONS[action]
+    worker = SolverWorker(solver_func, game.current_board, game.goal_board, algorithm_label).start()
+    game_screen.set_solving(True, algorithm_label, action)
+    return worker
 
-    game_screen.set_solving(True, algorithm_label)
 
-    screen.fill(COLOR_BACKGROUND)
-    game_screen.render(screen, game)
-    pygame.display.flip()
-    pygame.event.pump()
+def finish_solver(game: PuzzleGame, game_screen: GameScreen, worker: SolverWorker) -> Playback | None:
+    """Record a finished solver's metrics and start playing back its solution path.
 
-    result = solver_func(game.current_board, game.goal_board)
+    A solver that raised is logged and reported in the status line instead.
+    """
 
     game_screen.set_solving(False)
 
-    if not result:
+    error = worker.error
+    if error is not None:
+        logger.error("%s solver failed", worker.label, exc_info=error)
+        game_screen.set_solver_error(f"{worker.label} failed: {type(error).__name__}: {error}")
         return None
 
-    game_screen.add_comparison_result(algorithm_label, result)
-    animate_solution(
-        game,
-        screen,
-        game_screen,
-        result["solution_path"],
-        metrics_window=metrics_window,
-    )
-    game.apply_board_state(starting_board)
+    result = worker.result
+    if worker.cancelled or not result or is_unsolvable(result):
+        return None
 
-    return result
+    game_screen.add_comparison_result(worker.label, result)
+    return Playback(game, game_screen, result["solution_path"])
 
 
 def main() -> None:
@@ -105,6 +165,9 @@ def main() -> None:
 
     running = True
     game_mouse_pos = (0, 0)
+    solver_worker: SolverWorker | None = None
+    playback: Playback | None = None
+    frame_ms = 0
 
     while running:
         if game_state == "MENU":
@@ -120,6 +183,12 @@ def main() -> None:
                 running = False
                 continue
 
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                menu_screen.invalidate()
+                if game_screen is not None:
+                    game_screen.invalidate()
+                continue
+
             new_window_size = None
             if event.type == pygame.VIDEORESIZE:
                 new_window_size = event.size
@@ -133,11 +202,20 @@ def main() -> None:
                 screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
                 menu_screen = MenuScreen(*window_size)
                 if game is not None and game_screen is not None:
+                    previous_screen = game_screen
                     game_screen = GameScreen(
                         *window_size,
-                        game_screen.grid_size,
+                        previous_screen.grid_size,
                         game.metrics_results,
                     )
+                    game_screen.set_solving(
+                        previous_screen.is_solving,
+                        previous_screen.solving_algorithm,
+                        previous_screen.solving_action,
+                    )
+                    if playback is not None:
+                        game_screen.animation = playback.animator
+                        playback.game_screen = game_screen
                 continue
 
             if event.type == pygame.MOUSEMOTION:
@@ -164,35 +242,11 @@ def main() -> None:
                         row, col = data
                         game.handle_tile_click(row, col)
 
-                    elif action == "solve_bfs":
-                        solve_and_animate(
-                            game,
-                            screen,
-                            game_screen,
-                            solve_bfs,
-                            "BFS",
-                            metrics_window=metrics_window,
-                        )
-
-                    elif action == "solve_dfs":
-                        solve_and_animate(
-                            game,
-                            screen,
-                            game_screen,
-                            solve_dfs,
-                            "DFS",
-                            metrics_window=metrics_window,
-                        )
+                    elif action == "cancel_solve" and solver_worker is not None:
+                        solver_worker.cancel()
 
-                    elif action == "solve_astar":
-                        solve_and_animate(
-                            game,
-                            screen,
-                            game_screen,
-                            solve_astar,
-                            "A*",
-                            metrics_window=metrics_window,
-                        )
+                    elif action in SOLVER_ACTIONS:
+                        solver_worker = start_solver(game, game_screen, action) or solver_worker
 
                     elif action == "shuffle" and not game.is_animating and not game_screen.is_solving:
                         game.shuffle()
@@ -223,6 +277,13 @@ def main() -> None:
                     metrics_window.open(game.metrics_results)
                     continue
 
+                if event.key == pygame.K_ESCAPE and solver_worker is not None:
+                    solver_worker.cancel()
+                    continue
+
+                if playback is not None and playback.handle_key(event.key):
+                    continue
+
                 if game.is_animating or game_screen.is_solving:
                     continue
 
@@ -245,43 +306,34 @@ def main() -> None:
                     metrics_window.close()
                     game_state = "MENU"
                     pygame.display.set_caption("Sliding Puzzle Game")
-                elif event.key == pygame.K_SPACE:
-                    solve_and_animate(
-                        game,
-                        screen,
-                        game_screen,
-                        solve_bfs,
-                        "BFS",
-                        metrics_window=metrics_window,
-                    )
-                elif event.key == pygame.K_s:
-                    solve_and_animate(
-                        game,
-                        screen,
-                        game_screen,
-                        solve_dfs,
-                        "DFS",
-                        metrics_window=metrics_window,
-                    )
-                elif event.key == pygame.K_a:
-                    solve_and_animate(
-                        game,
-                        screen,
-                        game_screen,
-                        solve_astar,
-                        "A*",
-                        metrics_window=metrics_window,
-                    )
+                elif event.key in SOLVER_KEYS:
+                    solver_worker = start_solver(game, game_screen, SOLVER_KEYS[event.key]) or solver_worker
+
+        if solver_worker is not None and game is not None and game_screen is not None:
+            if solver_worker.done:
+                worker, solver_worker = solver_worker, None
+                playback = finish_solver(game, game_screen, worker)
+            else:
+                game_screen.update_solving_progress(*solver_worker.progress(), solver_worker.best_moves())
 
+        if playback is not None and not playback.update(frame_ms):
+            playback = None
+
+        dirty_rects: list[pygame.Rect] = []
         if game_state == "MENU":
-            menu_screen.render(screen)
+            dirty_rects = menu_screen.render(screen)
         elif game_state == "GAME" and game and game_screen:
-            game_screen.render(screen, game)
+            dirty_rects = game_screen.render(screen, game)
 
-        pygame.display.flip()
+        # Idle frames produce no dirty rects and skip the display update entirely.
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
 
         metrics_window.render()
-        clock.tick(FPS)
+        frame_ms = clock.tick(FPS)
+
+    if solver_worker is not None:
+        solver_worker.cancel()
 
     metrics_window.close()
     pygame.quit()
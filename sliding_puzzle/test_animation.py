@@ -0,0 +1,71 @@
+from game.puzzle_solver import solve_astar
+from game.solution_path import SolutionPath
+from ui.animation import SolutionAnimator
+from utils.constants import GOAL_3x3, TEST_MEDIUM_3x3
+
+
+def _path() -> SolutionPath:
+    return solve_astar(TEST_MEDIUM_3x3, GOAL_3x3)["solution_path"]
+
+
+def test_animator_steps_with_frame_time_and_finishes_after_hold() -> None:
+    path = _path()
+    animator = SolutionAnimator(path, step_ms=100)
+
+    assert animator.board == TEST_MEDIUM_3x3
+    tile, from_cell, to_cell, t = animator.sliding()
+    assert animator.board[to_cell[0]][to_cell[1]] == 0
+    assert animator.board[from_cell[0]][from_cell[1]] == tile
+    assert t == 0
+
+    animator.update(50)
+    assert 0 < animator.sliding()[3] < 1
+    animator.update(50)
+    assert animator.step_index == 1
+    assert animator.board == path[1].board
+
+    animator.update(100 * (animator.total_steps - 1))
+    assert animator.board == GOAL_3x3
+    assert animator.sliding() is None
+    assert not animator.finished
+    animator.update(100)
+    assert animator.finished
+
+
+def test_animator_pause_step_speed_and_skip() -> None:
+    path = _path()
+    animator = SolutionAnimator(path, step_ms=100)
+
+    animator.toggle_pause()
+    assert not animator.update(1000)
+    assert animator.step_index == 0
+
+    animator.step()
+    assert animator.step_index == 1
+    assert not animator.playing
+
+    animator.toggle_pause()
+    animator.speed_up()
+    assert animator.speed == 2.0
+    animator.update(50)
+    assert animator.step_index == 2
+
+    animator.skip_to_end()
+    assert animator.board == GOAL_3x3
+    assert animator.step_index == animator.total_steps
+    animator.update(100)
+    assert animator.finished
+
+
+def test_animator_reads_boards_lazily() -> None:
+    class CountingPath(list):
+        yielded = 0
+
+        def __iter__(self):
+            for state in super().__iter__():
+                CountingPath.yielded += 1
+                yield state
+
+    path = CountingPath(_path())
+    SolutionAnimator(path, step_ms=100)
+    assert CountingPath.yielded == 2
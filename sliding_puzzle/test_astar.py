@@ -1,11 +1,22 @@
+import random
+
+import pytest
+
+from game.frontier import BucketFrontier
 from game.puzzle_solver import (
+    ManhattanHeuristic,
     manhattan_distance,
     precompute_goal_positions,
+    solve_anytime_astar,
     solve_astar,
     solve_bfs,
     solve_dfs,
+    solve_idastar,
 )
-from utils.constants import GOAL_3x3, GOAL_4x4, TEST_EXPERT_4x4, TEST_HARD_3x3, TEST_MEDIUM_3x3
+from game.puzzle_state import PuzzleState
+from game.search_monitor import SearchMonitor
+from utils.boards import make_goal, random_walk_board
+from utils.constants import GOAL_3x3, GOAL_4x4, TEST_EXPERT_4x4, TEST_HARD_3x3, TEST_HARD_4x4, TEST_MEDIUM_3x3
 
 
 def test_manhattan_distance() -> None:
@@ -74,3 +85,149 @@ def test_hard_puzzle() -> None:
 def test_4x4_manhattan_distance_only() -> None:
     goal_positions = precompute_goal_positions(GOAL_4x4)
     assert manhattan_distance(TEST_EXPERT_4x4, goal_positions) >= 0
+
+
+def test_idastar_matches_astar_optimality() -> None:
+    for initial_board, goal_board in ((TEST_MEDIUM_3x3, GOAL_3x3), (TEST_HARD_3x3, GOAL_3x3), (TEST_HARD_4x4, GOAL_4x4)):
+        astar_result = solve_astar(initial_board, goal_board)
+        idastar_result = solve_idastar(initial_board, goal_board)
+
+        assert astar_result is not None
+        assert idastar_result is not None
+        assert idastar_result["moves"] == astar_result["moves"]
+        assert idastar_result["path"][0].board == initial_board
+        assert idastar_result["path"][-1].board == goal_board
+
+
+def test_idastar_already_solved() -> None:
+    result = solve_idastar(GOAL_4x4, GOAL_4x4)
+
+    assert result is not None
+    assert result["moves"] == 0
+
+
+def test_manhattan_heuristic_incremental_update_matches_full_scan() -> None:
+    rng = random.Random(7)
+    goal_positions = precompute_goal_positions(GOAL_4x4)
+    heuristic = ManhattanHeuristic(GOAL_4x4)
+
+    state = PuzzleState(GOAL_4x4)
+    state.h = heuristic.evaluate(state.key)
+    for _ in range(200):
+        state = rng.choice(state.get_possible_moves(heuristic))
+        assert state.h == manhattan_distance(state.board, goal_positions)
+        assert state.h == heuristic.evaluate(state.key)
+
+
+def test_registered_heuristics_update_incrementally_and_stay_admissible() -> None:
+    from game.puzzle_solver import HEURISTICS, make_heuristic
+
+    rng = random.Random(11)
+    for name in ("manhattan", "linear-conflict", "walking-distance"):
+        assert name in HEURISTICS
+        for goal_board in (GOAL_3x3, GOAL_4x4):
+            heuristic = make_heuristic(name, goal_board)
+            state = PuzzleState(goal_board)
+            state.h = heuristic.evaluate(state.key)
+            assert state.h == 0
+
+            for _ in range(150):
+                state = rng.choice(state.get_possible_moves(heuristic))
+                assert state.h == heuristic.evaluate(state.key)
+
+        for initial_board, goal_board in ((TEST_HARD_3x3, GOAL_3x3), (TEST_HARD_4x4, GOAL_4x4)):
+            optimal = solve_idastar(initial_board, goal_board)["moves"]
+            assert make_heuristic(name, goal_board).evaluate(PuzzleState(initial_board).key) <= optimal
+            assert solve_astar(initial_board, goal_board, heuristic=name)["moves"] == optimal
+            assert solve_idastar(initial_board, goal_board, heuristic=name)["moves"] == optimal
+
+
+def test_walking_distance_update_does_not_rescan_the_board(monkeypatch) -> None:
+    from game.walking_distance import WalkingDistanceHeuristic
+
+    heuristic = WalkingDistanceHeuristic(GOAL_4x4)
+    scan = heuristic._codes
+    scans = []
+    monkeypatch.setattr(heuristic, "_codes", lambda key: scans.append(key) or scan(key))
+
+    rng = random.Random(5)
+    state = PuzzleState(GOAL_4x4)
+    state.h = heuristic.evaluate(state.key)
+    for _ in range(300):
+        state = rng.choice(state.get_possible_moves(heuristic))
+        assert state.h == heuristic.evaluate(state.key)
+
+    # Only the start is scanned; every later parent was remembered as a child.
+    assert scans == [PuzzleState(GOAL_4x4).key]
+
+
+def test_stronger_heuristics_dominate_manhattan() -> None:
+    from game.puzzle_solver import make_heuristic
+
+    key = PuzzleState(TEST_HARD_3x3).key
+    manhattan = make_heuristic("manhattan", GOAL_3x3).evaluate(key)
+    assert make_heuristic("linear-conflict", GOAL_3x3).evaluate(key) >= manhattan
+    assert make_heuristic("walking-distance", GOAL_3x3).evaluate(key) >= manhattan
+
+
+def test_bucket_frontier_pops_lowest_f_then_deepest_g() -> None:
+    frontier = BucketFrontier()
+    for f, g, item in [(5, 1, "a"), (3, 0, "b"), (5, 4, "c"), (3, 2, "d"), (3, 2, "e"), (4, 1, "f")]:
+        frontier.push(f, g, item)
+
+    assert [frontier.pop() for _ in range(len(frontier))] == ["e", "d", "b", "f", "c", "a"]
+
+    frontier.push(7, 0, "x")
+    frontier.push(2, 0, "y")
+    assert frontier.pop() == "y"
+
+
+def test_astar_frontiers_agree_on_optimal_length() -> None:
+    for board, goal in ((TEST_HARD_3x3, GOAL_3x3), (TEST_EXPERT_4x4, GOAL_4x4)):
+        heap_result = solve_astar(board, goal, frontier="heap")
+        bucket_result = solve_astar(board, goal, frontier="bucket")
+        assert heap_result["moves"] == bucket_result["moves"]
+        assert solve_astar(board, goal, frontier="bucket")["move_sequence"] == bucket_result["move_sequence"]
+
+
+def test_weighted_astar_stays_within_its_bound() -> None:
+    goal = make_goal(4, 4)
+    rng = random.Random(20)
+    for board in [TEST_HARD_4x4] + [random_walk_board(goal, 60, rng) for _ in range(4)]:
+        optimal = solve_astar(board, goal, heuristic="linear-conflict")
+        for weight in (1.25, 2, 3):
+            result = solve_astar(board, goal, heuristic="linear-conflict", weight=weight)
+            assert optimal["moves"] <= result["moves"] <= weight * optimal["moves"]
+            assert result["solution_path"][-1].board == goal
+
+    with pytest.raises(ValueError):
+        solve_astar(TEST_HARD_3x3, GOAL_3x3, weight=0.5)
+
+
+def test_anytime_astar_streams_improving_solutions_down_to_optimal() -> None:
+    goal = make_goal(4, 4)
+    board = random_walk_board(goal, 50, random.Random(6))
+    monitor = SearchMonitor()
+    seen = []
+
+    result = solve_anytime_astar(board, goal, heuristic="linear-conflict", on_solution=seen.append, monitor=monitor)
+
+    optimal = solve_astar(board, goal, heuristic="linear-conflict")["moves"]
+    assert len(seen) > 1
+    assert seen[-1] is result is monitor.solution
+    assert result["moves"] == optimal and result["bound"] == 1
+    for earlier, later in zip(seen, seen[1:]):
+        assert (later["moves"], later["bound"]) < (earlier["moves"], earlier["bound"])
+    for found in seen:
+        assert optimal <= found["moves"] <= found["bound"] * optimal
+        assert found["solution_path"][-1].board == goal
+
+
+def test_anytime_astar_returns_best_so_far_when_out_of_time() -> None:
+    goal = make_goal(4, 4)
+    board = random_walk_board(goal, 200, random.Random(1))
+
+    result = solve_anytime_astar(board, goal, time_budget=0.0)
+
+    assert result["bound"] > 1
+    assert result["solution_path"][-1].board == goal
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from game.distance_table import TABLE_SIZE, UNSEEN, build_distance_table, load_distance_table, table_file_name
+from game.puzzle_game import PuzzleGame
+from game.puzzle_solver import is_unsolvable, solve_astar, solve_bfs, solve_idastar, solve_table3x3
+from utils.boards import random_walk_board
+from utils.constants import GOAL_3x3, GOAL_4x4, LEVELS, TEST_HARD_3x3
+
+
+def test_table_covers_every_reachable_state(tmp_path) -> None:
+    table = load_distance_table(GOAL_3x3, str(tmp_path))
+    reachable = [value for value in table.table if value != UNSEEN]
+
+    assert len(table.table) == TABLE_SIZE
+    assert len(reachable) == TABLE_SIZE // 2
+    assert max(reachable) == 31
+    assert table.distance(GOAL_3x3) == 0
+
+    # Written on first use and read back unchanged.
+    saved = (tmp_path / table_file_name(GOAL_3x3)).read_bytes()
+    assert saved == bytes(table.table)
+
+
+def test_table_solver_is_optimal_on_levels_and_random_boards() -> None:
+    rng = random.Random(21)
+    boards = [level["board"] for level in LEVELS[3].values()]
+    boards += [random_walk_board(GOAL_3x3, 60, rng) for _ in range(10)]
+
+    for board in boards:
+        result = solve_table3x3(board, GOAL_3x3)
+
+        assert result["moves"] == solve_bfs(board, GOAL_3x3)["moves"]
+        assert result["nodes_explored"] <= 1 + 4 * result["moves"]
+        game = PuzzleGame(board, GOAL_3x3)
+        for action in result["solution_path"].actions:
+            assert game.move_blank_direction(action)
+        assert game.is_solved()
+
+
+def test_table_for_another_goal() -> None:
+    goal = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+    board = random_walk_board(goal, 40, random.Random(3))
+
+    table = build_distance_table(goal)
+    assert table.count(UNSEEN) == TABLE_SIZE // 2
+    assert solve_table3x3(board, goal)["moves"] == solve_astar(board, goal)["moves"]
+
+
+def test_table_as_exact_heuristic_expands_only_the_optimal_path() -> None:
+    moves = solve_table3x3(TEST_HARD_3x3, GOAL_3x3)["moves"]
+
+    assert solve_astar(TEST_HARD_3x3, GOAL_3x3, heuristic="distance-table")["nodes_explored"] == moves + 1
+    assert solve_idastar(TEST_HARD_3x3, GOAL_3x3, heuristic="distance-table")["moves"] == moves
+
+
+def test_table_solver_rejects_unsolvable_and_other_sizes() -> None:
+    swapped = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]
+    assert is_unsolvable(solve_table3x3(swapped, GOAL_3x3))
+
+    with pytest.raises(ValueError):
+        solve_table3x3(GOAL_4x4, GOAL_4x4)
+
+
+def test_table_solver_answers_trivial_boards_without_the_table(monkeypatch) -> None:
+    from game import puzzle_solver
+
+    def no_table(goal_board):
+        raise AssertionError("the distance table should not be loaded")
+
+    monkeypatch.setattr(puzzle_solver, "load_distance_table", no_table)
+    goal = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+
+    assert solve_table3x3(goal, goal)["moves"] == 0
+    assert is_unsolvable(solve_table3x3([[0, 2, 1], [3, 4, 5], [6, 7, 8]], goal))
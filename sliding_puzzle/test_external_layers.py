@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from game.external_layers import LayerWriter, write_layer
+
+
+def test_finish_merges_runs_without_duplicates_or_excluded_keys(tmp_path) -> None:
+    rng = random.Random(24)
+    keys = [rng.randrange(1 << 64) for _ in range(500)]
+    previous = write_layer(str(tmp_path), "previous", keys[::7])
+
+    writer = LayerWriter(str(tmp_path), "next", spill_keys=64)
+    for key in keys + keys[::3]:
+        writer.add(key)
+    assert len(writer.runs) > 1
+    layer = writer.finish(exclude=previous)
+
+    expected = sorted(set(keys) - set(keys[::7]))
+    assert list(layer) == expected
+    assert len(layer) == len(expected)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["next.layer", "previous.layer"]
+
+
+def test_membership_is_answered_from_disk(tmp_path) -> None:
+    keys = list(range(3, 3000, 3))
+    layer = write_layer(str(tmp_path), "layer", keys)
+
+    assert all(key in layer for key in keys)
+    assert not any(key in layer for key in (0, 1, 2999, 3001, 1 << 63))
+    assert 0 not in write_layer(str(tmp_path), "empty", [])
+
+
+def test_spill_keys_must_be_positive(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        LayerWriter(str(tmp_path), "layer", spill_keys=0)
@@ -1,8 +1,14 @@
 """Integration tests for solvers + metrics tracking."""
 
 from game.puzzle_game import PuzzleGame
-from game.puzzle_solver import solve_astar, solve_bfs, solve_dfs
-from utils.constants import GOAL_3x3, TEST_EASY_3x3, TEST_MEDIUM_3x3
+import random
+
+import pytest
+
+from game.puzzle_solver import solve_astar, solve_bfs, solve_bidirectional_astar, solve_bidirectional_bfs, solve_dfs
+from game.search_monitor import SearchCancelled, SearchMonitor
+from utils.boards import make_goal, random_walk_board
+from utils.constants import GOAL_3x3, GOAL_4x4, TEST_EASY_3x3, TEST_HARD_3x3, TEST_HARD_4x4, TEST_MEDIUM_3x3
 
 
 def test_integration_all_solvers() -> None:
@@ -51,3 +57,106 @@ def test_response_format() -> None:
     assert required_keys.issubset(result.keys())
     assert result["path"] == result["solution_path"]
     assert result["moves"] == result["steps"]
+
+
+def test_bidirectional_bfs_is_optimal_and_path_is_valid() -> None:
+    cases = [(TEST_EASY_3x3, GOAL_3x3), (TEST_MEDIUM_3x3, GOAL_3x3), (TEST_HARD_3x3, GOAL_3x3), (TEST_HARD_4x4, GOAL_4x4)]
+
+    for initial_board, goal_board in cases:
+        result = solve_bidirectional_bfs(initial_board, goal_board)
+        expected = solve_astar(initial_board, goal_board)
+
+        assert result is not None
+        assert result["moves"] == expected["moves"]
+        assert result["path"][0].board == initial_board
+        assert result["path"][-1].board == goal_board
+
+        game = PuzzleGame(initial_board, goal_board)
+        for state in result["solution_path"][1:]:
+            assert game.move_blank_direction(state.action)
+        assert game.is_solved()
+
+
+def test_bidirectional_astar_is_optimal_and_path_is_valid() -> None:
+    cases = [
+        (TEST_EASY_3x3, GOAL_3x3),
+        (TEST_HARD_3x3, GOAL_3x3),
+        (TEST_HARD_4x4, GOAL_4x4),
+        ([[3, 1], [0, 2]], [[1, 2], [3, 0]]),
+    ]
+
+    for initial_board, goal_board in cases:
+        for heuristic in ("manhattan", "linear-conflict"):
+            result = solve_bidirectional_astar(initial_board, goal_board, heuristic=heuristic)
+
+            assert result["moves"] == solve_astar(initial_board, goal_board)["moves"]
+            game = PuzzleGame(initial_board, goal_board)
+            for action in result["solution_path"].actions:
+                assert game.move_blank_direction(action)
+            assert game.is_solved()
+
+
+def test_bidirectional_astar_expands_fewer_nodes_than_astar_on_mid_depth_4x4() -> None:
+    goal = make_goal(4, 4)
+    rng = random.Random(19)
+    boards = [random_walk_board(goal, 40, rng) for _ in range(8)]
+
+    astar_nodes = sum(solve_astar(board, goal)["nodes_explored"] for board in boards)
+    bidirectional_nodes = sum(solve_bidirectional_astar(board, goal)["nodes_explored"] for board in boards)
+    assert bidirectional_nodes < astar_nodes
+
+
+def test_compact_bfs_matches_bfs_and_path_is_valid() -> None:
+    rng = random.Random(23)
+    cases = [(TEST_EASY_3x3, GOAL_3x3), (TEST_MEDIUM_3x3, GOAL_3x3)]
+    cases += [(random_walk_board(make_goal(3, 4), 16, rng), make_goal(3, 4)) for _ in range(3)]
+
+    for initial_board, goal_board in cases:
+        result = solve_bfs(initial_board, goal_board, compact=True)
+
+        assert result["moves"] == solve_bfs(initial_board, goal_board)["moves"]
+        game = PuzzleGame(initial_board, goal_board)
+        for action in result["solution_path"].actions:
+            assert game.move_blank_direction(action)
+        assert game.is_solved()
+
+    with pytest.raises(ValueError):
+        solve_bfs(TEST_HARD_4x4, GOAL_4x4, compact=True)
+
+
+def test_disk_bfs_matches_bfs_and_cleans_up(tmp_path) -> None:
+    for initial_board, goal_board in [(TEST_EASY_3x3, GOAL_3x3), (TEST_HARD_3x3, GOAL_3x3)]:
+        result = solve_bfs(initial_board, goal_board, spill_dir=str(tmp_path), spill_keys=2000)
+
+        assert result["moves"] == solve_bfs(initial_board, goal_board)["moves"]
+        game = PuzzleGame(initial_board, goal_board)
+        for action in result["solution_path"].actions:
+            assert game.move_blank_direction(action)
+        assert game.is_solved()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parallel_bfs_matches_bfs_and_path_is_valid() -> None:
+    rng = random.Random(25)
+    cases = [(TEST_EASY_3x3, GOAL_3x3), (TEST_HARD_3x3, GOAL_3x3)]
+    cases += [(random_walk_board(make_goal(2, 5), 30, rng), make_goal(2, 5))]
+
+    for initial_board, goal_board in cases:
+        result = solve_bfs(initial_board, goal_board, workers=2)
+
+        assert result["moves"] == solve_bfs(initial_board, goal_board)["moves"]
+        game = PuzzleGame(initial_board, goal_board)
+        for action in result["solution_path"].actions:
+            assert game.move_blank_direction(action)
+        assert game.is_solved()
+
+
+def test_parallel_bfs_rejects_wide_keys_and_can_be_cancelled() -> None:
+    with pytest.raises(ValueError):
+        solve_bfs(random_walk_board(make_goal(4, 5), 10, random.Random(1)), make_goal(4, 5), workers=2)
+
+    monitor = SearchMonitor()
+    monitor.cancel()
+    with pytest.raises(SearchCancelled):
+        solve_bfs(TEST_HARD_3x3, GOAL_3x3, workers=2, monitor=monitor)
@@ -0,0 +1,134 @@
+import random
+import time
+
+import pytest
+
+from game.puzzle_game import PuzzleGame
+from game.puzzle_solver import (
+    is_unsolvable,
+    placement_stages,
+    solve_astar,
+    solve_greedy,
+    solve_reduction,
+)
+from utils.boards import grid_shape, make_goal, random_walk_board
+from utils.constants import GOAL_3x3, LEVELS, TEST_HARD_3x3, get_level
+from utils.solvability import is_solvable
+
+
+def _assert_solves(board, goal, result) -> None:
+    game = PuzzleGame(board, goal)
+    for action in result["solution_path"].actions:
+        assert game.move_blank_direction(action)
+    assert game.is_solved()
+    assert result["moves"] == len(result["move_sequence"])
+
+
+@pytest.mark.parametrize("shape", [(2, 2), (3, 3), (2, 5), (3, 5), (5, 3), (4, 6), (8, 8)])
+def test_placement_stages_cover_every_tile_once(shape) -> None:
+    goal = make_goal(*shape)
+    cells = [cell for stage in placement_stages(goal) for cell in stage]
+
+    assert sorted(cells) == list(range(shape[0] * shape[1] - 1))
+    assert all(1 <= len(stage) <= 3 for stage in placement_stages(goal))
+
+
+def test_greedy_solves_every_level_preset() -> None:
+    for presets in LEVELS.values():
+        for level in presets.values():
+            result = solve_greedy(level["board"], level["goal"])
+            _assert_solves(level["board"], level["goal"], result)
+
+
+def test_greedy_is_fast_on_scrambled_8x8() -> None:
+    goal = make_goal(8, 8)
+    board = random_walk_board(goal, 3000, random.Random(17))
+
+    start = time.perf_counter()
+    result = solve_greedy(board, goal)
+    assert time.perf_counter() - start < 3.0
+    _assert_solves(board, goal, result)
+
+
+def test_greedy_is_no_shorter_than_optimal() -> None:
+    result = solve_greedy(TEST_HARD_3x3, GOAL_3x3)
+
+    _assert_solves(TEST_HARD_3x3, GOAL_3x3, result)
+    assert result["moves"] >= solve_astar(TEST_HARD_3x3, GOAL_3x3)["moves"]
+
+
+def test_greedy_rejects_unsolvable_boards() -> None:
+    goal = make_goal(5, 5)
+    board = [row[:] for row in goal]
+    board[0][0], board[0][1] = board[0][1], board[0][0]
+
+    assert is_unsolvable(solve_greedy(board, goal))
+
+
+def _scrambled(rows: int, cols: int, rng: random.Random) -> list[list[int]]:
+    goal = make_goal(rows, cols)
+    values = list(range(rows * cols))
+    rng.shuffle(values)
+    board = [values[i * cols : (i + 1) * cols] for i in range(rows)]
+    if not is_solvable(board, goal):
+        (r1, c1), (r2, c2) = [(r, c) for r in range(rows) for c in range(cols) if board[r][c]][:2]
+        board[r1][c1], board[r2][c2] = board[r2][c2], board[r1][c1]
+    return board
+
+
+def test_reduction_solves_every_level_preset() -> None:
+    for presets in LEVELS.values():
+        for level in presets.values():
+            result = solve_reduction(level["board"], level["goal"])
+            _assert_solves(level["board"], level["goal"], result)
+
+
+@pytest.mark.parametrize("shape", [(2, 2), (2, 7), (7, 2), (3, 8), (4, 4), (5, 5), (6, 4), (8, 8)])
+def test_reduction_solves_scrambled_boards_of_any_shape(shape) -> None:
+    rng = random.Random(18)
+    goal = make_goal(*shape)
+    for _ in range(20):
+        board = _scrambled(*shape, rng)
+        result = solve_reduction(board, goal)
+        _assert_solves(board, goal, result)
+        # Each tile walks O(rows + cols) cells, each step costing a few blank moves.
+        assert result["moves"] <= 20 * shape[0] * shape[1] * (shape[0] + shape[1])
+
+
+def test_reduction_is_optimal_when_only_the_exact_remainder_is_left() -> None:
+    result = solve_reduction(TEST_HARD_3x3, GOAL_3x3)
+
+    _assert_solves(TEST_HARD_3x3, GOAL_3x3, result)
+    assert result["moves"] == solve_astar(TEST_HARD_3x3, GOAL_3x3)["moves"]
+
+
+def test_reduction_rejects_unsolvable_boards_and_bad_goals() -> None:
+    goal = make_goal(6, 6)
+    board = [row[:] for row in goal]
+    board[0][0], board[0][1] = board[0][1], board[0][0]
+    assert is_unsolvable(solve_reduction(board, goal))
+
+    blank_first = [[r * 6 + c for c in range(6)] for r in range(6)]
+    with pytest.raises(ValueError):
+        solve_reduction(goal, blank_first)
+    with pytest.raises(ValueError):
+        solve_reduction(goal, goal, exact_side=5)
+
+
+def test_rectangular_levels_and_shuffle() -> None:
+    level = get_level((3, 5), "hard")
+    assert grid_shape(level["grid_size"]) == (3, 5)
+    assert len(level["board"]) == 3 and len(level["board"][0]) == 5
+
+    game = PuzzleGame(level["board"], level["goal"])
+    board = game.shuffle()
+    assert len(board) == 3 and all(len(row) == 5 for row in board)
+    assert is_solvable(board, level["goal"])
+    assert board != level["goal"]
+
+
+def test_grid_shape_limits() -> None:
+    assert grid_shape(8) == (8, 8)
+    assert grid_shape((3, 5)) == (3, 5)
+    with pytest.raises(ValueError):
+        grid_shape(9)
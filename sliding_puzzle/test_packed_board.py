@@ -0,0 +1,44 @@
+from game.packed_board import get_layout, layout_for
+from game.puzzle_state import PuzzleState
+from utils.constants import GOAL_3x3, GOAL_4x4, TEST_HARD_4x4, TEST_MEDIUM_3x3
+
+
+def test_pack_roundtrip_and_widths() -> None:
+    layout_3 = layout_for(GOAL_3x3)
+    key, blank = layout_3.pack(TEST_MEDIUM_3x3)
+    assert layout_3.unpack(key) == TEST_MEDIUM_3x3
+    assert blank == 1
+    assert key.bit_length() <= 36
+
+    layout_4 = layout_for(GOAL_4x4)
+    key, blank = layout_4.pack(TEST_HARD_4x4)
+    assert layout_4.unpack(key) == TEST_HARD_4x4
+    assert key.bit_length() <= 64
+    assert layout_4.tile_at(key, blank) == 0
+
+
+def test_apply_move_matches_list_swap() -> None:
+    layout = get_layout(4, 4)
+    key, blank = layout.pack(GOAL_4x4)
+
+    for target, action in layout.neighbors[blank]:
+        moved = layout.apply_move(key, blank, target)
+        board = [row[:] for row in GOAL_4x4]
+        br, bc = divmod(blank, 4)
+        tr, tc = divmod(target, 4)
+        board[br][bc], board[tr][tc] = board[tr][tc], board[br][bc]
+        assert layout.unpack(moved) == board
+        assert layout.find_blank(moved) == target
+        assert action in ("UP", "LEFT")
+
+
+def test_puzzle_state_uses_packed_keys() -> None:
+    state = PuzzleState(TEST_MEDIUM_3x3)
+    assert state.board == TEST_MEDIUM_3x3
+    assert state.blank_pos == (0, 1)
+
+    for child in state.get_possible_moves():
+        assert child.parent is state
+        assert child.level == 1
+        assert PuzzleState(child.board) == child
+        assert hash(PuzzleState(child.board)) == hash(child)
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from game.pattern_database import PatternDatabase, PatternDatabaseHeuristic, build_partition
+from game.permutation_rank import pattern_table_size
+from game.puzzle_solver import solve_astar, solve_bfs, solve_idastar
+from game.puzzle_state import PuzzleState
+from utils.constants import GOAL_3x3, GOAL_4x4, TEST_HARD_3x3, TEST_MEDIUM_3x3
+
+GROUPS_3x3 = ((1, 2, 3, 4), (5, 6, 7, 8))
+
+
+def test_saved_tables_load_memory_mapped(tmp_path) -> None:
+    paths = build_partition(GOAL_3x3, GROUPS_3x3, str(tmp_path))
+    assert len(paths) == 2
+
+    pdb = PatternDatabase.load(paths[0])
+    assert isinstance(pdb.table, memoryview)
+    assert len(pdb.table) == pattern_table_size(9, 4)
+    assert pdb.lookup(pdb.goal_positions) == 0
+
+
+def test_pdb_heuristic_is_admissible_and_incremental(tmp_path) -> None:
+    build_partition(GOAL_3x3, GROUPS_3x3, str(tmp_path))
+    heuristic = PatternDatabaseHeuristic(GOAL_3x3, GROUPS_3x3, str(tmp_path))
+
+    assert heuristic.evaluate(PuzzleState(GOAL_3x3).key) == 0
+
+    rng = random.Random(3)
+    state = PuzzleState(GOAL_3x3)
+    state.h = heuristic.evaluate(state.key)
+    for _ in range(60):
+        state = rng.choice(state.get_possible_moves(heuristic))
+        assert state.h == heuristic.evaluate(state.key)
+
+    optimal = solve_bfs(TEST_HARD_3x3, GOAL_3x3)
+    assert heuristic.evaluate(PuzzleState(TEST_HARD_3x3).key) <= optimal["moves"]
+
+
+def test_pdb_update_re_ranks_at_most_one_group(tmp_path, monkeypatch) -> None:
+    build_partition(GOAL_3x3, GROUPS_3x3, str(tmp_path))
+    heuristic = PatternDatabaseHeuristic(GOAL_3x3, GROUPS_3x3, str(tmp_path))
+    scan = heuristic._group_positions
+    scans = []
+    monkeypatch.setattr(heuristic, "_group_positions", lambda key: scans.append(key) or scan(key))
+    lookups = []
+    for db in heuristic.databases:
+        monkeypatch.setattr(db, "lookup", lambda positions, lookup=db.lookup: lookups.append(1) or lookup(positions))
+
+    rng = random.Random(8)
+    state = PuzzleState(GOAL_3x3)
+    state.h = heuristic.evaluate(state.key)
+    lookups.clear()
+    for _ in range(60):
+        children = state.get_possible_moves(heuristic)
+        assert len(lookups) <= len(children)
+        lookups.clear()
+        state = rng.choice(children)
+
+    # Only the start is scanned; every later parent was remembered as a child.
+    assert scans == [PuzzleState(GOAL_3x3).key]
+
+
+def test_solvers_select_pdb_heuristic(tmp_path) -> None:
+    build_partition(GOAL_3x3, GROUPS_3x3, str(tmp_path))
+    heuristic = PatternDatabaseHeuristic(GOAL_3x3, GROUPS_3x3, str(tmp_path))
+
+    for board in (TEST_MEDIUM_3x3, TEST_HARD_3x3):
+        expected = solve_astar(board, GOAL_3x3)["moves"]
+        assert solve_astar(board, GOAL_3x3, heuristic=heuristic)["moves"] == expected
+        assert solve_idastar(board, GOAL_3x3, heuristic=heuristic)["moves"] == expected
+
+
+def test_missing_tables_raise_file_not_found(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        PatternDatabaseHeuristic(GOAL_4x4, "6-6-3", str(tmp_path))
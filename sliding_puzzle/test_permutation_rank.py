@@ -0,0 +1,73 @@
+import itertools
+import random
+
+from game.packed_board import get_layout
+from game.permutation_rank import (
+    pattern_table_size,
+    rank_key,
+    rank_keys,
+    rank_pattern,
+    rank_permutation,
+    rank_positions,
+    unrank_key,
+    unrank_pattern,
+    unrank_permutation,
+    unrank_positions,
+)
+from utils.boards import make_goal, random_walk_board
+
+
+def test_rank_permutation_is_a_bijection() -> None:
+    n = 5
+    ranks = set()
+    for perm in itertools.permutations(range(n)):
+        rank = rank_permutation(perm)
+        assert unrank_permutation(rank, n) == list(perm)
+        ranks.add(rank)
+    assert ranks == set(range(pattern_table_size(n, n)))
+
+
+def test_rank_pattern_is_a_bijection() -> None:
+    for cells, k in ((9, 3), (6, 6), (7, 1)):
+        ranks = set()
+        for positions in itertools.permutations(range(cells), k):
+            rank = rank_pattern(positions, cells)
+            assert unrank_pattern(rank, cells, k) == list(positions)
+            ranks.add(rank)
+        assert ranks == set(range(pattern_table_size(cells, k)))
+
+
+def test_rank_positions_is_a_bijection() -> None:
+    cells, k = 9, 3
+    seen = set()
+    for index in range(pattern_table_size(cells, k)):
+        positions = unrank_positions(index, cells, k)
+        assert len(set(positions)) == k
+        assert rank_positions(positions, cells) == index
+        seen.add(tuple(positions))
+    assert len(seen) == 9 * 8 * 7
+
+
+def test_rank_keys_matches_single_ranks() -> None:
+    rng = random.Random(22)
+    goal = make_goal(4, 4)
+    layout = get_layout(4, 4)
+    boards = [random_walk_board(goal, 60, rng) for _ in range(50)]
+    keys = [layout.pack(board)[0] for board in boards]
+
+    ranks = rank_keys(layout, keys)
+
+    assert ranks.typecode == "Q"
+    assert list(ranks) == [rank_key(layout, key) for key in keys]
+    for board, rank in zip(boards, ranks):
+        assert unrank_key(layout, rank) == layout.pack(board)
+
+
+def test_rank_keys_is_a_bijection_on_every_board() -> None:
+    layout = get_layout(2, 3)
+    keys = [layout.pack([list(values[:3]), list(values[3:])])[0] for values in itertools.permutations(range(6))]
+
+    ranks = rank_keys(layout, keys)
+
+    assert sorted(ranks) == list(range(pattern_table_size(6, 6)))
+    assert [unrank_key(layout, rank)[0] for rank in ranks] == keys
@@ -0,0 +1,55 @@
+import pickle
+
+from game.puzzle_game import PuzzleGame
+from game.puzzle_solver import (
+    solve_astar,
+    solve_bfs,
+    solve_bidirectional_astar,
+    solve_bidirectional_bfs,
+    solve_dfs,
+    solve_idastar,
+)
+from game.solution_path import SolutionPath, encode_actions, iter_boards
+from utils.constants import GOAL_3x3, TEST_EASY_3x3, TEST_HARD_3x3, TEST_MEDIUM_3x3
+
+
+def test_solution_path_replays_states_lazily() -> None:
+    path = SolutionPath(TEST_EASY_3x3, "R")
+
+    assert len(path) == 2
+    assert path[0].board == TEST_EASY_3x3
+    assert path[0].action is None
+    assert path[-1].board == GOAL_3x3
+    assert path[-1].action == "RIGHT"
+    assert path[-1].level == 1
+    assert [state.board for state in path] == list(iter_boards(path))
+    assert path.actions == ["RIGHT"]
+
+
+def test_solution_path_pickles_as_moves() -> None:
+    result = solve_astar(TEST_HARD_3x3, GOAL_3x3)
+    path = result["solution_path"]
+
+    restored = pickle.loads(pickle.dumps(path))
+    assert restored == path
+    assert restored.moves == result["move_sequence"]
+    assert len(pickle.dumps(path)) < 300
+
+
+def test_solvers_report_move_sequences() -> None:
+    for solver in (solve_bfs, solve_dfs, solve_astar, solve_idastar, solve_bidirectional_bfs, solve_bidirectional_astar):
+        result = solver(TEST_MEDIUM_3x3, GOAL_3x3)
+
+        assert result["initial_board"] == TEST_MEDIUM_3x3
+        assert len(result["move_sequence"]) == result["moves"]
+        assert result["path"] is result["solution_path"]
+
+        game = PuzzleGame(TEST_MEDIUM_3x3, GOAL_3x3)
+        for action in result["solution_path"].actions:
+            assert game.move_blank_direction(action)
+        assert game.is_solved()
+
+
+def test_encode_actions() -> None:
+    assert encode_actions(["UP", "DOWN", "LEFT", "RIGHT"]) == "UDLR"
+    assert SolutionPath(GOAL_3x3).moves == ""
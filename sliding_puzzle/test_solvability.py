@@ -0,0 +1,62 @@
+import pytest
+
+from game.puzzle_game import PuzzleGame
+from game.puzzle_solver import (
+    UNSOLVABLE,
+    is_unsolvable,
+    solve_astar,
+    solve_bfs,
+    solve_bidirectional_astar,
+    solve_bidirectional_bfs,
+    solve_dfs,
+    solve_idastar,
+)
+from utils.constants import GOAL_3x3, GOAL_4x4, LEVELS, TEST_HARD_4x4, TEST_MEDIUM_3x3, apply_blank_moves
+from utils.solvability import is_solvable
+
+SWAPPED_3x3 = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]
+SWAPPED_4x4 = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 15, 14, 0]]
+
+
+def test_parity_check_on_known_boards() -> None:
+    assert is_solvable(TEST_MEDIUM_3x3, GOAL_3x3)
+    assert is_solvable(TEST_HARD_4x4, GOAL_4x4)
+    assert not is_solvable(SWAPPED_3x3, GOAL_3x3)
+    assert not is_solvable(SWAPPED_4x4, GOAL_4x4)
+
+    # Even width: moving the blank up a row changes the answer for a swapped board.
+    assert not is_solvable(apply_blank_moves(SWAPPED_4x4, ["UP"]), GOAL_4x4)
+    assert is_solvable(apply_blank_moves(GOAL_4x4, ["UP", "LEFT", "UP"]), GOAL_4x4)
+
+    # Mismatched tiles or shapes are never solvable.
+    assert not is_solvable([[1, 2, 3], [4, 5, 6], [7, 9, 0]], GOAL_3x3)
+    assert not is_solvable(GOAL_3x3, GOAL_4x4)
+
+
+def test_all_level_presets_are_solvable() -> None:
+    for presets in LEVELS.values():
+        for level in presets.values():
+            assert is_solvable(level["board"], level["goal"])
+
+
+@pytest.mark.parametrize(
+    "solver",
+    [solve_bfs, solve_dfs, solve_astar, solve_idastar, solve_bidirectional_bfs, solve_bidirectional_astar],
+)
+def test_solvers_reject_unsolvable_boards_without_searching(solver) -> None:
+    result = solver(SWAPPED_4x4, GOAL_4x4)
+
+    assert is_unsolvable(result)
+    assert result["status"] == UNSOLVABLE
+    assert result["nodes_explored"] == 0
+    assert result["solution_path"] == []
+
+
+def test_puzzle_game_disables_solving_for_unsolvable_boards() -> None:
+    game = PuzzleGame(SWAPPED_3x3, GOAL_3x3)
+    assert not game.is_solvable
+    assert not game.can_solve()
+
+    game.reset(board=TEST_MEDIUM_3x3)
+    assert game.is_solvable
+    assert game.can_solve()
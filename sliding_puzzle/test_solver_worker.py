@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from game.puzzle_solver import (
+    solve_anytime_astar,
+    solve_astar,
+    solve_bfs,
+    solve_bidirectional_bfs,
+    solve_dfs,
+    solve_idastar,
+)
+from game.search_monitor import PROGRESS_INTERVAL, SearchCancelled, SearchMonitor
+from game.solver_worker import SolverWorker
+from utils.constants import GOAL_3x3, GOAL_4x4, TEST_HARD_3x3
+
+# One of the two hardest 4x4 positions (80 moves); BFS never finishes it.
+HARDEST_4x4 = [[0, 12, 9, 13], [15, 11, 10, 14], [3, 7, 2, 5], [4, 8, 6, 1]]
+
+
+@pytest.mark.parametrize("solver", [solve_bfs, solve_dfs, solve_astar, solve_idastar, solve_bidirectional_bfs])
+def test_solvers_report_progress_and_stop_when_cancelled(solver) -> None:
+    monitor = SearchMonitor()
+    result = solver(TEST_HARD_3x3, GOAL_3x3, monitor=monitor)
+    if result["nodes_explored"] >= PROGRESS_INTERVAL:
+        assert monitor.nodes_explored >= PROGRESS_INTERVAL
+
+    cancelled = SearchMonitor()
+    cancelled.cancel()
+    if result["nodes_explored"] >= PROGRESS_INTERVAL:
+        with pytest.raises(SearchCancelled):
+            solver(TEST_HARD_3x3, GOAL_3x3, monitor=cancelled)
+
+
+def test_worker_returns_result_in_background() -> None:
+    worker = SolverWorker(solve_astar, TEST_HARD_3x3, GOAL_3x3, "A*").start()
+    worker.join(timeout=30)
+
+    assert worker.done
+    assert not worker.cancelled
+    assert worker.error is None
+    assert worker.result["moves"] == solve_bfs(TEST_HARD_3x3, GOAL_3x3)["moves"]
+
+
+def test_worker_cancel_stops_a_long_search() -> None:
+    worker = SolverWorker(solve_bfs, HARDEST_4x4, GOAL_4x4, "BFS").start()
+    deadline = time.perf_counter() + 10
+    while worker.progress()[0] == 0 and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+    worker.cancel()
+    worker.join(timeout=10)
+
+    assert worker.done
+    assert worker.cancelled
+    assert worker.result is None
+    assert worker.progress()[0] > 0
+
+
+def test_worker_cancel_keeps_the_best_anytime_solution() -> None:
+    worker = SolverWorker(solve_anytime_astar, HARDEST_4x4, GOAL_4x4, "ARA*").start()
+    deadline = time.perf_counter() + 30
+    while worker.best_moves() is None and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+    worker.cancel()
+    worker.join(timeout=10)
+
+    assert worker.done
+    assert not worker.cancelled
+    assert worker.result["moves"] == worker.best_moves() >= 80
+    assert worker.result["solution_path"][-1].board == GOAL_4x4
@@ -0,0 +1,118 @@
+import itertools
+import random
+
+from game.packed_board import BoardLayout
+from game.puzzle_game import PuzzleGame
+from game.puzzle_solver import solve_astar, solve_bfs, solve_dfs, solve_idastar
+from game.transposition import TranspositionTable
+from utils.constants import GOAL_3x3, GOAL_4x4, TEST_HARD_3x3, TEST_HARD_4x4, TEST_MEDIUM_3x3
+from utils.solvability import is_solvable
+
+
+def _random_board(goal, moves, rng):
+    game = PuzzleGame(goal, goal)
+    for _ in range(moves):
+        game.move_blank_direction(rng.choice(["UP", "DOWN", "LEFT", "RIGHT"]))
+    return game.current_board
+
+
+def test_table_respects_memory_cap() -> None:
+    layout = BoardLayout(4, 4)
+    table = TranspositionTable(layout, 4096)
+
+    assert table.memory_bytes <= 4096
+    assert len(table._keys) == table.capacity
+
+    for key in range(1, 10_000):
+        table.store(key, key % 20, key % 7)
+    assert len(table) <= table.capacity
+
+
+def test_store_and_lookup_keep_best_values() -> None:
+    table = TranspositionTable(BoardLayout(3, 3), 1024)
+
+    assert table.bound(12345) == 0
+    assert table.best_g(12345) == 255
+
+    table.store(12345, 6, 3)
+    table.store(12345, 9, 2)
+    table.store(12345, 4, 5)
+    assert table.best_g(12345) == 4
+    assert table.bound(12345) == 5
+
+
+def test_bounds_are_only_reused_with_the_same_excluded_move() -> None:
+    table = TranspositionTable(BoardLayout(3, 3), 1024)
+
+    table.store(777, 3, 8, excluded=4)
+    assert table.bound(777, 4) == 8
+    assert table.bound(777, 2) == 0
+    assert table.bound(777) == 0
+
+    # Bounds excluding two different cells together cover every first move.
+    table.store(777, 3, 6, excluded=2)
+    assert table.bound(777) == table.bound(777, 4) == table.bound(777, 5) == 6
+
+
+def test_shallow_entries_survive_collisions() -> None:
+    table = TranspositionTable(BoardLayout(3, 3), 64)
+    colliding = [key for key in range(1, 5000) if table._slot(key) == table._slot(1)][:4]
+
+    table.store(colliding[0], 1, 9)
+    for key in colliding[1:]:
+        table.store(key, 10, 1)
+
+    assert table.bound(colliding[0]) == 9
+    assert table.bound(colliding[-1]) == 1
+
+
+def test_dfs_paths_are_valid_with_a_tiny_table() -> None:
+    for tt_bytes in (64, 1 << 20):
+        for board in (TEST_MEDIUM_3x3, TEST_HARD_3x3):
+            result = solve_dfs(board, GOAL_3x3, tt_bytes=tt_bytes)
+
+            assert result is not None
+            assert result["moves"] <= 50
+            game = PuzzleGame(board, GOAL_3x3)
+            for action in result["solution_path"].actions:
+                assert game.move_blank_direction(action)
+            assert game.is_solved()
+
+
+def test_idastar_with_table_stays_optimal() -> None:
+    rng = random.Random(15)
+    cases = [(TEST_HARD_3x3, GOAL_3x3), (TEST_HARD_4x4, GOAL_4x4)]
+    cases += [(_random_board(GOAL_3x3, 40, rng), GOAL_3x3) for _ in range(5)]
+
+    for board, goal in cases:
+        optimal = solve_astar(board, goal)["moves"]
+        plain = solve_idastar(board, goal, tt_bytes=0)
+        with_table = solve_idastar(board, goal)
+        tiny_table = solve_idastar(board, goal, tt_bytes=256)
+
+        assert plain["moves"] == with_table["moves"] == tiny_table["moves"] == optimal
+        assert with_table["nodes_explored"] <= plain["nodes_explored"]
+
+
+def _solvable_boards(rows, cols):
+    goal = [[r * cols + c + 1 for c in range(cols)] for r in range(rows)]
+    goal[-1][-1] = 0
+    for values in itertools.permutations(range(rows * cols)):
+        board = [list(values[r * cols : (r + 1) * cols]) for r in range(rows)]
+        if is_solvable(board, goal):
+            yield board, goal
+
+
+def test_idastar_with_a_tiny_table_is_optimal_on_every_small_board() -> None:
+    cases = [(board, goal) for shape in ((2, 3), (3, 2)) for board, goal in _solvable_boards(*shape)]
+    assert len(cases) == 720
+
+    for board, goal in cases:
+        optimal = solve_bfs(board, goal)["moves"]
+        for tt_bytes in (64, 256):
+            assert solve_idastar(board, goal, tt_bytes=tt_bytes)["moves"] == optimal, (board, tt_bytes)
+
+    # Bounds proven without the move back to the parent used to be reused from
+    # other parents, which gave these boards 19 and 26 moves.
+    assert solve_idastar([[3, 2], [4, 1], [0, 5]], [[1, 2], [3, 4], [5, 0]], tt_bytes=256)["moves"] == 15
+    assert solve_idastar([[2, 8, 5], [3, 0, 6], [7, 4, 1]], GOAL_3x3, tt_bytes=2048)["moves"] == 24
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+from game.solution_path import iter_boards
+from utils.constants import SOLVER_DELAY_MS
+
+Board = list[list[int]]
+Cell = tuple[int, int]
+
+SPEEDS: tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+
+
+def _blank_cell(board: Board) -> Cell:
+    for i, row in enumerate(board):
+        for j, value in enumerate(row):
+            if value == 0:
+                return (i, j)
+    raise ValueError("Board has no blank tile")
+
+
+def ease_in_out(t: float) -> float:
+    return t * t * (3 - 2 * t)
+
+
+class SolutionAnimator:
+    """Plays a solution path from the main loop, one tweened move per step.
+
+    The main loop calls ``update(dt_ms)`` with the time returned by ``clock.tick``,
+    so input keeps being handled during playback. Boards are pulled lazily from the
+    solution path; only the current and the next board are held. After the last
+    move the final board stays up for one more step, then ``finished`` is set.
+    """
+
+    def __init__(self, solution_path: Sequence, *, step_ms: int = SOLVER_DELAY_MS):
+        self.step_ms = step_ms
+        self.total_steps = max(0, len(solution_path) - 1)
+        self.step_index = 0
+        self.elapsed_ms = 0.0
+        self.speed_index = SPEEDS.index(1.0)
+        self.playing = True
+        self.finished = False
+
+        self._boards: Iterator[Board] = iter(iter_boards(solution_path))
+        self.board: Board = next(self._boards)
+        self.next_board: Board | None = next(self._boards, None)
+
+    @property
+    def speed(self) -> float:
+        return SPEEDS[self.speed_index]
+
+    def _advance(self) -> None:
+        if self.next_board is None:
+            self.finished = True
+            return
+        self.board = self.next_board
+        self.next_board = next(self._boards, None)
+        self.step_index += 1
+
+    def update(self, dt_ms: float) -> bool:
+        """Advance playback by ``dt_ms`` of wall time; returns True if the frame changed."""
+
+        if not self.playing or self.finished:
+            return False
+
+        self.elapsed_ms += dt_ms * self.speed
+        while self.elapsed_ms >= self.step_ms and not self.finished:
+            self.elapsed_ms -= self.step_ms
+            self._advance()
+        return True
+
+    def sliding(self) -> tuple[int, Cell, Cell, float] | None:
+        """``(tile, from_cell, to_cell, t)`` for the tile currently in motion, if any."""
+
+        if self.finished or self.next_board is None:
+            return None
+
+        to_cell = _blank_cell(self.board)
+        from_cell = _blank_cell(self.next_board)
+        tile = self.board[from_cell[0]][from_cell[1]]
+        t = ease_in_out(min(1.0, self.elapsed_ms / self.step_ms))
+        return (tile, from_cell, to_cell, round(t, 3))
+
+    def toggle_pause(self) -> None:
+        self.playing = not self.playing
+
+    def step(self) -> None:
+        """Pause and jump to the next board."""
+
+        self.playing = False
+        self.elapsed_ms = 0.0
+        if self.next_board is not None:
+            self._advance()
+
+    def speed_up(self) -> None:
+        self.speed_index = min(self.speed_index + 1, len(SPEEDS) - 1)
+
+    def slow_down(self) -> None:
+        self.speed_index = max(self.speed_index - 1, 0)
+
+    def skip_to_end(self) -> None:
+        """Jump to the final board; it is then held for one step before finishing."""
+
+        while self.next_board is not None:
+            self._advance()
+        self.elapsed_ms = 0.0
+        self.playing = True
+
+    def stop(self) -> None:
+        self.finished = True
+
+    def status(self) -> tuple[int, int, float, bool]:
+        return (self.step_index, self.total_steps, self.speed, self.playing)
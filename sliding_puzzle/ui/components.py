@@ -1,5 +1,6 @@
 import pygame
 
+from ui.render_cache import RENDER_CACHE
 from utils.constants import (
     COLOR_BACKGROUND,
     COLOR_BLANK,
@@ -7,6 +8,7 @@ from utils.constants import (
     COLOR_BUTTON_DISABLED,
     COLOR_BUTTON_HOVER,
     COLOR_BUTTON_TEXT,
+    COLOR_ERROR_TEXT,
     COLOR_HIGHLIGHT_BOTH_BG,
     COLOR_HIGHLIGHT_FASTEST_BG,
     COLOR_HIGHLIGHT_MOST_NODES_BG,
@@ -18,51 +20,180 @@ from utils.constants import (
     COLOR_TEXT,
     COLOR_TILE,
     COLOR_UI_TEXT,
-    FONT_NAME,
     FONT_SIZE_TILE,
     FONT_SIZE_UI,
     PADDING,
     TILE_SIZE,
 )
+from utils.boards import GridSize, grid_shape
+
+
+_MISSING = object()
+_FRAME = object()
+
+
+def tile_padding(tile_size: int) -> int:
+    return max(2, PADDING * tile_size // TILE_SIZE)
+
+
+def board_extent(rows: int, cols: int, tile_size: int) -> tuple[int, int]:
+    """Pixel ``(width, height)`` of a board drawn with ``tile_size`` tiles."""
+
+    padding = tile_padding(tile_size)
+    return (cols * (tile_size + padding) - padding, rows * (tile_size + padding) - padding)
+
+
+def fit_tile_size(rows: int, cols: int, max_width: int, max_height: int) -> int:
+    """Largest tile size (up to ``TILE_SIZE``) whose board fits in the given box."""
+
+    tile_size = TILE_SIZE
+    while tile_size > 12:
+        width, height = board_extent(rows, cols, tile_size)
+        if width <= max_width and height <= max_height:
+            break
+        tile_size -= 1
+    return tile_size
+
+
+class DirtyTracker:
+    """Remembers what each screen region last showed, so only changed regions are redrawn.
+
+    Screens pass a small state tuple per region to ``changed``; it returns True (and
+    records the new state) when the region must be drawn again. ``full`` is set
+    until the next complete redraw, e.g. after ``invalidate()`` on window expose.
+    """
+
+    def __init__(self):
+        self.full = True
+        self._drawn: dict[object, object] = {}
+
+    def invalidate(self) -> None:
+        self.full = True
+        self._drawn.clear()
+
+    def begin(self, frame_state: object) -> bool:
+        """Start a frame; returns True when the whole screen must be redrawn.
+
+        ``frame_state`` covers whatever changes the layout of the screen (window
+        size, current view); any change to it invalidates every region.
+        """
+
+        if self._drawn.get(_FRAME, _MISSING) != frame_state:
+            self.invalidate()
+        full = self.full
+        self._drawn[_FRAME] = frame_state
+        self.full = False
+        return full
+
+    def changed(self, region: object, state: object) -> bool:
+        if self._drawn.get(region, _MISSING) == state:
+            return False
+        self._drawn[region] = state
+        return True
+
+    def render_buttons(self, screen: pygame.Surface, buttons) -> list[pygame.Rect]:
+        dirty = []
+        for button in buttons:
+            if self.changed(button, button.state):
+                button.render(screen)
+                dirty.append(button.rect)
+        return dirty
 
 
 class GameBoard:
-    """UI component responsible for rendering the puzzle grid and hit-testing tiles."""
+    """UI component responsible for rendering the puzzle grid and hit-testing tiles.
 
-    def __init__(self, x: int, y: int, grid_size: int):
+    ``grid_size`` is ``n`` for a square board or ``(rows, cols)``; larger boards pass
+    a smaller ``tile_size`` (see ``fit_tile_size``) and the padding and tile font
+    shrink with it.
+    """
+
+    def __init__(self, x: int, y: int, grid_size: GridSize, *, tile_size: int = TILE_SIZE):
         self.x = x
         self.y = y
         self.grid_size = grid_size
-        self.tile_size = TILE_SIZE
-        self.padding = PADDING
-
-    def render(self, screen: pygame.Surface, board: list[list[int]]) -> None:
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                tile_value = board[i][j]
+        self.rows, self.cols = grid_shape(grid_size)
+        self.tile_size = tile_size
+        self.padding = tile_padding(tile_size)
+        self.font_size = max(12, FONT_SIZE_TILE * tile_size // TILE_SIZE)
+        self._drawn: list[list[int]] | None = None
 
-                tile_x = self.x + j * (self.tile_size + self.padding)
-                tile_y = self.y + i * (self.tile_size + self.padding)
-
-                if tile_value == 0:
-                    pygame.draw.rect(screen, COLOR_BLANK, (tile_x, tile_y, self.tile_size, self.tile_size))
-                    continue
+        width, height = board_extent(self.rows, self.cols, tile_size)
+        self.rect = pygame.Rect(x, y, width, height)
 
-                pygame.draw.rect(screen, COLOR_TILE, (tile_x, tile_y, self.tile_size, self.tile_size))
+    def tile_rect(self, row: int, col: int) -> pygame.Rect:
+        return pygame.Rect(
+            self.x + col * (self.tile_size + self.padding),
+            self.y + row * (self.tile_size + self.padding),
+            self.tile_size,
+            self.tile_size,
+        )
+
+    def _draw_tile(self, screen: pygame.Surface, row: int, col: int, tile_value: int) -> pygame.Rect:
+        rect = self.tile_rect(row, col)
+        if tile_value == 0:
+            pygame.draw.rect(screen, COLOR_BLANK, rect)
+        else:
+            screen.blit(RENDER_CACHE.tile(tile_value, self.tile_size, COLOR_TILE, COLOR_TEXT, self.font_size), rect)
+        return rect
 
-                font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_TILE)
-                text = font.render(str(tile_value), True, COLOR_TEXT)
-                text_rect = text.get_rect(center=(tile_x + self.tile_size // 2, tile_y + self.tile_size // 2))
-                screen.blit(text, text_rect)
+    def render(self, screen: pygame.Surface, board: list[list[int]]) -> None:
+        for i in range(self.rows):
+            for j in range(self.cols):
+                self._draw_tile(screen, i, j, board[i][j])
+        self._drawn = [row[:] for row in board]
+
+    def render_changes(self, screen: pygame.Surface, board: list[list[int]]) -> list[pygame.Rect]:
+        """Redraw only the tiles that differ from the last drawn board; returns their rects."""
+
+        if self._drawn is None:
+            pygame.draw.rect(screen, COLOR_BACKGROUND, self.rect)
+            self.render(screen, board)
+            return [self.rect]
+
+        dirty = []
+        for i in range(self.rows):
+            for j in range(self.cols):
+                if board[i][j] != self._drawn[i][j]:
+                    dirty.append(self._draw_tile(screen, i, j, board[i][j]))
+                    self._drawn[i][j] = board[i][j]
+        return dirty
+
+    def render_sliding(
+        self,
+        screen: pygame.Surface,
+        board: list[list[int]],
+        tile_value: int,
+        from_cell: tuple[int, int],
+        to_cell: tuple[int, int],
+        t: float,
+    ) -> pygame.Rect:
+        """Draw ``board`` with ``tile_value`` a fraction ``t`` of the way into the blank.
+
+        The whole board is redrawn (tiles are cached surfaces, so this is a handful
+        of blits) and forgotten, so the next ``render_changes`` starts clean.
+        """
+
+        pygame.draw.rect(screen, COLOR_BACKGROUND, self.rect)
+        for i in range(self.rows):
+            for j in range(self.cols):
+                self._draw_tile(screen, i, j, 0 if (i, j) == from_cell else board[i][j])
+
+        start = self.tile_rect(*from_cell)
+        end = self.tile_rect(*to_cell)
+        x = round(start.x + (end.x - start.x) * t)
+        y = round(start.y + (end.y - start.y) * t)
+        screen.blit(RENDER_CACHE.tile(tile_value, self.tile_size, COLOR_TILE, COLOR_TEXT, self.font_size), (x, y))
+
+        self._drawn = None
+        return self.rect
 
     def get_tile_at_pos(self, mouse_x: int, mouse_y: int) -> tuple[int, int] | None:
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                tile_x = self.x + j * (self.tile_size + self.padding)
-                tile_y = self.y + i * (self.tile_size + self.padding)
-
-                if tile_x <= mouse_x <= tile_x + self.tile_size and tile_y <= mouse_y <= tile_y + self.tile_size:
-                    return (i, j)
+        step = self.tile_size + self.padding
+        i, dy = divmod(mouse_y - self.y, step)
+        j, dx = divmod(mouse_x - self.x, step)
+        if 0 <= i < self.rows and 0 <= j < self.cols and dx <= self.tile_size and dy <= self.tile_size:
+            return (i, j)
         return None
 
 
@@ -72,10 +203,16 @@ class UIButton:
     def __init__(self, x: int, y: int, width: int, height: int, text: str, font_size: int = FONT_SIZE_UI):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = pygame.font.SysFont(FONT_NAME, font_size)
+        self.font = RENDER_CACHE.font(font_size)
         self.is_hovered = False
         self.is_disabled = False
 
+    @property
+    def state(self) -> tuple[str, bool, bool]:
+        """Everything that affects how the button looks, for dirty tracking."""
+
+        return (self.text, self.is_hovered, self.is_disabled)
+
     def render(self, screen: pygame.Surface) -> None:
         if self.is_disabled:
             color = COLOR_BUTTON_DISABLED
@@ -85,7 +222,7 @@ class UIButton:
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, COLOR_UI_TEXT, self.rect, 2)
 
-        text_surface = self.font.render(self.text, True, COLOR_BUTTON_TEXT)
+        text_surface = RENDER_CACHE.text(self.font, self.text, COLOR_BUTTON_TEXT)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -104,8 +241,8 @@ class GameUI:
     def __init__(self, window_width: int, window_height: int):
         self.window_width = window_width
         self.window_height = window_height
-        self.font_ui = pygame.font.SysFont(FONT_NAME, FONT_SIZE_UI)
-        self.font_large = pygame.font.SysFont(FONT_NAME, 24)
+        self.font_ui = RENDER_CACHE.font(FONT_SIZE_UI)
+        self.font_large = RENDER_CACHE.font(24)
 
     def draw_text(
         self,
@@ -119,15 +256,52 @@ class GameUI:
     ) -> None:
         if font is None:
             font = self.font_ui
-        text_surface = font.render(text, True, color)
+        text_surface = RENDER_CACHE.text(font, text, color)
         screen.blit(text_surface, (x, y))
 
-    def draw_solving_status(self, screen: pygame.Surface, algorithm: str | None, x: int, y: int) -> None:
+    def status_height(self) -> int:
+        return RENDER_CACHE.font(FONT_SIZE_UI, bold=True).get_linesize()
+
+    def draw_solving_status(
+        self,
+        screen: pygame.Surface,
+        algorithm: str | None,
+        x: int,
+        y: int,
+        *,
+        nodes_explored: int | None = None,
+        elapsed: float | None = None,
+        best_moves: int | None = None,
+    ) -> None:
         if not algorithm:
             return
 
-        font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_UI, bold=True)
-        self.draw_text(screen, f"Solving with {algorithm}...", x, y, font=font)
+        font = RENDER_CACHE.font(FONT_SIZE_UI, bold=True)
+        text = f"Solving with {algorithm}..."
+        if nodes_explored is not None and elapsed is not None:
+            if best_moves is not None:
+                text += f" best {best_moves} moves so far, {elapsed:.1f}s (Esc to stop)"
+            else:
+                text += f" {nodes_explored:,} nodes, {elapsed:.1f}s (Esc to cancel)"
+        self.draw_text(screen, text, x, y, font=font)
+
+    def draw_playback_status(
+        self,
+        screen: pygame.Surface,
+        step: int,
+        total_steps: int,
+        speed: float,
+        playing: bool,
+        x: int,
+        y: int,
+    ) -> None:
+        state = "" if playing else ", paused"
+        text = f"Step {step}/{total_steps} (x{speed:g}{state})  P pause, N step, +/- speed, End skip, Esc stop"
+        self.draw_text(screen, text, x, y)
+
+    def draw_error_status(self, screen: pygame.Surface, message: str, x: int, y: int) -> None:
+        font = RENDER_CACHE.font(FONT_SIZE_UI, bold=True)
+        self.draw_text(screen, message, x, y, font=font, color=COLOR_ERROR_TEXT)
 
     def draw_comparison_table(
         self,
@@ -138,8 +312,8 @@ class GameUI:
         width: int,
         height: int,
     ) -> None:
-        header_font = pygame.font.SysFont(FONT_NAME, 14, bold=True)
-        row_font = pygame.font.SysFont(FONT_NAME, 14)
+        header_font = RENDER_CACHE.font(14, bold=True)
+        row_font = RENDER_CACHE.font(14)
 
         header_height = 26
         row_height = 22
@@ -173,7 +347,7 @@ class GameUI:
             current_x += col_width
 
         for col_rect, (title, _, _) in zip(col_rects, columns):
-            text_surface = header_font.render(title, True, COLOR_TABLE_HEADER_TEXT)
+            text_surface = RENDER_CACHE.text(header_font, title, COLOR_TABLE_HEADER_TEXT)
             text_rect = text_surface.get_rect(center=col_rect.center)
             screen.blit(text_surface, text_rect)
 
@@ -209,12 +383,12 @@ class GameUI:
                     display = str(value)
 
                 cell_rect = pygame.Rect(col_rect.x, row_y, col_rect.width, row_height)
-                text_surface = row_font.render(display, True, COLOR_UI_TEXT)
+                text_surface = RENDER_CACHE.text(row_font, display, COLOR_UI_TEXT)
                 text_rect = text_surface.get_rect(center=cell_rect.center)
                 screen.blit(text_surface, text_rect)
 
     def draw_win_message(self, screen: pygame.Surface) -> None:
-        text_surface = self.font_large.render("SOLVED!", True, (0, 200, 0))
+        text_surface = RENDER_CACHE.text(self.font_large, "SOLVED!", (0, 200, 0))
         text_rect = text_surface.get_rect(center=(self.window_width // 2, 30))
 
         padding = 10
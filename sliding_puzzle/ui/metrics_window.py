@@ -97,6 +97,10 @@ class MetricsWindow:
             self.close()
             return True
 
+        if event.type == pygame.WINDOWEXPOSED and self._is_event_for_this_window(event):
+            self._screen.invalidate()
+            return True
+
         if event.type in (pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED) and self._is_event_for_this_window(event):
             new_w = getattr(event, "x", None) or getattr(event, "w", None)
             new_h = getattr(event, "y", None) or getattr(event, "h", None)
@@ -152,7 +156,9 @@ class MetricsWindow:
             self._resize_surfaces(size[0], size[1])
             self._screen.resize(size[0], size[1])
 
-        self._screen.render(self._surface)
+        # Nothing changed: the window still shows the last presented frame.
+        if not self._screen.render(self._surface):
+            return
 
         self._texture.update(self._surface)
         self._renderer.clear()
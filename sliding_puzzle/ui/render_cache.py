@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+from utils.constants import FONT_NAME
+
+Color = tuple[int, int, int]
+
+
+class RenderCache:
+    """Fonts, text surfaces and tile surfaces shared by every UI component.
+
+    ``pygame.font.SysFont`` does a system font lookup and ``Font.render`` rasterises
+    glyphs, so both are done once per distinct input and reused across frames and
+    across components recreated on resize. Text surfaces are kept in a bounded LRU
+    because some labels (solver progress) change every frame.
+
+    Fonts die with ``pygame.quit()``, so the cache registers itself to be cleared
+    then and starts over on the next ``pygame.init()``.
+    """
+
+    def __init__(self, max_text_surfaces: int = 512):
+        self.max_text_surfaces = max_text_surfaces
+        self._fonts: dict[tuple[int, bool], pygame.font.Font] = {}
+        self._text: OrderedDict[tuple[pygame.font.Font, str, Color], pygame.Surface] = OrderedDict()
+        self._tiles: dict[tuple[int, int, Color, Color, int], pygame.Surface] = {}
+        self._quit_registered = False
+
+    def _register_quit(self) -> None:
+        if not self._quit_registered:
+            pygame.register_quit(self.clear)
+            self._quit_registered = True
+
+    def clear(self) -> None:
+        self._fonts.clear()
+        self._text.clear()
+        self._tiles.clear()
+        self._quit_registered = False
+
+    def font(self, size: int, *, bold: bool = False) -> pygame.font.Font:
+        key = (size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            self._register_quit()
+            font = self._fonts[key] = pygame.font.SysFont(FONT_NAME, size, bold=bold)
+        return font
+
+    def text(self, font: pygame.font.Font, text: str, color: Color) -> pygame.Surface:
+        key = (font, text, color)
+        surface = self._text.get(key)
+        if surface is not None:
+            self._text.move_to_end(key)
+            return surface
+
+        self._register_quit()
+        surface = self._text[key] = font.render(text, True, color)
+        if len(self._text) > self.max_text_surfaces:
+            self._text.popitem(last=False)
+        return surface
+
+    def tile(self, value: int, tile_size: int, tile_color: Color, text_color: Color, font_size: int) -> pygame.Surface:
+        """A finished ``tile_size`` square with ``value`` centred on it."""
+
+        key = (value, tile_size, tile_color, text_color, font_size)
+        surface = self._tiles.get(key)
+        if surface is None:
+            self._register_quit()
+            surface = pygame.Surface((tile_size, tile_size))
+            surface.fill(tile_color)
+            text = self.font(font_size).render(str(value), True, text_color)
+            surface.blit(text, text.get_rect(center=(tile_size // 2, tile_size // 2)))
+            self._tiles[key] = surface
+        return surface
+
+
+RENDER_CACHE = RenderCache()
@@ -1,6 +1,9 @@
 import pygame
 
-from ui.components import GameBoard, UIButton, GameUI
+from game.puzzle_game import MetricsResults
+from game.puzzle_solver import EXACT_SEARCH_MAX_CELLS
+from ui.components import DirtyTracker, GameBoard, UIButton, GameUI, board_extent, fit_tile_size
+from ui.render_cache import RENDER_CACHE
 from utils.constants import (
     COLOR_BACKGROUND,
     COLOR_TABLE_BORDER,
@@ -11,27 +14,28 @@ from utils.constants import (
     COLOR_TITLE,
     COLOR_UI_TEXT,
     DIFFICULTIES,
-    FONT_NAME,
     FONT_SIZE_BUTTON,
     FONT_SIZE_TITLE,
+    GRID_SIZES,
     PADDING,
-    TILE_SIZE,
     get_level,
 )
+from utils.boards import GridSize, grid_label, grid_shape
 
 
 class MenuScreen:
-    """Two-step menu flow: grid selection (3x3/4x4) then difficulty selection."""
+    """Two-step menu flow: grid selection (``GRID_SIZES``) then difficulty selection."""
 
     def __init__(self, window_width: int, window_height: int):
         self.window_width = window_width
         self.window_height = window_height
 
-        self.title_font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_TITLE, bold=True)
-        self.subtitle_font = pygame.font.SysFont(FONT_NAME, 18)
+        self.title_font = RENDER_CACHE.font(FONT_SIZE_TITLE, bold=True)
+        self.subtitle_font = RENDER_CACHE.font(18)
 
         self.view: str = "grid"
-        self.selected_grid_size: int | None = None
+        self.selected_grid_size: GridSize | None = None
+        self.dirty = DirtyTracker()
 
         self._create_buttons()
 
@@ -42,18 +46,22 @@ class MenuScreen:
 
         center_x = (self.window_width - button_width) // 2
 
-        grid_start_y = 240
-        self.grid_buttons: dict[int, UIButton] = {
-            3: UIButton(center_x, grid_start_y, button_width, button_height, "3x3 Grid", FONT_SIZE_BUTTON),
-            4: UIButton(
-                center_x,
-                grid_start_y + button_height + button_spacing,
-                button_width,
+        # Grid sizes in two columns, filled top to bottom.
+        grid_start_y = 190
+        grid_button_width = 220
+        per_column = (len(GRID_SIZES) + 1) // 2
+        left_x = self.window_width // 2 - grid_button_width - button_spacing // 2
+        self.grid_buttons: dict[GridSize, UIButton] = {}
+        for i, grid_size in enumerate(GRID_SIZES):
+            column, row = divmod(i, per_column)
+            self.grid_buttons[grid_size] = UIButton(
+                left_x + column * (grid_button_width + button_spacing),
+                grid_start_y + row * (button_height + button_spacing),
+                grid_button_width,
                 button_height,
-                "4x4 Grid",
+                f"{grid_label(grid_size)} Grid",
                 FONT_SIZE_BUTTON,
-            ),
-        }
+            )
 
         diff_start_y = 210
         self.difficulty_buttons: dict[str, UIButton] = {}
@@ -67,6 +75,17 @@ class MenuScreen:
     def reset(self) -> None:
         self.view = "grid"
         self.selected_grid_size = None
+        self.dirty.invalidate()
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next ``render`` (e.g. after the window was exposed)."""
+
+        self.dirty.invalidate()
+
+    def _visible_buttons(self) -> list[UIButton]:
+        if self.view == "grid":
+            return list(self.grid_buttons.values())
+        return [*self.difficulty_buttons.values(), self.back_button]
 
     def can_go_back(self) -> bool:
         return self.view == "difficulty"
@@ -75,10 +94,15 @@ class MenuScreen:
         if self.can_go_back():
             self.reset()
 
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Draw the menu; returns the rectangles that changed since the last call."""
+
+        if not self.dirty.begin((screen.get_size(), self.view, self.selected_grid_size)):
+            return self.dirty.render_buttons(screen, self._visible_buttons())
+
         screen.fill(COLOR_BACKGROUND)
 
-        title_text = self.title_font.render("SLIDING PUZZLE", True, COLOR_TITLE)
+        title_text = RENDER_CACHE.text(self.title_font, "SLIDING PUZZLE", COLOR_TITLE)
         title_rect = title_text.get_rect(center=(self.window_width // 2, 80))
         screen.blit(title_text, title_rect)
 
@@ -86,21 +110,15 @@ class MenuScreen:
             subtitle = "Select Grid Size"
             subtitle_y = 150
         else:
-            grid = self.selected_grid_size or 3
-            subtitle = f"Select Difficulty ({grid}x{grid})"
+            subtitle = f"Select Difficulty ({grid_label(self.selected_grid_size or 3)})"
             subtitle_y = 140
 
-        subtitle_text = self.subtitle_font.render(subtitle, True, COLOR_UI_TEXT)
+        subtitle_text = RENDER_CACHE.text(self.subtitle_font, subtitle, COLOR_UI_TEXT)
         subtitle_rect = subtitle_text.get_rect(center=(self.window_width // 2, subtitle_y))
         screen.blit(subtitle_text, subtitle_rect)
 
-        if self.view == "grid":
-            for button in self.grid_buttons.values():
-                button.render(screen)
-        else:
-            for button in self.difficulty_buttons.values():
-                button.render(screen)
-            self.back_button.render(screen)
+        self.dirty.render_buttons(screen, self._visible_buttons())
+        return [screen.get_rect()]
 
     def handle_click(self, mouse_pos: tuple[int, int]) -> dict[str, object] | None:
         if self.view == "grid":
@@ -139,81 +157,66 @@ class GameScreen:
         self,
         window_width: int,
         window_height: int,
-        grid_size: int,
+        grid_size: GridSize,
         metrics_results: list[dict[str, object]] | None = None,
     ):
         self.window_width = window_width
         self.window_height = window_height
         self.grid_size = grid_size
-
-        board_size = grid_size * TILE_SIZE + (grid_size - 1) * PADDING
+        rows, cols = grid_shape(grid_size)
 
         panel_width = 220
-        content_width = board_size + PADDING + panel_width
+        board_y = 50
+        table_gap = 18
+        min_table_height = 90
+
+        # Boards larger than 4x4 shrink their tiles to leave room for the panel and table.
+        tile_size = fit_tile_size(
+            rows,
+            cols,
+            window_width - panel_width - PADDING - 2 * 20,
+            window_height - board_y - table_gap - min_table_height,
+        )
+        board_width, board_height = board_extent(rows, cols, tile_size)
+        content_width = board_width + PADDING + panel_width
 
         board_x = (window_width - content_width) // 2
-        board_y = 50
 
-        self.board = GameBoard(board_x, board_y, grid_size)
+        self.board = GameBoard(board_x, board_y, grid_size, tile_size=tile_size)
         self.ui = GameUI(window_width, window_height)
 
-        panel_x = board_x + board_size + PADDING
+        panel_x = board_x + board_width + PADDING
         panel_y = board_y
 
         button_width = panel_width
-        button_height = 42
-        button_spacing = 10
-
-        self.button_solve_bfs = UIButton(panel_x, panel_y, button_width, button_height, "Solve with BFS")
-        self.button_solve_dfs = UIButton(
-            panel_x,
-            panel_y + (button_height + button_spacing),
-            button_width,
-            button_height,
-            "Solve with DFS",
-        )
-        self.button_solve_astar = UIButton(
-            panel_x,
-            panel_y + 2 * (button_height + button_spacing),
-            button_width,
-            button_height,
-            "Solve with A*",
-        )
-
-        self.button_shuffle = UIButton(
-            panel_x,
-            panel_y + 3 * (button_height + button_spacing),
-            button_width,
-            button_height,
-            "Shuffle",
-        )
-
-        self.button_undo = UIButton(
-            panel_x,
-            panel_y + 4 * (button_height + button_spacing),
-            button_width,
-            button_height,
-            "Undo",
-        )
-        self.button_metrics = UIButton(
-            panel_x,
-            panel_y + 5 * (button_height + button_spacing),
-            button_width,
-            button_height,
-            "Metrics",
-        )
-        self.button_back = UIButton(
-            panel_x,
-            panel_y + 6 * (button_height + button_spacing),
-            button_width,
-            button_height,
-            "Back to Menu",
-        )
+        button_height = 36
+        button_spacing = 8
+
+        def panel_button(index: int, label: str) -> UIButton:
+            return UIButton(panel_x, panel_y + index * (button_height + button_spacing), button_width, button_height, label)
+
+        self.button_solve_bfs = panel_button(0, "Solve with BFS")
+        self.button_solve_dfs = panel_button(1, "Solve with DFS")
+        self.button_solve_astar = panel_button(2, "Solve with A*")
+        self.button_solve_idastar = panel_button(3, "Solve with IDA*")
+        self.button_solve_bidirectional = panel_button(4, "Solve with Bi-BFS")
+        self.button_solve_greedy = panel_button(5, "Solve with Greedy")
+        self.button_solve_reduction = panel_button(6, "Solve with Reduction")
+        self.button_solve_anytime = panel_button(7, "Solve with ARA*")
+        self.button_shuffle = panel_button(8, "Shuffle")
+        self.button_undo = panel_button(9, "Undo")
+        self.button_metrics = panel_button(10, "Metrics")
+        self.button_back = panel_button(11, "Back to Menu")
 
         self.buttons = [
             self.button_solve_bfs,
             self.button_solve_dfs,
             self.button_solve_astar,
+            self.button_solve_idastar,
+            self.button_solve_bidirectional,
+            self.button_solve_greedy,
+            self.button_solve_reduction,
+            self.button_solve_anytime,
             self.button_shuffle,
             self.button_undo,
             self.button_metrics,
@@ -221,25 +224,66 @@ class GameScreen:
         ]
 
         self.table_x = board_x
-        self.table_y = board_y + board_size + 18
+        self.table_y = board_y + board_height + table_gap
         self.table_width = content_width
         self.table_height = max(60, window_height - self.table_y - 10)
 
+        # GameScreen action -> solve button; while a solver runs its button cancels it.
+        self.solver_buttons = {
+            "solve_bfs": self.button_solve_bfs,
+            "solve_dfs": self.button_solve_dfs,
+            "solve_astar": self.button_solve_astar,
+            "solve_idastar": self.button_solve_idastar,
+            "solve_bidirectional_bfs": self.button_solve_bidirectional,
+            "solve_greedy": self.button_solve_greedy,
+            "solve_reduction": self.button_solve_reduction,
+            "solve_anytime": self.button_solve_anytime,
+        }
+        self.solver_button_labels = {action: button.text for action, button in self.solver_buttons.items()}
+        # Exact solvers would run for minutes or hours on bigger boards; only greedy and
+        # reduction are offered there.
+        self.exact_search = rows * cols <= EXACT_SEARCH_MAX_CELLS
+
         self.is_solving = False
         self.solving_algorithm: str | None = None
+        self.solving_action: str | None = None
+        self.solving_nodes: int | None = None
+        self.solving_elapsed: float | None = None
+        self.solving_best_moves: int | None = None
+        # Why the last solver failed; shown in the status line until the next solve.
+        self.solver_error: str | None = None
 
-        self.comparison_results = metrics_results if metrics_results is not None else []
+        self.comparison_results = metrics_results if metrics_results is not None else MetricsResults()
 
-    def render(self, screen: pygame.Surface, game) -> None:
-        screen.fill(COLOR_BACKGROUND)
+        # SolutionAnimator set by the main loop while a solution is played back.
+        self.animation = None
+
+        self.dirty = DirtyTracker()
+        self.status_rect = pygame.Rect(0, 20, window_width, self.ui.status_height())
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next ``render`` (e.g. after the window was exposed)."""
+
+        self.dirty.invalidate()
 
-        self.board.render(screen, game.current_board)
+    def render(self, screen: pygame.Surface, game) -> list[pygame.Rect]:
+        """Draw the screen; returns the rectangles that changed since the last call.
+
+        Only moved tiles, buttons whose look changed and the status line are
+        redrawn; while playback slides a tile the board is redrawn as one region.
+        The win banner overlaps the status line and the top of the board, so it is
+        part of the frame state and changes to it redraw everything.
+        """
 
         can_solve = game.can_solve() and not game.is_animating and not self.is_solving
 
-        self.button_solve_bfs.is_disabled = not can_solve
-        self.button_solve_dfs.is_disabled = not can_solve
-        self.button_solve_astar.is_disabled = not can_solve
+        for action, button in self.solver_buttons.items():
+            if self.is_solving and action == self.solving_action:
+                button.text = "Cancel"
+                button.is_disabled = False
+            else:
+                button.text = self.solver_button_labels[action]
+                button.is_disabled = not can_solve or not self.solver_enabled(action)
 
         busy = game.is_animating or self.is_solving
         self.button_shuffle.is_disabled = busy
@@ -247,28 +291,73 @@ class GameScreen:
 
         self.button_undo.is_disabled = busy or not game.can_undo()
 
-        for button in self.buttons:
-            button.render(screen)
-
+        solved = game.is_solved()
+        status = None
         if self.is_solving:
-            self.ui.draw_solving_status(screen, self.solving_algorithm, self.button_solve_bfs.rect.x, 20)
+            elapsed = None if self.solving_elapsed is None else round(self.solving_elapsed, 1)
+            status = ("solving", self.solving_algorithm, self.solving_nodes, elapsed, self.solving_best_moves)
+        elif self.animation is not None:
+            status = ("playback", *self.animation.status())
+        elif self.solver_error is not None:
+            status = ("error", self.solver_error)
+        sliding = self.animation.sliding() if self.animation is not None else None
+
+        if not self.dirty.begin((screen.get_size(), solved, status if solved else None)):
+            dirty = []
+            if sliding is not None:
+                if self.dirty.changed("sliding", sliding):
+                    dirty.append(self.board.render_sliding(screen, game.current_board, *sliding))
+            else:
+                self.dirty.changed("sliding", None)
+                dirty.extend(self.board.render_changes(screen, game.current_board))
+            dirty.extend(self.dirty.render_buttons(screen, self.buttons))
+            if self.dirty.changed("status", status):
+                self._draw_status(screen)
+                dirty.append(self.status_rect)
+            return dirty
 
-        if game.is_solved():
+        screen.fill(COLOR_BACKGROUND)
+        self.dirty.changed("sliding", sliding)
+        if sliding is not None:
+            self.board.render_sliding(screen, game.current_board, *sliding)
+        else:
+            self.board.render(screen, game.current_board)
+        self.dirty.render_buttons(screen, self.buttons)
+        self.dirty.changed("status", status)
+        self._draw_status(screen)
+
+        if solved:
             self.ui.draw_win_message(screen)
 
+        return [screen.get_rect()]
+
+    def _draw_status(self, screen: pygame.Surface) -> None:
+        pygame.draw.rect(screen, COLOR_BACKGROUND, self.status_rect)
+        if self.is_solving:
+            self.ui.draw_solving_status(
+                screen,
+                self.solving_algorithm,
+                self.board.x,
+                self.status_rect.y,
+                nodes_explored=self.solving_nodes,
+                elapsed=self.solving_elapsed,
+                best_moves=self.solving_best_moves,
+            )
+        elif self.animation is not None:
+            self.ui.draw_playback_status(screen, *self.animation.status(), self.board.x, self.status_rect.y)
+        elif self.solver_error is not None:
+            self.ui.draw_error_status(screen, self.solver_error, self.board.x, self.status_rect.y)
+
     def handle_click(self, mouse_pos: tuple[int, int], _game) -> tuple[str | None, object | None]:
         tile = self.board.get_tile_at_pos(mouse_pos[0], mouse_pos[1])
         if tile:
             return ("tile_click", tile)
 
-        if self.button_solve_bfs.is_clicked(mouse_pos):
-            return ("solve_bfs", None)
-
-        if self.button_solve_dfs.is_clicked(mouse_pos):
-            return ("solve_dfs", None)
-
-        if self.button_solve_astar.is_clicked(mouse_pos):
-            return ("solve_astar", None)
+        for action, button in self.solver_buttons.items():
+            if button.is_clicked(mouse_pos):
+                if self.is_solving and action == self.solving_action:
+                    return ("cancel_solve", None)
+                return (action, None)
 
         if self.button_shuffle.is_clicked(mouse_pos):
             return ("shuffle", None)
@@ -288,9 +377,28 @@ class GameScreen:
         for button in self.buttons:
             button.update_hover(mouse_pos)
 
-    def set_solving(self, is_solving: bool, algorithm: str | None = None) -> None:
+    def solver_enabled(self, action: str) -> bool:
+        if action == "solve_table3x3":
+            return grid_shape(self.grid_size) == (3, 3)
+        return self.exact_search or action in ("solve_greedy", "solve_reduction")
+
+    def set_solving(self, is_solving: bool, algorithm: str | None = None, action: str | None = None) -> None:
         self.is_solving = is_solving
         self.solving_algorithm = algorithm if is_solving else None
+        self.solving_action = action if is_solving else None
+        self.solving_nodes = None
+        self.solving_elapsed = None
+        self.solving_best_moves = None
+        if is_solving:
+            self.solver_error = None
+
+    def set_solver_error(self, message: str) -> None:
+        self.solver_error = message
+
+    def update_solving_progress(self, nodes_explored: int, elapsed: float, best_moves: int | None = None) -> None:
+        self.solving_nodes = nodes_explored
+        self.solving_elapsed = elapsed
+        self.solving_best_moves = best_moves
 
     def add_comparison_result(self, algorithm: str, result: dict[str, object]) -> None:
         self.comparison_results.append(
@@ -325,20 +433,25 @@ class MetricsScreen:
         self.page_index = 0
         self.rows_per_page = 10
 
-        self.title_font = pygame.font.SysFont(FONT_NAME, 28, bold=True)
-        self.header_font = pygame.font.SysFont(FONT_NAME, 16, bold=True)
-        self.row_font = pygame.font.SysFont(FONT_NAME, 16)
-        self.page_font = pygame.font.SysFont(FONT_NAME, 16)
+        self.title_font = RENDER_CACHE.font(28, bold=True)
+        self.header_font = RENDER_CACHE.font(16, bold=True)
+        self.row_font = RENDER_CACHE.font(16)
+        self.page_font = RENDER_CACHE.font(16)
 
         self.header_height = 30
         self.row_height = 26
+        self.dirty = DirtyTracker()
 
         self._create_layout()
 
+    def invalidate(self) -> None:
+        self.dirty.invalidate()
+
     def resize(self, window_width: int, window_height: int) -> None:
         self.window_width = window_width
         self.window_height = window_height
         self._create_layout()
+        self.dirty.invalidate()
 
     def _create_layout(self) -> None:
         margin = 18
@@ -460,14 +573,38 @@ class MetricsScreen:
         end = start + self.rows_per_page
         return results[start:end]
 
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Redraw only when the table, page or a button changed; returns ``[]`` otherwise.
+
+        The rows are a shared ``MetricsResults``; its revision changes whenever they
+        are added or cleared, even if the count ends up the same.
+        """
+
         self._clamp_page()
+        total_pages = self.get_total_pages()
+        self.button_prev.is_disabled = self.page_index <= 0
+        self.button_next.is_disabled = self.page_index >= total_pages - 1
+        self.button_close.is_disabled = False  # Always allow close
+        self.button_close_x.is_disabled = False  # Always allow close
+
+        frame_state = (
+            screen.get_size(),
+            len(self.results),
+            getattr(self.results, "revision", None),
+            self.page_index,
+            self.rows_per_page,
+            self.sort_by_time,
+            tuple(button.state for button in self.buttons),
+        )
+        if not self.dirty.begin(frame_state):
+            return []
+
         screen.fill(COLOR_BACKGROUND)
 
         pygame.draw.rect(screen, COLOR_TABLE_ROW_BG_1, self.panel_rect)
         pygame.draw.rect(screen, COLOR_TABLE_BORDER, self.panel_rect, 2)
 
-        title_surface = self.title_font.render("Algorithm Comparison Metrics", True, COLOR_TITLE)
+        title_surface = RENDER_CACHE.text(self.title_font, "Algorithm Comparison Metrics", COLOR_TITLE)
         title_rect = title_surface.get_rect(center=(self.panel_rect.centerx, self.title_center_y))
         screen.blit(title_surface, title_rect)
 
@@ -482,26 +619,22 @@ class MetricsScreen:
         results = self._get_sorted_results()
         if not results:
             pygame.draw.rect(screen, COLOR_TABLE_BORDER, self.table_rect, 1)
-            empty_text = self.row_font.render("No metrics yet. Run a solver to see results.", True, COLOR_UI_TEXT)
+            empty_text = RENDER_CACHE.text(self.row_font, "No metrics yet. Run a solver to see results.", COLOR_UI_TEXT)
             empty_rect = empty_text.get_rect(center=self.table_rect.center)
             screen.blit(empty_text, empty_rect)
         else:
             self._draw_table(screen, self.get_page_results())
 
-        total_pages = self.get_total_pages()
-        self.button_prev.is_disabled = self.page_index <= 0
-        self.button_next.is_disabled = self.page_index >= total_pages - 1
-        self.button_close.is_disabled = False  # Always allow close
-        self.button_close_x.is_disabled = False  # Always allow close
-
         for button in self.buttons:
             button.render(screen)
 
         page_label = f"Page {self.page_index + 1} of {total_pages}"
-        page_surface = self.page_font.render(page_label, True, COLOR_UI_TEXT)
+        page_surface = RENDER_CACHE.text(self.page_font, page_label, COLOR_UI_TEXT)
         page_rect = page_surface.get_rect(center=(self.panel_rect.centerx, self.button_prev.rect.centery))
         screen.blit(page_surface, page_rect)
 
+        return [screen.get_rect()]
+
     def _draw_table(self, screen: pygame.Surface, page_results: list[dict[str, object]]) -> None:
         pygame.draw.rect(screen, COLOR_TABLE_BORDER, self.table_rect, 1)
 
@@ -529,7 +662,7 @@ class MetricsScreen:
             current_x += col_width
 
         for col_rect, (title, _, _) in zip(col_rects, columns):
-            text_surface = self.header_font.render(title, True, COLOR_TABLE_HEADER_TEXT)
+            text_surface = RENDER_CACHE.text(self.header_font, title, COLOR_TABLE_HEADER_TEXT)
             text_rect = text_surface.get_rect(center=col_rect.center)
             screen.blit(text_surface, text_rect)
 
@@ -560,7 +693,7 @@ class MetricsScreen:
                     display = "" if value is None else str(value)
 
                 cell_rect = pygame.Rect(col_rect.x, row_y, col_rect.width, self.row_height)
-                text_surface = self.row_font.render(display, True, COLOR_UI_TEXT)
+                text_surface = RENDER_CACHE.text(self.row_font, display, COLOR_UI_TEXT)
                 text_rect = text_surface.get_rect(center=cell_rect.center)
                 screen.blit(text_surface, text_rect)
 
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import random
+
+Board = list[list[int]]
+GridSize = int | tuple[int, int]
+
+MAX_GRID_SIDE = 8
+
+
+def grid_shape(grid_size: GridSize) -> tuple[int, int]:
+    """``(rows, cols)`` for a grid size given as ``n`` (square) or ``(rows, cols)``."""
+
+    rows, cols = (grid_size, grid_size) if isinstance(grid_size, int) else grid_size
+    if not (2 <= rows <= MAX_GRID_SIDE and 2 <= cols <= MAX_GRID_SIDE):
+        raise ValueError(f"Grid {rows}x{cols} is outside 2x2..{MAX_GRID_SIDE}x{MAX_GRID_SIDE}")
+    return rows, cols
+
+
+def grid_label(grid_size: GridSize) -> str:
+    rows, cols = grid_shape(grid_size)
+    return f"{rows}x{cols}"
+
+
+def make_goal(rows: int, cols: int) -> Board:
+    """Tiles 1..n-1 in row-major order with the blank in the bottom-right corner."""
+
+    values = list(range(1, rows * cols)) + [0]
+    return [values[i * cols : (i + 1) * cols] for i in range(rows)]
+
+
+def random_walk_board(goal: Board, moves: int, rng: random.Random) -> Board:
+    """Slide the blank ``moves`` times from ``goal``, never undoing the previous move.
+
+    The result is always solvable and at most ``moves`` moves from the goal.
+    """
+
+    board = [row[:] for row in goal]
+    rows, cols = len(board), len(board[0])
+    r, c = next((i, j) for i in range(rows) for j in range(cols) if board[i][j] == 0)
+    previous = None
+
+    for _ in range(moves):
+        options = [
+            (r + dr, c + dc)
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= r + dr < rows and 0 <= c + dc < cols and (r + dr, c + dc) != previous
+        ]
+        nr, nc = rng.choice(options)
+        board[r][c], board[nr][nc] = board[nr][nc], 0
+        previous = (r, c)
+        r, c = nr, nc
+
+    return board
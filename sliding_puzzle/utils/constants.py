@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import random
 from typing import Iterable, Literal
 
+from utils.boards import GridSize, grid_label, grid_shape, make_goal, random_walk_board
+from utils.solvability import is_solvable
+
 Board = list[list[int]]
 Move = Literal["UP", "DOWN", "LEFT", "RIGHT"]
 
@@ -22,6 +26,7 @@ COLOR_BUTTON_DISABLED = (150, 150, 150)
 COLOR_BUTTON_TEXT = (255, 255, 255)
 COLOR_UI_TEXT = (50, 50, 50)
 COLOR_TITLE = (41, 128, 185)
+COLOR_ERROR_TEXT = (192, 57, 43)
 
 # Table styling
 COLOR_TABLE_HEADER_BG = (52, 73, 94)
@@ -36,6 +41,7 @@ COLOR_HIGHLIGHT_BOTH_BG = (255, 245, 200)
 # Shuffle settings
 SHUFFLE_MOVES_3x3 = 30
 SHUFFLE_MOVES_4x4 = 60
+SHUFFLE_MOVES_PER_CELL = 8
 
 FONT_NAME = "Arial"
 FONT_SIZE_TILE = 28
@@ -120,7 +126,7 @@ TEST_EXPERT_4x4: Board = TEST_HARD_4x4
 
 DIFFICULTIES: tuple[str, ...] = ("easy", "medium", "hard")
 
-LEVELS: dict[int, dict[str, dict[str, object]]] = {
+LEVELS: dict[GridSize, dict[str, dict[str, object]]] = {
     3: {
         "easy": {
             "board": TEST_EASY_3x3,
@@ -170,7 +176,50 @@ LEVELS: dict[int, dict[str, dict[str, object]]] = {
 }
 
 
-def get_level(grid_size: int, difficulty: str) -> dict[str, object]:
+# Larger and rectangular boards get seeded random-walk presets.
+GENERATED_GRID_SIZES: tuple[GridSize, ...] = ((3, 5), (4, 6), 5, 6, 7, 8)
+GENERATED_SHUFFLE_MOVES: dict[str, int] = {"easy": 10, "medium": 40, "hard": 400}
+
+
+def _generated_level(grid_size: GridSize, difficulty: str) -> dict[str, object]:
+    rows, cols = grid_shape(grid_size)
+    goal = make_goal(rows, cols)
+    moves = GENERATED_SHUFFLE_MOVES[difficulty]
+    return {
+        "board": random_walk_board(goal, moves, random.Random(f"{rows}x{cols}-{difficulty}")),
+        "goal": goal,
+        "grid_size": grid_size,
+        "name": difficulty.capitalize(),
+        "description": f"{moves} shuffle moves",
+    }
+
+
+for _grid_size in GENERATED_GRID_SIZES:
+    LEVELS[_grid_size] = {difficulty: _generated_level(_grid_size, difficulty) for difficulty in DIFFICULTIES}
+
+# Menu order.
+GRID_SIZES: tuple[GridSize, ...] = tuple(LEVELS)
+
+
+def shuffle_moves_for(rows: int, cols: int) -> int:
+    if (rows, cols) == (3, 3):
+        return SHUFFLE_MOVES_3x3
+    if (rows, cols) == (4, 4):
+        return SHUFFLE_MOVES_4x4
+    return SHUFFLE_MOVES_PER_CELL * rows * cols
+
+
+def _validate_levels() -> None:
+    for grid_size, presets in LEVELS.items():
+        for difficulty, level in presets.items():
+            if not is_solvable(level["board"], level["goal"]):
+                raise ValueError(f"Level preset {grid_label(grid_size)} '{difficulty}' is not solvable")
+
+
+_validate_levels()
+
+
+def get_level(grid_size: GridSize, difficulty: str) -> dict[str, object]:
     """Return the level preset for a given grid size and difficulty."""
 
     level = LEVELS.get(grid_size, {}).get(difficulty)
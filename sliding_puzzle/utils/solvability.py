@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+Board = list[list[int]]
+
+
+def count_inversions(values: list[int]) -> int:
+    inversions = 0
+    for i, value in enumerate(values):
+        for other in values[i + 1 :]:
+            if other < value:
+                inversions += 1
+    return inversions
+
+
+def is_solvable(board: Board, goal_board: Board) -> bool:
+    """Return True if ``board`` can reach ``goal_board`` by sliding tiles.
+
+    Every move swaps the blank with a neighbour: it flips the parity of the
+    permutation (inversions counted over all cells, blank included) and moves the
+    blank by one cell. So a board is solvable exactly when the permutation parity
+    relative to the goal matches the parity of the blank's row + column distance
+    to its goal cell. This covers odd and even widths and any goal layout, and runs
+    in O(n^2) for n cells.
+    """
+
+    if len(board) != len(goal_board) or any(len(a) != len(b) for a, b in zip(board, goal_board)):
+        return False
+
+    flat = [value for row in board for value in row]
+    goal_flat = [value for row in goal_board for value in row]
+    if sorted(flat) != sorted(goal_flat) or len(set(flat)) != len(flat) or 0 not in flat:
+        return False
+
+    goal_index = {value: i for i, value in enumerate(goal_flat)}
+    permutation_parity = count_inversions([goal_index[value] for value in flat]) % 2
+
+    cols = len(board[0])
+    blank_row, blank_col = divmod(flat.index(0), cols)
+    goal_row, goal_col = divmod(goal_index[0], cols)
+    blank_parity = (abs(blank_row - goal_row) + abs(blank_col - goal_col)) % 2
+
+    return permutation_parity == blank_parity
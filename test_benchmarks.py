@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Smoke tests for the benchmark suite (tiny budgets, no full runs)."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from benchmarks import bfs_scaling
+from benchmarks.instances import INSTANCE_SETS, Instance, generate_standard_boards, load_instance_set, standard_instances
+from benchmarks.run import (
+    SKIPPED,
+    SOLVED,
+    TIMEOUT,
+    UNSUPPORTED,
+    Measurement,
+    build_report,
+    compare,
+    discover_solvers,
+    main,
+    measure,
+    run_suite,
+)
+
+
+def test_discovers_every_solver():
+    solvers = discover_solvers()
+
+    for name in ("bfs", "bidirectional_bfs", "dfs", "astar", "idastar"):
+        assert name in solvers
+
+
+def test_instance_sets_are_fixed():
+    assert load_instance_set("walks") == load_instance_set("walks")
+    standard = standard_instances()
+    assert [i.board for i in sorted(standard, key=lambda i: i.name)] == generate_standard_boards()
+    assert len(standard) == 100
+    assert [i.depth for i in standard] == sorted(i.depth for i in standard)
+
+
+def test_timeouts_skip_deeper_instances():
+    measurements = run_suite(["walks"], ["bfs"], budget_s=0.0, memory=False)
+    timeouts = [m for m in measurements if m.status == TIMEOUT]
+    assert {m.size for m in timeouts} == {"3x3", "4x4"}
+    assert all(m.status == SKIPPED for m in measurements[measurements.index(timeouts[-1]) + 1 :])
+
+
+def test_timeouts_only_skip_instances_at_least_as_deep(monkeypatch):
+    goal = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+    deep = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+    shallow = [[1, 2, 3], [4, 5, 6], [7, 0, 8]]
+    instances = [
+        Instance("deep", deep, goal, 31),
+        Instance("shallow", shallow, goal, 1),
+        Instance("deeper", deep, goal, 31),
+        Instance("unknown", deep, goal),
+    ]
+    monkeypatch.setitem(INSTANCE_SETS, "fake", lambda: instances)
+
+    measurements = run_suite(["fake"], ["bfs"], budget_s=0.0, memory=False)
+
+    assert [m.status for m in measurements] == [TIMEOUT, SOLVED, SKIPPED, TIMEOUT]
+
+
+def test_report_records_metrics(tmp_path):
+    output = tmp_path / "run.json"
+
+    assert main(["--sets", "levels", "--solvers", "greedy", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert {r["status"] for r in report["results"]} == {SOLVED}
+    for result in report["results"]:
+        assert result["nodes_explored"] > 0
+        assert result["wall_ms"] > 0
+        assert result["peak_kib"] > 0
+    assert report["summary"]["levels"]["greedy"]["solved"] == len(report["results"])
+
+    argv = ["--sets", "levels", "--solvers", "greedy", "--output", str(tmp_path / "again.json")]
+    assert main(argv + ["--baseline", str(output), "--threshold", "1000"]) == 0
+
+
+def test_compare_flags_regressions():
+    def report(**fields):
+        m = Measurement("levels", "level-3x3-hard", "3x3", "astar", SOLVED, 20, 1000, 50.0, 20000.0, 100.0)
+        for name, value in fields.items():
+            setattr(m, name, value)
+        return build_report([m], budget_s=1.0, memory=True)
+
+    baseline = report()
+    assert compare(report(wall_ms=52.0, nodes_explored=1100), baseline) == []
+
+    metrics = {r.metric for r in compare(report(moves=22, nodes_explored=2000, wall_ms=90.0, peak_kib=400.0), baseline)}
+    assert metrics == {"moves", "nodes_explored", "wall_ms", "peak_kib"}
+    assert [r.metric for r in compare(report(status=TIMEOUT), baseline)] == ["status"]
+
+
+def test_measure_separates_unsupported_boards_from_solver_errors():
+    instance = standard_instances()[0]
+    solvers = discover_solvers()
+
+    assert measure("standard", instance, "table3x3", solvers["table3x3"], memory=False).status == UNSUPPORTED
+
+    def broken(board, goal, monitor=None):
+        raise ValueError("bug")
+
+    with pytest.raises(ValueError):
+        measure("standard", instance, "broken", broken, memory=False)
+
+
+def test_traced_run_is_bounded():
+    instance = load_instance_set("walks")[0]
+    astar = discover_solvers()["astar"]
+
+    def slow_when_traced(board, goal, monitor=None):
+        while tracemalloc.is_tracing():
+            monitor.report(0)
+        return astar(board, goal, monitor=monitor)
+
+    measurement = measure("walks", instance, "slow", slow_when_traced, budget_s=0.01)
+
+    assert measurement.status == SOLVED
+    assert measurement.peak_kib is None
+
+
+def test_bfs_scaling_reports_every_run(capsys):
+    assert bfs_scaling.main(["--instance", "level-3x3-easy", "--workers", "2"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines[2:]] == ["serial", "workers=2"]
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import itertools
 import os
 import random
 import sys
@@ -7,22 +8,31 @@ from contextlib import redirect_stdout
 from io import StringIO
 from unittest.mock import patch
 
+import pytest
+
 # Add the project directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from puzzle_4x4_solver import (  # noqa: E402
     ACTION_TO_DESCRIPTION,
+    ALGORITHMS,
+    BATCH_ALGORITHMS,
     AlgoResult,
     GOAL_4x4,
     PuzzleState,
     board_list_repr,
     generate_solvable_puzzle_4x4,
+    load_boards,
     main,
+    main_batch,
+    parse_algorithms,
+    percentile,
     render_algorithm_steps,
     render_board_ascii_table,
     render_comparison_table,
     run_solver_timed,
     solve_all_algorithms,
+    solve_iddfs,
     build_algo_results,
 )
 
@@ -113,7 +123,7 @@ def test_solvers_and_steps_output():
 
     solver_results = solve_all_algorithms(initial_board, GOAL_4x4, max_depth_for_dfs=30)
 
-    for algo in ("BFS", "DFS", "A*"):
+    for algo in ("BFS", "DFS", "A*", "IDA*", "Reduction"):
         res = solver_results[algo]
         path = res["solution_path"]
 
@@ -187,6 +197,8 @@ def test_main_output_structure_is_clean():
     assert "BFS Algorithm:" in out
     assert "DFS Algorithm:" in out
     assert "A* Algorithm:" in out
+    assert "IDA* Algorithm:" in out
+    assert "Reduction Algorithm:" in out
 
     # Clean comparison table should exist
     assert "│ Algoritma" in out
@@ -201,9 +213,107 @@ def test_build_algo_results_metrics_consistent():
     solver_results = solve_all_algorithms(initial_board, GOAL_4x4, max_depth_for_dfs=20)
 
     algo_results = build_algo_results(solver_results)
-    assert [r.algorithm for r in algo_results] == ["BFS", "DFS", "A*"]
+    assert [r.algorithm for r in algo_results] == ["BFS", "DFS", "A*", "IDA*", "Reduction"]
 
     for r in algo_results:
         assert r.moves == int(solver_results[r.algorithm]["moves"])
         assert r.nodes_explored == int(solver_results[r.algorithm]["nodes_explored"])
         assert r.time_ms == float(solver_results[r.algorithm]["time_ms"])
+
+
+def test_batch_mode_streams_results_and_summary(tmp_path):
+    boards_file = tmp_path / "boards.txt"
+    boards_file.write_text(
+        "# two solvable boards and one with two tiles swapped\n"
+        "1 2 3 4 5 6 7 8 9 10 11 12 13 14 0 15\n"
+        "1,2,3,4,5,6,7,8,9,10,11,12,13,0,14,15\n"
+        "2 1 3 4 5 6 7 8 9 10 11 12 13 14 15 0\n",
+        encoding="utf-8",
+    )
+    boards = load_boards(str(boards_file))
+    assert len(boards) == 3
+    assert boards[0][3] == [13, 14, 0, 15]
+
+    lines: list[str] = []
+    items = main_batch(
+        boards,
+        workers=2,
+        max_depth_for_dfs=10,
+        heuristic="manhattan",
+        algorithms=tuple(ALGORITHMS),
+        write=lines.append,
+    )
+
+    assert sorted(item.index for item in items) == [0, 1, 2]
+    by_index = {item.index: item for item in items}
+    assert [r.moves for r in by_index[0].results] == [1, 1, 1, 1, 1]
+    assert [r.moves for r in by_index[1].results] == [2, 2, 2, 2, 2]
+    assert by_index[2].error == "unsolvable"
+
+    output = "\n".join(lines)
+    assert output.count("[") >= 3
+    assert "Solved 2/3 puzzles" in output
+    assert "puzzles/sec" in output
+    assert "p90 (ms)" in output
+
+
+def test_batch_defaults_to_memory_safe_solvers_and_records_failures():
+    boards = [
+        [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 0, 15]],
+        [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 0, 14, 15]],
+    ]
+    lines: list[str] = []
+    items = main_batch(boards, workers=1, max_depth_for_dfs=10, heuristic="manhattan", write=lines.append)
+    assert [[r.algorithm for r in item.results] for item in items] == [list(BATCH_ALGORITHMS)] * 2
+    assert "BFS" not in BATCH_ALGORITHMS and "A*" not in BATCH_ALGORITHMS
+
+    def out_of_memory(*args):
+        raise MemoryError("visited set too large")
+
+    with patch.dict(ALGORITHMS, {"IDA*": out_of_memory}):
+        items = main_batch(boards, workers=1, max_depth_for_dfs=10, heuristic="manhattan", write=lines.append)
+    assert [item.error for item in items] == ["MemoryError: visited set too large"] * 2
+    assert "Solved 0/2 puzzles" in lines[-1]
+
+
+def test_parse_algorithms_accepts_names_and_aliases():
+    assert parse_algorithms("astar,IDA*, reduction") == ("A*", "IDA*", "Reduction")
+    assert parse_algorithms("bfs,BFS") == ("BFS",)
+    with pytest.raises(ValueError):
+        parse_algorithms("dijkstra")
+
+
+def test_percentile_interpolates():
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([5.0], 99) == 5.0
+    assert percentile([], 50) == 0.0
+
+
+def test_iddfs_transposition_table_keeps_shortest_path():
+    rng = random.Random(15)
+    initial_board = generate_solvable_puzzle_4x4(shuffle_moves=14, rng=rng)
+
+    tiny = solve_iddfs(initial_board, GOAL_4x4, 30, tt_bytes=64)
+    default = solve_iddfs(initial_board, GOAL_4x4, 30)
+
+    assert tiny is not None and default is not None
+    assert tiny["moves"] == default["moves"]
+    assert default["nodes_explored"] <= tiny["nodes_explored"]
+
+
+def test_iddfs_with_a_tiny_table_is_optimal_on_every_small_board():
+    from game.puzzle_solver import solve_bfs
+    from utils.solvability import is_solvable
+
+    for rows, cols in ((2, 3), (3, 2)):
+        goal = [[r * cols + c + 1 for c in range(cols)] for r in range(rows)]
+        goal[-1][-1] = 0
+        for values in itertools.permutations(range(6)):
+            board = [list(values[r * cols : (r + 1) * cols]) for r in range(rows)]
+            if not is_solvable(board, goal):
+                continue
+            optimal = solve_bfs(board, goal)["moves"]
+            assert solve_iddfs(board, goal, 25, tt_bytes=64)["moves"] == optimal, board
+
+    # IDA* returned 19 moves here when bounds were reused from another parent.
+    assert solve_iddfs([[3, 2], [4, 1], [0, 5]], [[1, 2], [3, 4], [5, 0]], 25, tt_bytes=256)["moves"] == 15
@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "sliding_puzzle"))
 import pygame
 
 from game.puzzle_game import PuzzleGame
+from ui.render_cache import RENDER_CACHE
 from ui.screens import GameScreen, MenuScreen, MetricsScreen
 from utils.constants import LEVELS, WINDOW_HEIGHT, WINDOW_WIDTH
 
@@ -51,5 +52,203 @@ def test_ui_initialization() -> None:
     pygame.quit()
 
 
+def test_game_screen_shows_solver_progress_and_cancel_button() -> None:
+    """While a solver runs, its button turns into Cancel and the status shows progress."""
+
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    level_data = LEVELS[4]["hard"]
+    game = PuzzleGame(level_data["board"], level_data["goal"])
+    game_screen = GameScreen(WINDOW_WIDTH, WINDOW_HEIGHT, level_data["grid_size"], game.metrics_results)
+
+    game_screen.set_solving(True, "A*", "solve_astar")
+    game_screen.update_solving_progress(123456, 2.5)
+    game_screen.render(screen, game)
+
+    assert game_screen.button_solve_astar.text == "Cancel"
+    assert game_screen.button_solve_bfs.is_disabled
+    assert game_screen.handle_click(game_screen.button_solve_astar.rect.center, game) == ("cancel_solve", None)
+
+    game_screen.set_solving(False)
+    game_screen.render(screen, game)
+    assert game_screen.button_solve_astar.text == "Solve with A*"
+
+    # An anytime solver also shows the best solution it has found so far.
+    game_screen.set_solving(True, "ARA*", "solve_anytime")
+    game_screen.update_solving_progress(4096, 0.4, 52)
+    game_screen.render(screen, game)
+    assert game_screen.button_solve_anytime.text == "Cancel"
+    assert game_screen.solving_best_moves == 52
+
+    pygame.quit()
+
+
+def test_render_cache_reuses_surfaces_and_resets_on_quit() -> None:
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    level_data = LEVELS[3]["easy"]
+    game = PuzzleGame(level_data["board"], level_data["goal"])
+    game_screen = GameScreen(WINDOW_WIDTH, WINDOW_HEIGHT, level_data["grid_size"], game.metrics_results)
+    game_screen.render(screen, game)
+
+    font = RENDER_CACHE.font(18)
+    assert RENDER_CACHE.font(18) is font
+    assert RENDER_CACHE.text(font, "Undo", (0, 0, 0)) is RENDER_CACHE.text(font, "Undo", (0, 0, 0))
+    assert RENDER_CACHE.tile(5, 100, (1, 2, 3), (4, 5, 6), 40) is RENDER_CACHE.tile(5, 100, (1, 2, 3), (4, 5, 6), 40)
+
+    pygame.quit()
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    assert RENDER_CACHE.font(18) is not font
+    GameScreen(WINDOW_WIDTH, WINDOW_HEIGHT, level_data["grid_size"], game.metrics_results).render(screen, game)
+
+    pygame.quit()
+
+
+def test_screens_only_redraw_changed_regions() -> None:
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    level_data = LEVELS[3]["medium"]
+    game = PuzzleGame(level_data["board"], level_data["goal"])
+    game_screen = GameScreen(WINDOW_WIDTH, WINDOW_HEIGHT, level_data["grid_size"], game.metrics_results)
+
+    assert game_screen.render(screen, game) == [screen.get_rect()]
+    assert game_screen.render(screen, game) == []
+
+    for direction in ("UP", "DOWN", "LEFT", "RIGHT"):
+        if game.move_blank_direction(direction):
+            break
+    dirty = game_screen.render(screen, game)
+    assert len([rect for rect in dirty if rect.size == (game_screen.board.tile_size,) * 2]) == 2
+
+    game_screen.update_hover(game_screen.button_shuffle.rect.center)
+    assert game_screen.render(screen, game) == [game_screen.button_shuffle.rect]
+
+    game_screen.invalidate()
+    assert game_screen.render(screen, game) == [screen.get_rect()]
+
+    menu_screen = MenuScreen(WINDOW_WIDTH, WINDOW_HEIGHT)
+    assert menu_screen.render(screen) == [screen.get_rect()]
+    assert menu_screen.render(screen) == []
+
+    metrics_screen = MetricsScreen(WINDOW_WIDTH, WINDOW_HEIGHT, game.metrics_results)
+    assert metrics_screen.render(screen) == [screen.get_rect()]
+    assert metrics_screen.render(screen) == []
+    game.metrics_results.append({"algorithm": "A*", "moves": 4, "time_ms": 1.0, "nodes_explored": 9})
+    assert metrics_screen.render(screen) == [screen.get_rect()]
+
+    # A shuffle clears the rows; a new row of the same count must still redraw.
+    game.shuffle()
+    game_screen.add_comparison_result("BFS", {"moves": 7, "time_ms": 3.0, "nodes_explored": 40})
+    assert len(game.metrics_results) == 1
+    assert metrics_screen.render(screen) == [screen.get_rect()]
+    assert metrics_screen.render(screen) == []
+
+    pygame.quit()
+
+
+def test_playback_runs_from_the_frame_loop() -> None:
+    from game.puzzle_solver import solve_astar
+    from main import Playback
+
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    level_data = LEVELS[3]["easy"]
+    game = PuzzleGame(level_data["board"], level_data["goal"])
+    game_screen = GameScreen(WINDOW_WIDTH, WINDOW_HEIGHT, level_data["grid_size"], game.metrics_results)
+    start = [row[:] for row in game.current_board]
+
+    playback = Playback(game, game_screen, solve_astar(game.current_board, game.goal_board)["solution_path"])
+    assert game.is_animating
+    assert game_screen.render(screen, game) == [screen.get_rect()]
+
+    assert playback.handle_key(pygame.K_p)
+    assert playback.update(16)
+    assert game_screen.render(screen, game) != [screen.get_rect()]
+
+    playback.handle_key(pygame.K_END)
+    frames = 0
+    while playback.update(16):
+        game_screen.render(screen, game)
+        frames += 1
+    assert frames < 100
+    assert game.current_board == start
+    assert not game.is_animating
+    assert game_screen.animation is None
+
+    pygame.quit()
+
+
+def test_failed_solver_is_shown_instead_of_raised() -> None:
+    from game.solver_worker import SolverWorker
+    from main import finish_solver
+
+    def broken_solver(board, goal, monitor=None):
+        raise RuntimeError("table missing")
+
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    level_data = LEVELS[3]["easy"]
+    game = PuzzleGame(level_data["board"], level_data["goal"])
+    game_screen = GameScreen(WINDOW_WIDTH, WINDOW_HEIGHT, level_data["grid_size"], game.metrics_results)
+
+    worker = SolverWorker(broken_solver, game.current_board, game.goal_board, "3x3 Table").start()
+    game_screen.set_solving(True, "3x3 Table", "solve_table3x3")
+    worker.join(timeout=30)
+
+    assert finish_solver(game, game_screen, worker) is None
+    assert not game_screen.is_solving
+    assert game_screen.solver_error == "3x3 Table failed: RuntimeError: table missing"
+    assert game_screen.render(screen, game) == [screen.get_rect()]
+    assert game.metrics_results == []
+
+    # The message stays until the next solve starts.
+    game_screen.set_solving(True, "A*", "solve_astar")
+    assert game_screen.solver_error is None
+
+    pygame.quit()
+
+
 if __name__ == "__main__":
     test_ui_initialization()
+
+
+def test_large_and_rectangular_boards_fit_the_window() -> None:
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    for grid_size in ((3, 5), 8):
+        level_data = LEVELS[grid_size]["hard"]
+        game = PuzzleGame(level_data["board"], level_data["goal"])
+        game_screen = GameScreen(WINDOW_WIDTH, WINDOW_HEIGHT, level_data["grid_size"], game.metrics_results)
+        game_screen.render(screen, game)
+
+        board = game_screen.board
+        assert screen.get_rect().contains(board.rect)
+        assert not board.rect.colliderect(game_screen.button_back.rect)
+        assert board.get_tile_at_pos(*board.tile_rect(board.rows - 1, board.cols - 1).center) == (
+            board.rows - 1,
+            board.cols - 1,
+        )
+        assert not game_screen.button_solve_greedy.is_disabled
+        assert not game_screen.button_solve_reduction.is_disabled
+        assert screen.get_rect().contains(game_screen.button_back.rect)
+
+    # 8x8 only offers the greedy and reduction solvers.
+    assert game_screen.button_solve_astar.is_disabled
+    assert not game_screen.solver_enabled("solve_bfs")
+    assert not game_screen.solver_enabled("solve_table3x3")
+
+    menu_screen = MenuScreen(WINDOW_WIDTH, WINDOW_HEIGHT)
+    menu_screen.render(screen)
+    assert menu_screen.handle_click(menu_screen.grid_buttons[(3, 5)].rect.center) is None
+    level = menu_screen.handle_click(menu_screen.difficulty_buttons["easy"].rect.center)
+    assert level["grid_size"] == (3, 5)
+
+    pygame.quit()